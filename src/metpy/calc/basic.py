@@ -9,11 +9,13 @@ These include:
 * heat index
 * windchill
 """
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 from itertools import product
 
 import numpy as np
 from scipy.ndimage import gaussian_filter, zoom as scipy_zoom
+from scipy.signal import convolve, fftconvolve
 import xarray as xr
 
 from .. import constants as mpconsts
@@ -29,6 +31,9 @@ t0 = units.Quantity(288., 'kelvin')
 p0 = units.Quantity(1013.25, 'hPa')
 gamma = units.Quantity(6.5, 'K/km')
 
+# Smoothing windows with more (non-separable) weights than this are applied using FFTs
+_FFT_WINDOW_SIZE = 64
+
 
 @exporter.export
 @preprocess_and_wrap(wrap_like='u')
@@ -759,7 +764,7 @@ def sigma_to_pressure(sigma, pressure_sfc, pressure_top):
 
 @exporter.export
 @preprocess_and_wrap(wrap_like='scalar_grid', match_unit=True, to_magnitude=True)
-def smooth_gaussian(scalar_grid, n):
+def smooth_gaussian(scalar_grid, n, *, tile_size=None, workers=None):
     """Filter with normal distribution of weights.
 
     Parameters
@@ -771,6 +776,14 @@ def smooth_gaussian(scalar_grid, n):
     n : int
         Degree of filtering
 
+    tile_size : int or Sequence[int], optional
+        Smooth the grid in tiles of (at most) this size along its last two dimensions,
+        processed concurrently. Defaults to None, which smooths the whole grid at once.
+
+    workers : int, optional
+        The maximum number of threads used for smoothing tiles. Defaults to the default of
+        `concurrent.futures.ThreadPoolExecutor`.
+
     Returns
     -------
     `pint.Quantity`
@@ -833,6 +846,12 @@ def smooth_gaussian(scalar_grid, n):
     then the 4 delta x wave length is passed with approximate response
     1/e.
 
+    Given ``tile_size``, the grid is split into tiles, each padded with enough neighboring
+    points that smoothing it gives the same values as smoothing the whole grid, which are
+    smoothed concurrently on a pool of threads. This limits the size of temporary arrays and
+    uses multiple cores. Dask arrays are always smoothed lazily in this way using
+    `dask.array.map_overlap`, with their chunks as the tiles.
+
     """
     # Compute standard deviation in a manner consistent with GEMPAK
     n = int(round(n))
@@ -848,16 +867,23 @@ def smooth_gaussian(scalar_grid, n):
     scalar_grid = getattr(scalar_grid, 'magnitude', scalar_grid)
 
     filter_args = {'sigma': sgma_seq, 'truncate': 2 * np.sqrt(2)}
+
+    def _smooth(data):
+        return gaussian_filter(data, **filter_args)
+
+    # Points this far away affect the result (following scipy.ndimage)
+    halo = [int(filter_args['truncate'] * sigma + 0.5) for sigma in sgma_seq]
     if hasattr(scalar_grid, 'mask'):
-        smoothed = gaussian_filter(scalar_grid.data, **filter_args)
+        smoothed = _smooth_tiles(_smooth, scalar_grid.data, halo, tile_size, workers)
         return np.ma.array(smoothed, mask=scalar_grid.mask)
     else:
-        return gaussian_filter(scalar_grid, **filter_args)
+        return _smooth_tiles(_smooth, scalar_grid, halo, tile_size, workers)
 
 
 @exporter.export
 @preprocess_and_wrap(wrap_like='scalar_grid', match_unit=True, to_magnitude=True)
-def smooth_window(scalar_grid, window, passes=1, normalize_weights=True):
+def smooth_window(scalar_grid, window, passes=1, normalize_weights=True, *, tile_size=None,
+                  workers=None):
     """Filter with an arbitrary window smoother.
 
     Parameters
@@ -878,6 +904,14 @@ def smooth_window(scalar_grid, window, passes=1, normalize_weights=True):
         the normalized smoothing weights. If false, use supplied values directly as the
         weights.
 
+    tile_size : int or Sequence[int], optional
+        Smooth the grid in tiles of (at most) this size along its last two dimensions,
+        processed concurrently. Defaults to None, which smooths the whole grid at once.
+
+    workers : int, optional
+        The maximum number of threads used for smoothing tiles. Defaults to the default of
+        `concurrent.futures.ThreadPoolExecutor`.
+
     Returns
     -------
     array-like
@@ -897,23 +931,19 @@ def smooth_window(scalar_grid, window, passes=1, normalize_weights=True):
     Applying the smoothing function multiple times will propagate NaNs further throughout the
     domain.
 
-    """
-    def _pad(n):
-        # Return number of entries to pad given length along dimension.
-        return (n - 1) // 2
-
-    def _zero_to_none(x):
-        # Convert zero values to None, otherwise return what is given.
-        return x if x != 0 else None
+    Windows that are the outer product of 1D windows (such as those of `smooth_rectangular`)
+    are applied along one dimension at a time, and other large windows (such as those of
+    `smooth_circular` with a large radius) using FFT convolution, with multiple passes
+    combined into one for large grids. These give the same results as applying every weight
+    directly, to within round-off.
 
-    def _offset(pad, k):
-        # Return padded slice offset by k entries
-        return slice(_zero_to_none(pad + k), _zero_to_none(-pad + k))
-
-    def _trailing_dims(indexer):
-        # Add ... to the front of an indexer, since we are working with trailing dimensions.
-        return (Ellipsis,) + tuple(indexer)
+    Given ``tile_size``, the grid is split into tiles, each padded with enough neighboring
+    points that smoothing it gives the same values as smoothing the whole grid, which are
+    smoothed concurrently on a pool of threads. This limits the size of temporary arrays and
+    uses multiple cores. Dask arrays are always smoothed lazily in this way using
+    `dask.array.map_overlap`, with their chunks as the tiles.
 
+    """
     # Verify that shape in all dimensions is odd (need to have a neighborhood around a
     # central point)
     if any((size % 2 == 0) for size in window.shape):
@@ -922,30 +952,162 @@ def smooth_window(scalar_grid, window, passes=1, normalize_weights=True):
     # Optionally normalize the supplied weighting window
     weights = window / np.sum(window) if normalize_weights else window
 
-    # Set indexes
-    # Inner index for the centered array elements that are affected by the smoothing
-    inner_full_index = _trailing_dims(_offset(_pad(n), 0) for n in weights.shape)
-    # Indexes to iterate over each weight
-    weight_indexes = tuple(product(*(range(n) for n in weights.shape)))
+    weights = np.asarray(weights, dtype=float)
 
-    # Index for full array elements, offset by the weight index
-    def offset_full_index(weight_index):
-        return _trailing_dims(_offset(_pad(n), weight_index[i] - _pad(n))
-                              for i, n in enumerate(weights.shape))
+    def _smooth(data):
+        return _apply_window(np.array(data), weights, passes)
 
-    # TODO: this is not lazy-loading/dask compatible, as it "densifies" the data
-    data = np.array(scalar_grid)
-    for _ in range(passes):
-        # Set values corresponding to smoothing weights by summing over each weight and
-        # applying offsets in needed dimensions
-        data[inner_full_index] = sum(weights[index] * data[offset_full_index(index)]
-                                     for index in weight_indexes)
+    # Each pass reaches further from the original points
+    halo = [passes * (n - 1) // 2 for n in weights.shape]
+    return _smooth_tiles(_smooth, scalar_grid, halo, tile_size, workers)
 
+
+def _smooth_tiles(func, data, halo, tile_size=None, workers=None):
+    """Smooth data in tiles, each padded with the points needed to smooth it exactly.
+
+    ``func`` smooths an array, with each point of the result depending only on the points
+    within ``halo`` of it along the trailing dimensions. Tiles span the last two dimensions and
+    are smoothed concurrently on a pool of threads, or using `dask.array.map_overlap` for Dask
+    arrays. Without ``tile_size``, NumPy arrays are smoothed whole.
+    """
+    depth = dict(zip(range(data.ndim - len(halo), data.ndim), halo))
+
+    # Duck-type Dask arrays to avoid importing Dask
+    if hasattr(data, 'map_overlap'):
+        return data.map_overlap(func, depth=depth, boundary='none', dtype=data.dtype)
+    elif tile_size is None:
+        return func(data)
+
+    data = np.asarray(data)
+    axes = range(max(data.ndim - 2, 0), data.ndim)
+    tile_size = np.broadcast_to(tile_size, (len(axes),))
+    smoothed = np.empty_like(data)
+
+    def _smooth_tile(starts):
+        source, target, keep = ([slice(None)] * data.ndim for _ in range(3))
+        for axis, start, size in zip(axes, starts, tile_size):
+            stop = min(start + size, data.shape[axis])
+            lower = max(start - depth.get(axis, 0), 0)
+            source[axis] = slice(lower, min(stop + depth.get(axis, 0), data.shape[axis]))
+            target[axis] = slice(start, stop)
+            keep[axis] = slice(start - lower, stop - lower)
+        smoothed[tuple(target)] = func(data[tuple(source)])[tuple(keep)]
+
+    with ThreadPoolExecutor(workers) as executor:
+        # Consume the results to raise any errors
+        list(executor.map(_smooth_tile, product(*(range(0, data.shape[axis], size)
+                                                  for axis, size in zip(axes, tile_size)))))
+    return smoothed
+
+
+def _window_slice(n, offset=0):
+    """Return a slice of the points with a full window of n points, shifted by offset."""
+    pad = (n - 1) // 2
+    return slice(pad + offset or None, -pad + offset or None)
+
+
+def _separate_window(weights):
+    """Split a window into 1D windows along each of its dimensions, if possible.
+
+    Returns None if the window is not the outer product of 1D windows.
+    """
+    total = np.sum(weights)
+    if sum(n > 1 for n in weights.shape) < 2 or total == 0:
+        return None
+
+    factors = [np.sum(weights, axis=tuple(j for j in range(weights.ndim) if j != i))
+               for i in range(weights.ndim)]
+    factors[0] = factors[0] / total ** (weights.ndim - 1)
+    outer = factors[0]
+    for factor in factors[1:]:
+        outer = np.multiply.outer(outer, factor)
+    return factors if np.allclose(outer, weights, rtol=1e-12, atol=0) else None
+
+
+def _correlate_window(data, weights):
+    """Apply smoothing weights to all points of the data with a full window around them.
+
+    Every point is the sum of each weight times the data offset by the position of the weight
+    within the window, along the trailing dimensions. Separable windows are applied as a 1D
+    window along each dimension in turn, large windows using FFTs, and others directly. As
+    when summing directly, NaN makes missing every point whose window includes it, regardless
+    of weight.
+    """
+    factors = _separate_window(weights)
+    if factors is not None:
+        for i, factor in enumerate(factors):
+            shape = [1] * weights.ndim
+            shape[i] = factor.size
+            data = _correlate_window(data, factor.reshape(shape))
+        return data
+
+    # FFTs need the data to be at least as large as the window along the trailing dimensions
+    if (weights.size > _FFT_WINDOW_SIZE and sum(n > 1 for n in weights.shape) > 1
+            and all(n >= k for n, k in zip(data.shape[data.ndim - weights.ndim:],
+                                           weights.shape))
+            and not np.any(np.isinf(data))):
+        # Convolution flips the window relative to the sum below
+        trailing = range(data.ndim - weights.ndim, data.ndim)
+        kernel = np.flip(weights).reshape((1,) * (data.ndim - weights.ndim) + weights.shape)
+        missing = np.isnan(data)
+        smoothed = fftconvolve(np.where(missing, 0, data), kernel, mode='valid', axes=trailing)
+        if np.any(missing):
+            smoothed[_correlate_window(missing.astype(float), np.ones(weights.shape)) > 0] = (
+                np.nan)
+        return smoothed
+
+    pads = [(n - 1) // 2 for n in weights.shape]
+    return sum(weight * data[(Ellipsis,) + tuple(_window_slice(n, k - pad)
+                                                 for n, k, pad in zip(weights.shape, index,
+                                                                      pads))]
+               for index, weight in np.ndenumerate(weights))
+
+
+def _apply_window(data, weights, passes):
+    """Apply passes of a smoothing window to the points of data away from its edges in place.
+
+    Several passes of a window are the same as a single pass of the window convolved with
+    itself, except near the edges, which every pass leaves unsmoothed. For large windows, the
+    passes are combined this way, while the points within reach of the edges are found with
+    repeated passes over strips along each edge, each wide enough to be unaffected by where it
+    is cut.
+    """
+    shape = data.shape[data.ndim - weights.ndim:]
+    reach = [passes * (n - 1) // 2 for n in weights.shape]
+    width = [(2 * passes + 1) * (n - 1) // 2 for n in weights.shape]
+
+    # Only worthwhile for windows applied with FFTs when the strips are a small part of the
+    # data, since every pass is still made over the strips
+    strips = sum(2 * w / n for n, w in zip(shape, width))
+    if (passes > 1 and weights.size > _FFT_WINDOW_SIZE
+            and _separate_window(weights) is None and strips < (passes - 1) / (2 * passes)):
+        original = data.copy()
+        folded = weights
+        for _ in range(passes - 1):
+            folded = convolve(folded, weights)
+        data[(Ellipsis,) + tuple(slice(r or None, -r or None) for r in reach)] = (
+            _correlate_window(original, folded))
+
+        for axis, (n, r, w) in enumerate(zip(shape, reach, width),
+                                         start=data.ndim - weights.ndim):
+            if r:
+                head = (slice(None),) * axis
+                data[head + (slice(None, r),)] = _apply_window(
+                    original[head + (slice(None, w),)].copy(), weights, passes)[
+                    head + (slice(None, r),)]
+                data[head + (slice(n - r, None),)] = _apply_window(
+                    original[head + (slice(n - w, None),)].copy(), weights, passes)[
+                    head + (slice(w - r, None),)]
+        return data
+
+    interior = (Ellipsis,) + tuple(_window_slice(n) for n in weights.shape)
+    for _ in range(passes):
+        data[interior] = _correlate_window(data, weights)
     return data
 
 
 @exporter.export
-def smooth_rectangular(scalar_grid, size, passes=1):
+def smooth_rectangular(scalar_grid, size, passes=1, *, tile_size=None, workers=None):
     """Filter with a rectangular window smoother.
 
     Parameters
@@ -959,6 +1121,14 @@ def smooth_rectangular(scalar_grid, size, passes=1):
     passes : int
         The number of times to apply the filter to the grid. Defaults to 1.
 
+    tile_size : int or Sequence[int], optional
+        Smooth the grid in tiles of (at most) this size along its last two dimensions,
+        processed concurrently. Defaults to None, which smooths the whole grid at once.
+
+    workers : int, optional
+        The maximum number of threads used for smoothing tiles. Defaults to the default of
+        `concurrent.futures.ThreadPoolExecutor`.
+
     Returns
     -------
     array-like
@@ -978,11 +1148,12 @@ def smooth_rectangular(scalar_grid, size, passes=1):
     smoothing function multiple times will propagate NaNs further throughout the domain.
 
     """
-    return smooth_window(scalar_grid, np.ones(size), passes=passes)
+    return smooth_window(scalar_grid, np.ones(size), passes=passes, tile_size=tile_size,
+                         workers=workers)
 
 
 @exporter.export
-def smooth_circular(scalar_grid, radius, passes=1):
+def smooth_circular(scalar_grid, radius, passes=1, *, tile_size=None, workers=None):
     """Filter with a circular window smoother.
 
     Parameters
@@ -998,6 +1169,14 @@ def smooth_circular(scalar_grid, radius, passes=1):
     passes : int
         The number of times to apply the filter to the grid. Defaults to 1.
 
+    tile_size : int or Sequence[int], optional
+        Smooth the grid in tiles of (at most) this size along its last two dimensions,
+        processed concurrently. Defaults to None, which smooths the whole grid at once.
+
+    workers : int, optional
+        The maximum number of threads used for smoothing tiles. Defaults to the default of
+        `concurrent.futures.ThreadPoolExecutor`.
+
     Returns
     -------
     array-like
@@ -1024,11 +1203,12 @@ def smooth_circular(scalar_grid, radius, passes=1):
     circle = distance <= radius
 
     # Apply smoother
-    return smooth_window(scalar_grid, circle, passes=passes)
+    return smooth_window(scalar_grid, circle, passes=passes, tile_size=tile_size,
+                         workers=workers)
 
 
 @exporter.export
-def smooth_n_point(scalar_grid, n=5, passes=1):
+def smooth_n_point(scalar_grid, n=5, passes=1, *, tile_size=None, workers=None):
     """Filter with an n-point smoother.
 
     Parameters
@@ -1044,6 +1224,14 @@ def smooth_n_point(scalar_grid, n=5, passes=1):
     passes : int
         The number of times to apply the filter to the grid. Defaults to 1.
 
+    tile_size : int or Sequence[int], optional
+        Smooth the grid in tiles of (at most) this size along its last two dimensions,
+        processed concurrently. Defaults to None, which smooths the whole grid at once.
+
+    workers : int, optional
+        The maximum number of threads used for smoothing tiles. Defaults to the default of
+        `concurrent.futures.ThreadPoolExecutor`.
+
     Returns
     -------
     array-like or `pint.Quantity`
@@ -1077,7 +1265,8 @@ def smooth_n_point(scalar_grid, n=5, passes=1):
         raise ValueError('The number of points to use in the smoothing '
                          'calculation must be either 5 or 9.')
 
-    return smooth_window(scalar_grid, window=weights, passes=passes, normalize_weights=False)
+    return smooth_window(scalar_grid, window=weights, passes=passes, normalize_weights=False,
+                         tile_size=tile_size, workers=workers)
 
 
 @exporter.export
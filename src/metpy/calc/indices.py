@@ -6,19 +6,37 @@ import numpy as np
 
 from .basic import wind_speed
 from .thermo import mixing_ratio, saturation_vapor_pressure
-from .tools import _remove_nans, get_layer
+from .tools import (_is_gridded, _make_ascending, _remove_nans, _to_columns, get_layer,
+                    LayerIndex)
 from .. import constants as mpconsts
 from ..package_tools import Exporter
-from ..units import check_units, concatenate, units
+from ..units import check_units, units
 from ..xarray import preprocess_and_wrap
 
 exporter = Exporter(globals())
 
 
+def _pressure_columns(vertical_dim, pressure, *args):
+    """Arrange gridded data as columns with pressure decreasing along the last dimension."""
+    pressure, *args = _to_columns(vertical_dim, pressure, *args)
+    _, *arrs = _make_ascending(-pressure.m, pressure, *args)
+    return arrs
+
+
+def _get_layer_any(pressure, *args, height=None, bottom=None, depth=None, vertical_dim=0):
+    """Get a layer from either a profile or gridded data, with the vertical dimension last."""
+    if not _is_gridded(pressure, height, *args):
+        return get_layer(pressure, *args, height=height, bottom=bottom, depth=depth)
+
+    layer = LayerIndex(pressure, height=height, bottom=bottom, depth=depth,
+                       vertical_dim=vertical_dim)
+    return layer.clip(*args)
+
+
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]', '[temperature]', bottom='[pressure]', top='[pressure]')
-def precipitable_water(pressure, dewpoint, *, bottom=None, top=None):
+def precipitable_water(pressure, dewpoint, *, bottom=None, top=None, vertical_dim=0):
     r"""Calculate precipitable water through the depth of a sounding.
 
     Formula used is:
@@ -41,6 +59,9 @@ def precipitable_water(pressure, dewpoint, *, bottom=None, top=None):
     top: `pint.Quantity`, optional
         Top of the layer, specified in pressure. Defaults to None (lowest pressure).
 
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
+
     Returns
     -------
     `pint.Quantity`
@@ -54,12 +75,20 @@ def precipitable_water(pressure, dewpoint, *, bottom=None, top=None):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
+    Given higher-dimension data (e.g. a 3D grid), precipitable water is calculated for every
+    column along ``vertical_dim`` at once, and the results have that dimension removed. In
+    this case, ``pressure`` may also be one-dimensional, ``bottom`` and ``top`` may be given
+    as arrays with one value per column and default to the highest and lowest pressure of
+    each column, and columns where the layer extends outside of the data, or that have
+    missing values within it, are NaN.
 
     .. versionchanged:: 1.0
        Signature changed from ``(dewpt, pressure, bottom=None, top=None)``
 
     """
+    if _is_gridded(pressure, dewpoint):
+        return _precipitable_water_grid(pressure, dewpoint, bottom, top, vertical_dim)
+
     # Sort pressure and dewpoint to be in decreasing pressure order (increasing height)
     sort_inds = np.argsort(pressure)[::-1]
     pressure = pressure[sort_inds]
@@ -94,10 +123,29 @@ def precipitable_water(pressure, dewpoint, *, bottom=None, top=None):
     return pw.to('millimeters')
 
 
+def _precipitable_water_grid(pressure, dewpoint, bottom, top, vertical_dim):
+    """Calculate precipitable water for every column of gridded data."""
+    pressure_dim = vertical_dim if pressure.ndim > 1 else 0
+    if bottom is None:
+        bottom = np.nanmax(pressure, axis=pressure_dim)
+    if top is None:
+        top = np.nanmin(pressure, axis=pressure_dim)
+
+    layer = LayerIndex(pressure, bottom=bottom, depth=bottom - top, vertical_dim=vertical_dim)
+    pres_layer, dewpoint_layer = layer.clip(dewpoint)
+
+    w = mixing_ratio(saturation_vapor_pressure(dewpoint_layer), pres_layer)
+
+    # Since pressure is in decreasing order, pw will be the opposite sign of that expected.
+    pw = -np.trapz(w, pres_layer, axis=-1) / (mpconsts.g * mpconsts.rho_l)
+    return pw.to('millimeters')
+
+
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]')
-def mean_pressure_weighted(pressure, *args, height=None, bottom=None, depth=None):
+def mean_pressure_weighted(pressure, *args, height=None, bottom=None, depth=None,
+                           vertical_dim=0):
     r"""Calculate pressure-weighted mean of an arbitrary variable through a layer.
 
     Layer bottom and depth specified in height or pressure.
@@ -132,6 +180,9 @@ def mean_pressure_weighted(pressure, *args, height=None, bottom=None, depth=None
     depth: `pint.Quantity`, optional
         Depth of the layer in meters or hPa. Defaults to 100 hPa.
 
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
+
     Returns
     -------
     list of `pint.Quantity`
@@ -152,14 +203,21 @@ def mean_pressure_weighted(pressure, *args, height=None, bottom=None, depth=None
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the mean is calculated for every column
+    along ``vertical_dim`` at once, and the results have that dimension removed. In this case,
+    ``pressure`` may also be one-dimensional, ``bottom`` and ``depth`` may be given as arrays
+    with one value per column, and columns where the layer extends outside of the data are
+    NaN. This will return Pint Quantities even when given xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``heights`` parameter to ``height``
 
     """
+    if _is_gridded(pressure, height, *args):
+        layer = LayerIndex(pressure, height=height, bottom=bottom, depth=depth,
+                           vertical_dim=vertical_dim)
+        return layer.mean_pressure_weighted(*args)
+
     # Split pressure profile from other variables to average
     pres_prof, *others = get_layer(pressure, *args, height=height, bottom=bottom, depth=depth)
 
@@ -174,7 +232,8 @@ def mean_pressure_weighted(pressure, *args, height=None, bottom=None, depth=None
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]')
-def weighted_continuous_average(pressure, *args, height=None, bottom=None, depth=None):
+def weighted_continuous_average(pressure, *args, height=None, bottom=None, depth=None,
+                                vertical_dim=0):
     r"""Calculate weighted-continuous mean of an arbitrary variable through a layer.
 
     Layer top and bottom specified in height or pressure.
@@ -211,6 +270,9 @@ def weighted_continuous_average(pressure, *args, height=None, bottom=None, depth
     depth: `pint.Quantity`, optional
         Depth of the layer in meters or hPa.
 
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
+
     Returns
     -------
     list of `pint.Quantity`
@@ -218,11 +280,18 @@ def weighted_continuous_average(pressure, *args, height=None, bottom=None, depth
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the mean is calculated for every column
+    along ``vertical_dim`` at once, and the results have that dimension removed. In this case,
+    ``pressure`` may also be one-dimensional, ``bottom`` and ``depth`` may be given as arrays
+    with one value per column, and columns where the layer extends outside of the data are
+    NaN. This will return Pint Quantities even when given xarray DataArray profiles.
 
     """
+    if _is_gridded(pressure, height, *args):
+        layer = LayerIndex(pressure, height=height, bottom=bottom, depth=depth,
+                           vertical_dim=vertical_dim)
+        return layer.average(*args)
+
     # Split pressure profile from other variables to average
     pres_prof, *others = get_layer(
         pressure, *args, height=height, bottom=bottom, depth=depth
@@ -235,7 +304,7 @@ def weighted_continuous_average(pressure, *args, height=None, bottom=None, depth
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]', '[speed]', '[speed]', '[length]')
-def bunkers_storm_motion(pressure, u, v, height):
+def bunkers_storm_motion(pressure, u, v, height, *, vertical_dim=0):
     r"""Calculate right-mover and left-mover supercell storm motions using the Bunkers method.
 
     This is a physically based, shear-relative, and Galilean invariant method for predicting
@@ -264,6 +333,9 @@ def bunkers_storm_motion(pressure, u, v, height):
     height : `pint.Quantity`
         Full profile of height
 
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
+
     Returns
     -------
     right_mover: (`pint.Quantity`, `pint.Quantity`)
@@ -291,43 +363,54 @@ def bunkers_storm_motion(pressure, u, v, height):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the storm motions are calculated for every
+    column along ``vertical_dim`` at once. In this case, the U- and V- components of each
+    returned motion are stacked along a new leading dimension, followed by the dimensions of
+    the input with ``vertical_dim`` removed. Columns with missing data, or that do not extend
+    to 6 km, are NaN. This will return Pint Quantities even when given xarray DataArray
+    profiles.
 
     .. versionchanged:: 1.0
        Renamed ``heights`` parameter to ``height``
 
     """
-    # remove nans from input data
-    pressure, u, v, height = _remove_nans(pressure, u, v, height)
+    if _is_gridded(pressure, u, v, height):
+        # Put the surface first in every column so that the shared layer code works directly
+        pressure, u, v, height = _pressure_columns(vertical_dim, pressure, u, v, height)
+        vertical_dim = -1
+    else:
+        # remove nans from input data
+        pressure, u, v, height = _remove_nans(pressure, u, v, height)
 
     # mean wind from sfc-6km
     wind_mean = weighted_continuous_average(pressure, u, v, height=height,
-                                            depth=units.Quantity(6000, 'meter'))
+                                            depth=units.Quantity(6000, 'meter'),
+                                            vertical_dim=vertical_dim)
 
-    wind_mean = units.Quantity.from_list(wind_mean)
+    wind_mean = np.stack(wind_mean)
 
     # mean wind from sfc-500m
     wind_500m = weighted_continuous_average(pressure, u, v, height=height,
-                                            depth=units.Quantity(500, 'meter'))
+                                            depth=units.Quantity(500, 'meter'),
+                                            vertical_dim=vertical_dim)
 
-    wind_500m = units.Quantity.from_list(wind_500m)
+    wind_500m = np.stack(wind_500m)
 
     # mean wind from 5.5-6km
     wind_5500m = weighted_continuous_average(
         pressure, u, v, height=height,
         depth=units.Quantity(500, 'meter'),
-        bottom=height[0] + units.Quantity(5500, 'meter'))
+        bottom=height[..., 0] + units.Quantity(5500, 'meter'),
+        vertical_dim=vertical_dim)
 
-    wind_5500m = units.Quantity.from_list(wind_5500m)
+    wind_5500m = np.stack(wind_5500m)
 
     # Calculate the shear vector from sfc-500m to 5.5-6km
     shear = wind_5500m - wind_500m
 
     # Take the cross product of the wind shear and k, and divide by the vector magnitude and
     # multiply by the deviation empirically calculated in Bunkers (2000) (7.5 m/s)
-    shear_cross = concatenate([shear[1], -shear[0]])
+    shear_cross = np.stack([shear[1], -shear[0]])
     shear_mag = np.hypot(*shear)
     rdev = shear_cross * (units.Quantity(7.5, 'm/s').to(u.units) / shear_mag)
 
@@ -343,7 +426,7 @@ def bunkers_storm_motion(pressure, u, v, height):
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]', '[speed]', '[speed]', u_llj='[speed]', v_llj='[speed]')
-def corfidi_storm_motion(pressure, u, v, *, u_llj=None, v_llj=None):
+def corfidi_storm_motion(pressure, u, v, *, u_llj=None, v_llj=None, vertical_dim=0):
     r"""Calculate upwind- and downwind-developing MCS storm motions using the Corfidi method.
 
     Method described by ([Corfidi2003]_):
@@ -373,6 +456,9 @@ def corfidi_storm_motion(pressure, u, v, *, u_llj=None, v_llj=None):
     v_llj : `pint.Quantity`, optional
         V-component of low-level jet
 
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
+
     Returns
     -------
     upwind_prop: (`pint.Quantity`, `pint.Quantity`)
@@ -405,15 +491,21 @@ def corfidi_storm_motion(pressure, u, v, *, u_llj=None, v_llj=None):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the storm motions are calculated for every
+    column along ``vertical_dim`` at once. In this case, the U- and V- components of each
+    returned motion are stacked along a new leading dimension, followed by the dimensions of
+    the input with ``vertical_dim`` removed, and ``u_llj`` and ``v_llj`` may be given with one
+    value per column. Columns with missing data are NaN. This will return Pint Quantities
+    even when given xarray DataArray profiles.
 
     """
     # If user specifies only one component of low-level jet, raise
     if (u_llj is None) ^ (v_llj is None):
         raise ValueError('Must specify both u_llj and v_llj or neither')
 
+    if _is_gridded(pressure, u, v):
+        return _corfidi_storm_motion_grid(pressure, u, v, u_llj, v_llj, vertical_dim)
+
     # remove nans from input
     pressure, u, v = _remove_nans(pressure, u, v)
 
@@ -458,10 +550,52 @@ def corfidi_storm_motion(pressure, u, v, *, u_llj=None, v_llj=None):
     return upwind, downwind
 
 
+def _corfidi_storm_motion_grid(pressure, u, v, u_llj, v_llj, vertical_dim):
+    """Calculate Corfidi MCS motion vectors for every column of gridded data."""
+    pressure, u, v = _pressure_columns(vertical_dim, pressure, u, v)
+    lowlevel = pressure >= units.Quantity(850, 'hectopascal')
+
+    # If LLJ specified, use that
+    if u_llj is not None and v_llj is not None:
+        # find inverse of low-level jet
+        column_shape = pressure.shape[:-1]
+        llj_inverse = np.stack([np.broadcast_to(-u_llj, column_shape),
+                                np.broadcast_to(-v_llj, column_shape)])
+    # If pressure values contain values below 850 hPa, find low-level jet
+    elif np.any(lowlevel):
+        # find the maximum wind speed below 850 hPa in each column
+        wind_magnitude = wind_speed(u, v).m
+        llj_index = np.argmax(np.where(lowlevel, wind_magnitude, -np.inf), axis=-1)[..., None]
+        llj_inverse = units.Quantity(
+            np.stack([-np.take_along_axis(u.m, llj_index, axis=-1)[..., 0],
+                      -np.take_along_axis(v.m_as(u.units), llj_index, axis=-1)[..., 0]]),
+            u.units)
+        llj_inverse = np.where(np.any(lowlevel, axis=-1), llj_inverse, np.nan)
+    # If LLJ not specified and maximum pressure value is above 850 hPa, raise
+    else:
+        raise ValueError('Must specify low-level jet or '
+                         'specify pressure values below 850 hPa')
+
+    # cloud layer mean wind
+    # don't select outside bounds of given data
+    bottom = np.minimum(pressure[..., 0], units.Quantity(850, 'hectopascal'))
+    depth = np.where(pressure[..., -1] > units.Quantity(300, 'hectopascal'),
+                     bottom - pressure[..., -1], units.Quantity(550, 'hectopascal'))
+    cloud_layer_winds = np.stack(mean_pressure_weighted(pressure, u, v, bottom=bottom,
+                                                        depth=depth, vertical_dim=-1))
+
+    # calculate corfidi vectors
+    upwind = cloud_layer_winds + llj_inverse
+
+    downwind = 2 * cloud_layer_winds + llj_inverse
+
+    return upwind, downwind
+
+
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]', '[speed]', '[speed]')
-def bulk_shear(pressure, u, v, height=None, bottom=None, depth=None):
+def bulk_shear(pressure, u, v, height=None, bottom=None, depth=None, *, vertical_dim=0):
     r"""Calculate bulk shear through a layer.
 
     Layer top and bottom specified in meters or pressure.
@@ -489,6 +623,9 @@ def bulk_shear(pressure, u, v, height=None, bottom=None, depth=None):
         heights (i.e., don't use meters AGL unless given heights
         are in meters AGL.) Defaults to the highest pressure or lowest height given.
 
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
+
     Returns
     -------
     u_shr: `pint.Quantity`
@@ -509,19 +646,21 @@ def bulk_shear(pressure, u, v, height=None, bottom=None, depth=None):
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the shear is calculated for every column
+    along ``vertical_dim`` at once, and the results have that dimension removed. In this case,
+    ``pressure`` may also be one-dimensional, ``bottom`` may be given as an array with one
+    value per column, and columns where the layer extends outside of the data are NaN. This
+    will return Pint Quantities even when given xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``heights`` parameter to ``height``
 
     """
-    _, u_layer, v_layer = get_layer(pressure, u, v, height=height,
-                                    bottom=bottom, depth=depth)
+    _, u_layer, v_layer = _get_layer_any(pressure, u, v, height=height, bottom=bottom,
+                                         depth=depth, vertical_dim=vertical_dim)
 
-    u_shr = u_layer[-1] - u_layer[0]
-    v_shr = v_layer[-1] - v_layer[0]
+    u_shr = u_layer[..., -1] - u_layer[..., 0]
+    v_shr = v_layer[..., -1] - v_layer[..., 0]
 
     return u_shr, v_shr
 
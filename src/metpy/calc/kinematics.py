@@ -3,10 +3,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Contains calculation of kinematic parameters (e.g. divergence or vorticity)."""
 import numpy as np
+from numpy.core.numeric import normalize_axis_index
 
 from . import coriolis_parameter
-from .tools import (first_derivative, geospatial_gradient, get_layer_heights,
-                    parse_grid_arguments, vector_derivative)
+from .tools import (_clip_to_layer, _make_ascending, _to_columns, first_derivative,
+                    geospatial_gradient, get_layer_heights, parse_grid_arguments,
+                    vector_derivative)
 from .. import constants as mpconsts
 from ..package_tools import Exporter
 from ..units import check_units, units
@@ -762,7 +764,8 @@ def montgomery_streamfunction(height, temperature):
 @preprocess_and_wrap()
 @check_units('[length]', '[speed]', '[speed]', '[length]',
              bottom='[length]', storm_u='[speed]', storm_v='[speed]')
-def storm_relative_helicity(height, u, v, depth, *, bottom=None, storm_u=None, storm_v=None):
+def storm_relative_helicity(height, u, v, depth, *, bottom=None, storm_u=None, storm_v=None,
+                            vertical_dim=0):
     # Partially adapted from similar SharpPy code
     r"""Calculate storm relative helicity.
 
@@ -798,6 +801,9 @@ def storm_relative_helicity(height, u, v, depth, *, bottom=None, storm_u=None, s
     storm_v : float or int
         V component of storm motion (default is 0 m/s)
 
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
+
     Returns
     -------
     `pint.Quantity`
@@ -829,9 +835,11 @@ def storm_relative_helicity(height, u, v, depth, *, bottom=None, storm_u=None, s
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the helicity is calculated for every column
+    along ``vertical_dim`` at once, and the results have that dimension removed. In this case,
+    ``bottom``, ``storm_u``, and ``storm_v`` may also be given as arrays with one value per
+    column, and columns where the layer extends outside of the data are NaN. This will return
+    Pint Quantities even when given xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``heights`` parameter to ``height`` and converted ``bottom``, ``storm_u``, and
@@ -845,6 +853,10 @@ def storm_relative_helicity(height, u, v, depth, *, bottom=None, storm_u=None, s
     if storm_v is None:
         storm_v = units.Quantity(0, 'm/s')
 
+    if np.ndim(height) > 1 or np.ndim(u) > 1:
+        return _storm_relative_helicity_grid(height, u, v, depth, bottom, storm_u, storm_v,
+                                             vertical_dim)
+
     _, u, v = get_layer_heights(height, depth, u, v, with_agl=True, bottom=bottom)
 
     storm_relative_u = u - storm_u
@@ -867,6 +879,35 @@ def storm_relative_helicity(height, u, v, depth, *, bottom=None, storm_u=None, s
             (positive_srh + negative_srh).to('meter ** 2 / second ** 2'))
 
 
+def _storm_relative_helicity_grid(height, u, v, depth, bottom, storm_u, storm_v, vertical_dim):
+    """Calculate storm relative helicity for every column of gridded data."""
+    height, u, v = _to_columns(vertical_dim, height.m_as('m'), u.m_as('m/s'), v.m_as('m/s'))
+    height, u, v = _make_ascending(height, u, v)
+
+    # Clip columns to the layer AGL; points outside of it contribute nothing to the sums
+    height = height - height[..., :1]
+    bottom = bottom.m_as('m')
+    _, u, v = _clip_to_layer(height, bottom, bottom + depth.m_as('m'), u, v)
+
+    storm_relative_u = u - np.asarray(storm_u.m_as('m/s'))[..., np.newaxis]
+    storm_relative_v = v - np.asarray(storm_v.m_as('m/s'))[..., np.newaxis]
+
+    int_layers = (storm_relative_u[..., 1:] * storm_relative_v[..., :-1]
+                  - storm_relative_u[..., :-1] * storm_relative_v[..., 1:])
+
+    # Skip any missing segments within a column, as with profiles, but keep columns missing
+    # entirely (e.g. where the layer is outside the data) as NaN
+    missing = np.all(np.isnan(int_layers), axis=-1)
+    positive_srh = np.where(missing, np.nan,
+                            np.sum(int_layers, axis=-1, where=int_layers > 0))
+    negative_srh = np.where(missing, np.nan,
+                            np.sum(int_layers, axis=-1, where=int_layers < 0))
+
+    return (units.Quantity(positive_srh, 'meter ** 2 / second ** 2'),
+            units.Quantity(negative_srh, 'meter ** 2 / second ** 2'),
+            units.Quantity(positive_srh + negative_srh, 'meter ** 2 / second ** 2'))
+
+
 @exporter.export
 @parse_grid_arguments
 @preprocess_and_wrap(wrap_like='u',
@@ -957,7 +998,8 @@ def potential_vorticity_baroclinic(
     vertical_dim=-3,
     *,
     parallel_scale=None,
-    meridional_scale=None
+    meridional_scale=None,
+    slab_size=None
 ):
     r"""Calculate the baroclinic potential vorticity.
 
@@ -1016,6 +1058,13 @@ def potential_vorticity_baroclinic(
         with latitude/longitude coordinates and MetPy CRS used as input. Also optional if
         longitude, latitude, and crs are given. If otherwise omitted, calculation will be
         carried out on a Cartesian, rather than geospatial, grid. Keyword-only argument.
+    slab_size : int, optional
+        If given, compute the result in slabs of at most this many points along the outermost
+        axis that is not a vertical or horizontal axis (e.g. time), writing each into a single
+        preallocated output array. Peak memory use beyond the inputs is then about that of
+        the output plus seven slab-sized temporary arrays, instead of about seven temporary
+        arrays the size of the full input. Has no effect for input without such an axis.
+        Keyword-only argument.
 
     Notes
     -----
@@ -1043,10 +1092,63 @@ def potential_vorticity_baroclinic(
         raise ValueError('Length of potential temperature along the vertical axis '
                          f'{vertical_dim} must be at least 3.')
 
-    avor = absolute_vorticity(u, v, dx, dy, latitude, x_dim=x_dim, y_dim=y_dim,
-                              parallel_scale=parallel_scale, meridional_scale=meridional_scale)
-    dthetadp = first_derivative(potential_temperature, x=pressure, axis=vertical_dim)
+    if slab_size is not None and (not isinstance(slab_size, (int, np.integer))
+                                  or slab_size < 1):
+        raise ValueError(f'slab_size must be a positive integer, not {slab_size!r}.')
+
+    args = (potential_temperature, pressure, u, v, dx, dy, latitude,
+            parallel_scale, meridional_scale)
+    ndim = np.ndim(potential_temperature)
+    spatial_axes = {normalize_axis_index(axis, ndim) for axis in (x_dim, y_dim, vertical_dim)}
+    slab_axis = next((axis for axis in range(ndim) if axis not in spatial_axes), None)
 
+    if slab_size is None or slab_axis is None:
+        return _potential_vorticity_baroclinic(*args, x_dim, y_dim, vertical_dim)
+
+    # Process slabs along the non-spatial axis, keeping dimensions so that the axis numbers
+    # and broadcasting behavior within each slab match those of the full arrays
+    out_units = 'K * m**2 / (s * kg)'
+    out = None
+    for start in range(0, potential_temperature.shape[slab_axis], slab_size):
+        index = [slice(None)] * ndim
+        index[slab_axis] = slice(start, start + slab_size)
+        index = tuple(index)
+
+        slab = _potential_vorticity_baroclinic(
+            *(_take_slab(arg, index, ndim) for arg in args), x_dim, y_dim, vertical_dim)
+        if out is None:
+            out = np.empty(potential_temperature.shape, dtype=slab.dtype)
+        out[index] = slab.m_as(out_units)
+        del slab
+
+    return units.Quantity(out, out_units)
+
+
+def _take_slab(arr, index, ndim):
+    """Select a slab from an argument broadcastable against an array with ``ndim`` dimensions.
+
+    Arrays are treated with standard right-aligned broadcasting; any array that has length one
+    (or is not present) along a sliced axis is passed through unchanged along that axis.
+    One-dimensional arrays (e.g. coordinate spacings) are always passed through unchanged.
+    """
+    arr_ndim = np.ndim(arr)
+    if arr is None or arr_ndim < 2:
+        return arr
+
+    arr_index = index[ndim - arr_ndim:]
+    arr_index = tuple(slice(None) if size == 1 else item
+                      for item, size in zip(arr_index, np.shape(arr)))
+    return arr[arr_index]
+
+
+def _potential_vorticity_baroclinic(potential_temperature, pressure, u, v, dx, dy, latitude,
+                                    parallel_scale, meridional_scale, x_dim, y_dim,
+                                    vertical_dim):
+    """Calculate baroclinic potential vorticity, accumulating terms in place.
+
+    Each term is folded into the result as soon as it is computed, which limits how many
+    intermediate arrays the size of the input are alive at once.
+    """
     if (
         (np.shape(potential_temperature)[y_dim] == 1)
         and (np.shape(potential_temperature)[x_dim] == 1)
@@ -1058,11 +1160,21 @@ def potential_vorticity_baroclinic(
                                                  x_dim=x_dim, y_dim=y_dim,
                                                  parallel_scale=parallel_scale,
                                                  meridional_scale=meridional_scale)
-    dudp = first_derivative(u, x=pressure, axis=vertical_dim)
-    dvdp = first_derivative(v, x=pressure, axis=vertical_dim)
 
-    return (-mpconsts.g * (dudp * dthetady - dvdp * dthetadx
-                           + avor * dthetadp)).to('K * m**2 / (s * kg)')
+    pvor = first_derivative(u, x=pressure, axis=vertical_dim) * dthetady
+    del dthetady
+    pvor -= first_derivative(v, x=pressure, axis=vertical_dim) * dthetadx
+    del dthetadx
+    pvor += (absolute_vorticity(u, v, dx, dy, latitude, x_dim=x_dim, y_dim=y_dim,
+                                parallel_scale=parallel_scale,
+                                meridional_scale=meridional_scale)
+             * first_derivative(potential_temperature, x=pressure, axis=vertical_dim))
+
+    # Only convert units in place, since in-place multiplication by a quantity would leave
+    # pint's cached dimensionality out of date
+    pvor = -mpconsts.g * pvor
+    pvor.ito('K * m**2 / (s * kg)')
+    return pvor
 
 
 @exporter.export
@@ -2,6 +2,7 @@
 # Distributed under the terms of the BSD 3-Clause License.
 # SPDX-License-Identifier: BSD-3-Clause
 """Contains a collection of thermodynamic calculations."""
+from functools import cached_property
 from inspect import Parameter, Signature, signature
 
 import numpy as np
@@ -10,13 +11,14 @@ import scipy.optimize as so
 import xarray as xr
 
 from .exceptions import InvalidSoundingError
-from .tools import (_greater_or_close, _less_or_close, _remove_nans, find_bounding_indices,
-                    find_intersections, first_derivative, get_layer)
+from .tools import (_greater_or_close, _is_gridded, _less_or_close, _remove_nans,
+                    find_bounding_indices, find_intersections, first_derivative, get_layer,
+                    LayerIndex)
 from .. import _warnings, constants as mpconsts
 from ..cbook import broadcast_indices
-from ..interpolate.one_dimension import interpolate_1d
+from ..interpolate.one_dimension import interpolate_1d, InterpolationPlan
 from ..package_tools import Exporter
-from ..units import check_units, concatenate, process_units, units
+from ..units import check_units, concatenate, is_quantity, process_units, units
 from ..xarray import add_vertical_dim_from_xarray, preprocess_and_wrap
 
 exporter = Exporter(globals())
@@ -2606,6 +2608,280 @@ def most_unstable_parcel(pressure, temperature, dewpoint, height=None, bottom=No
     return p_layer[max_idx], t_layer[max_idx], td_layer[max_idx], max_idx
 
 
+@exporter.export
+class IsentropicPlan:
+    r"""Transform data in isobaric coordinates to isentropic coordinates for repeated use.
+
+    Solving for the pressure on each isentropic level is the expensive part of
+    `isentropic_interpolation`. This does so once, keeping the pressure sorting, the indices
+    of the points bracketing each isentropic level, and the weights needed to interpolate to
+    it, after which any number of variables on the same isobaric grid can be interpolated to
+    the isentropic levels with a single gather each.
+
+    Parameters
+    ----------
+    levels : `pint.Quantity`
+        One-dimensional array of desired potential temperature surfaces
+    pressure : `pint.Quantity`
+        Array of pressure
+    temperature : `pint.Quantity`
+        Array of temperature
+    vertical_dim : int, optional
+        The axis corresponding to the vertical in the temperature array, defaults to 0.
+    max_iters : int, optional
+        Maximum number of iterations to use in calculation, defaults to 50.
+    eps : float, optional
+        The desired absolute error in the calculated value, defaults to 1e-6.
+    bottom_up_search : bool, optional
+        Controls whether to search for levels bottom-up (starting at lower indices),
+        or top-down (starting at higher indices). Defaults to True, which is bottom-up search.
+    data_bounds : tuple of `pint.Quantity`, optional
+        The maximum pressure and potential temperature of the data set, when ``pressure``
+        and ``temperature`` are only part of it (e.g. a chunk of a Dask array), so that
+        each part is masked and checked as the whole would be. Defaults to those of
+        ``pressure`` and ``temperature``.
+
+    Attributes
+    ----------
+    levels : `pint.Quantity`
+        The isentropic levels, sorted in ascending order
+    pressure : `pint.Quantity`
+        Pressure at each isentropic level
+
+    Examples
+    --------
+    >>> from metpy.calc import IsentropicPlan
+    >>> from metpy.units import units
+    >>> p = [1000, 950, 900, 850] * units.hPa
+    >>> T = [[296, 295], [292, 291], [290, 289], [288, 287]] * units.K
+    >>> rh = [[100, 90], [80, 70], [40, 30], [20, 10]] * units.percent
+    >>> plan = IsentropicPlan([296, 297] * units.K, p, T)
+    >>> plan.pressure
+    <Quantity([[1000.          935.83377844]
+     [ 936.21340913  916.09145029]], 'hectopascal')>
+    >>> plan.interpolate(rh)
+    [<Quantity([[100.          58.89690468]
+     [ 69.19706111  43.12380163]], 'percent')>]
+
+    Notes
+    -----
+    The calculation is that of `isentropic_interpolation`, which uses this, and gives the
+    same results. Variables given to `interpolate` must have the same shape as
+    ``temperature``, or be able to be broadcast to it.
+
+    See Also
+    --------
+    isentropic_interpolation
+
+    """
+
+    def __init__(self, levels, pressure, temperature, vertical_dim=0, max_iters=50, eps=1e-6,
+                 bottom_up_search=True, *, data_bounds=None):
+        """Solve for the pressure on each isentropic level."""
+        # iteration function to be used later
+        # Calculates theta from linearly interpolated temperature and solves for pressure
+        def _isen_iter(iter_log_p, isentlevs_nd, ka, a, b, pok):
+            exner = pok * np.exp(-ka * iter_log_p)
+            t = a * iter_log_p + b
+            # Newton-Raphson iteration
+            f = isentlevs_nd - t * exner
+            fp = exner * (ka * t - a)
+            return iter_log_p - (f / fp)
+
+        # Convert units
+        pressure = pressure.to('hPa')
+        temperature = temperature.to('kelvin')
+
+        # Construct slices for broadcasting with temperature (used for pressure & theta
+        # levels)
+        slices = [np.newaxis] * temperature.ndim
+        slices[vertical_dim] = slice(None)
+        slices = tuple(slices)
+
+        # For 1-D pressure, we assume it's the vertical coordinate and know how it should
+        # broadcast to the same shape as temperature. Otherwise, just assume it's ready for
+        # broadcast, or it has the same shape and is a no-op.
+        if pressure.ndim == 1:
+            pressure = pressure[slices]
+        pressure = units.Quantity(np.broadcast_to(pressure.magnitude, temperature.shape),
+                                  pressure.units)
+
+        # Sort input data
+        sort_pressure = np.argsort(pressure.m, axis=vertical_dim)
+        sort_pressure = np.swapaxes(np.swapaxes(sort_pressure, 0, vertical_dim)[::-1], 0,
+                                    vertical_dim)
+        sorter = broadcast_indices(sort_pressure, temperature.shape, vertical_dim)
+        levs = pressure[sorter]
+        tmpk = temperature[sorter]
+
+        levels = np.asarray(levels.m_as('kelvin')).reshape(-1)
+        isentlevels = levels[np.argsort(levels)]
+
+        # Make the desired isentropic levels the same shape as temperature
+        shape = list(temperature.shape)
+        shape[vertical_dim] = isentlevels.size
+        isentlevs_nd = np.broadcast_to(isentlevels[slices], shape)
+
+        # exponent to Poisson's Equation, which is imported above
+        ka = mpconsts.kappa.m_as('dimensionless')
+
+        # calculate theta for each point
+        pres_theta = potential_temperature(levs, tmpk)
+
+        # Bounds of the whole data set, of which this may be a part
+        if data_bounds is None:
+            max_pressure, max_theta = np.max(pressure.m), np.max(pres_theta.m)
+        else:
+            max_pressure, max_theta = (bound.m_as(unit)
+                                       for bound, unit in zip(data_bounds, ('hPa', 'K')))
+
+        # Raise error if input theta level is larger than pres_theta max
+        if max_theta < np.max(levels):
+            raise ValueError('Input theta level out of data bounds')
+
+        # Find log of pressure to implement assumption of linear temperature dependence on
+        # ln(p)
+        log_p = np.log(levs.m)
+
+        # Calculations for interpolation routine
+        pok = mpconsts.P0 ** ka
+
+        # index values for each point for the pressure level nearest to the desired theta
+        # level
+        above, below, good = find_bounding_indices(pres_theta.m, isentlevels, vertical_dim,
+                                                   from_below=bottom_up_search)
+
+        # calculate constants for the interpolation
+        a = (tmpk.m[above] - tmpk.m[below]) / (log_p[above] - log_p[below])
+        b = tmpk.m[above] - a * log_p[above]
+
+        # calculate first guess for interpolation
+        isentprs = 0.5 * (log_p[above] + log_p[below])
+
+        # Make sure we ignore any nans in the data for solving; checking a is enough since it
+        # combines log_p and tmpk.
+        good &= ~np.isnan(a)
+
+        # iterative interpolation using scipy.optimize.fixed_point and _isen_iter defined
+        # above
+        log_p_solved = so.fixed_point(_isen_iter, isentprs[good],
+                                      args=(isentlevs_nd[good], ka, a[good], b[good], pok.m),
+                                      xtol=eps, maxiter=max_iters)
+
+        # get back pressure from log p
+        isentprs[good] = np.exp(log_p_solved)
+
+        # Mask out points we know are bad as well as points that are beyond the max pressure
+        isentprs[~(good & _less_or_close(isentprs, max_pressure))] = np.nan
+
+        self.levels = units.Quantity(isentlevels, 'K')
+        self.pressure = units.Quantity(isentprs, 'hPa')
+        self._isentlevs_nd = isentlevs_nd
+        self._vertical_dim = vertical_dim
+
+        # Potential temperature in the original order of the data
+        self._theta = np.empty_like(pres_theta.m)
+        np.put_along_axis(self._theta, sort_pressure, pres_theta.m, axis=vertical_dim)
+
+    @property
+    def temperature(self):
+        """Temperature at each isentropic level."""
+        ka = mpconsts.kappa.m_as('dimensionless')
+        return units.Quantity(self._isentlevs_nd
+                              / ((mpconsts.P0.m / self.pressure.m) ** ka), 'K')
+
+    def interpolate(self, *args):
+        """Interpolate variables to the isentropic levels.
+
+        Parameters
+        ----------
+        args : array-like
+            Variables on the isobaric levels of the plan, each assumed to vary linearly with
+            potential temperature.
+
+        Returns
+        -------
+        list
+            Each variable interpolated to the isentropic levels, with NaN outside of the data.
+
+        """
+        return self._interpolation.interpolate(*args)
+
+    @cached_property
+    def _interpolation(self):
+        """Interpolate linearly in potential temperature to the isentropic levels."""
+        return InterpolationPlan(self.levels.m, self._theta, axis=self._vertical_dim)
+
+
+def _isentropic_interpolation_chunks(levels, pressure, temperature, *args, vertical_dim=0,
+                                     temperature_out=False, **kwargs):
+    """Interpolate Dask arrays to isentropic coordinates, with a plan for each chunk.
+
+    The chunks are merged along the vertical dimension, leaving any others (e.g. time) to be
+    interpolated independently and lazily. The maximum pressure and potential temperature of
+    all of the data are computed up front, so that levels outside of the data raise an error
+    immediately and every chunk is masked as the whole array would be.
+    """
+    import dask.array as da
+
+    pressure = pressure.to('hPa')
+    temperature = temperature.to('kelvin')
+    temperature_data = temperature.magnitude.rechunk({vertical_dim: -1})
+    shape, chunks = temperature_data.shape, temperature_data.chunks
+
+    def _as_chunks(arr):
+        return da.broadcast_to(da.asarray(arr), shape).rechunk(chunks)
+
+    # 1-D pressure is the vertical coordinate and is given whole to each chunk
+    if pressure.ndim == 1:
+        column = np.asarray(pressure.magnitude)
+        pressure_data = None
+    else:
+        pressure_data = _as_chunks(pressure.magnitude)
+    args_units = [arr.units if is_quantity(arr) else None for arr in args]
+    args_data = [_as_chunks(arr.magnitude if is_quantity(arr) else arr) for arr in args]
+
+    # Find the bounds of the whole data set once
+    if pressure_data is None:
+        slices = [np.newaxis] * len(shape)
+        slices[vertical_dim] = slice(None)
+        pressure_all = da.asarray(column[tuple(slices)])
+    else:
+        pressure_all = pressure_data
+    ka = mpconsts.kappa.m_as('dimensionless')
+    max_pressure, max_theta = da.compute(
+        da.max(pressure_all),
+        da.max(temperature_data * (mpconsts.P0.m_as('hPa') / pressure_all) ** ka))
+    data_bounds = (units.Quantity(max_pressure, 'hPa'), units.Quantity(max_theta, 'kelvin'))
+    if max_theta < np.max(levels.m_as('kelvin')):
+        raise ValueError('Input theta level out of data bounds')
+
+    def _interpolate_chunk(temperature_chunk, *chunks):
+        pressure_chunk = column if pressure_data is None else chunks[0]
+        plan = IsentropicPlan(levels, units.Quantity(pressure_chunk, 'hPa'),
+                              units.Quantity(temperature_chunk, 'kelvin'),
+                              vertical_dim=vertical_dim, data_bounds=data_bounds, **kwargs)
+        ret = [plan.pressure.m]
+        if temperature_out:
+            ret.append(plan.temperature.m)
+        ret.extend(plan.interpolate(*chunks[pressure_data is not None:]))
+        return np.stack(ret)
+
+    out_chunks = list(chunks)
+    out_chunks[vertical_dim] = (np.size(levels),)
+    count = 1 + temperature_out + len(args)
+    inputs = [temperature_data] + ([] if pressure_data is None else [pressure_data])
+    stacked = da.map_blocks(_interpolate_chunk, *inputs, *args_data, new_axis=0,
+                            chunks=((count,), *out_chunks), dtype=np.float64)
+
+    ret = [units.Quantity(stacked[0], 'hPa')]
+    if temperature_out:
+        ret.append(units.Quantity(stacked[1], 'K'))
+    for i, arr_units in enumerate(args_units, start=1 + temperature_out):
+        ret.append(stacked[i] if arr_units is None else units.Quantity(stacked[i], arr_units))
+    return ret
+
+
 @exporter.export
 @add_vertical_dim_from_xarray
 @preprocess_and_wrap()
@@ -2656,7 +2932,7 @@ def isentropic_interpolation(levels, pressure, temperature, *args, vertical_dim=
 
     See Also
     --------
-    potential_temperature, isentropic_interpolation_as_dataset
+    potential_temperature, isentropic_interpolation_as_dataset, IsentropicPlan
 
     Notes
     -----
@@ -2669,109 +2945,38 @@ def isentropic_interpolation(levels, pressure, temperature, *args, vertical_dim=
 
     Will only return Pint Quantities, even when given xarray DataArray profiles. To
     obtain a xarray Dataset instead, use `isentropic_interpolation_as_dataset` instead.
+    To interpolate more variables later to the same isentropic levels, use `IsentropicPlan`.
+
+    Dask arrays are interpolated lazily, with each chunk (e.g. each chunk of times) solved
+    separately once it is merged along the vertical dimension. Only the maximum pressure and
+    potential temperature of the data are computed immediately, so that every chunk is
+    bounded as the whole array would be.
 
     .. versionchanged:: 1.0
        Renamed ``theta_levels``, ``axis`` parameters to ``levels``, ``vertical_dim``
 
     """
-    # iteration function to be used later
-    # Calculates theta from linearly interpolated temperature and solves for pressure
-    def _isen_iter(iter_log_p, isentlevs_nd, ka, a, b, pok):
-        exner = pok * np.exp(-ka * iter_log_p)
-        t = a * iter_log_p + b
-        # Newton-Raphson iteration
-        f = isentlevs_nd - t * exner
-        fp = exner * (ka * t - a)
-        return iter_log_p - (f / fp)
-
-    # Convert units
-    pressure = pressure.to('hPa')
-    temperature = temperature.to('kelvin')
+    # Dask arrays are interpolated a chunk at a time, with a plan for each chunk
+    if hasattr(temperature.magnitude, 'map_blocks'):
+        return _isentropic_interpolation_chunks(levels, pressure, temperature, *args,
+                                                vertical_dim=vertical_dim,
+                                                temperature_out=temperature_out,
+                                                max_iters=max_iters, eps=eps,
+                                                bottom_up_search=bottom_up_search)
 
-    # Construct slices for broadcasting with temperature (used for pressure & theta levels)
-    slices = [np.newaxis] * temperature.ndim
-    slices[vertical_dim] = slice(None)
-    slices = tuple(slices)
-
-    # For 1-D pressure, we assume it's the vertical coordinate and know how it should broadcast
-    # to the same shape as temperature. Otherwise, just assume it's ready for broadcast, or
-    # it has the same shape and is a no-op.
-    if pressure.ndim == 1:
-        pressure = pressure[slices]
-    pressure = units.Quantity(np.broadcast_to(pressure.magnitude, temperature.shape),
-                              pressure.units)
-
-    # Sort input data
-    sort_pressure = np.argsort(pressure.m, axis=vertical_dim)
-    sort_pressure = np.swapaxes(np.swapaxes(sort_pressure, 0, vertical_dim)[::-1], 0,
-                                vertical_dim)
-    sorter = broadcast_indices(sort_pressure, temperature.shape, vertical_dim)
-    levs = pressure[sorter]
-    tmpk = temperature[sorter]
-
-    levels = np.asarray(levels.m_as('kelvin')).reshape(-1)
-    isentlevels = levels[np.argsort(levels)]
-
-    # Make the desired isentropic levels the same shape as temperature
-    shape = list(temperature.shape)
-    shape[vertical_dim] = isentlevels.size
-    isentlevs_nd = np.broadcast_to(isentlevels[slices], shape)
-
-    # exponent to Poisson's Equation, which is imported above
-    ka = mpconsts.kappa.m_as('dimensionless')
-
-    # calculate theta for each point
-    pres_theta = potential_temperature(levs, tmpk)
-
-    # Raise error if input theta level is larger than pres_theta max
-    if np.max(pres_theta.m) < np.max(levels):
-        raise ValueError('Input theta level out of data bounds')
-
-    # Find log of pressure to implement assumption of linear temperature dependence on
-    # ln(p)
-    log_p = np.log(levs.m)
-
-    # Calculations for interpolation routine
-    pok = mpconsts.P0 ** ka
-
-    # index values for each point for the pressure level nearest to the desired theta level
-    above, below, good = find_bounding_indices(pres_theta.m, levels, vertical_dim,
-                                               from_below=bottom_up_search)
-
-    # calculate constants for the interpolation
-    a = (tmpk.m[above] - tmpk.m[below]) / (log_p[above] - log_p[below])
-    b = tmpk.m[above] - a * log_p[above]
-
-    # calculate first guess for interpolation
-    isentprs = 0.5 * (log_p[above] + log_p[below])
-
-    # Make sure we ignore any nans in the data for solving; checking a is enough since it
-    # combines log_p and tmpk.
-    good &= ~np.isnan(a)
-
-    # iterative interpolation using scipy.optimize.fixed_point and _isen_iter defined above
-    log_p_solved = so.fixed_point(_isen_iter, isentprs[good],
-                                  args=(isentlevs_nd[good], ka, a[good], b[good], pok.m),
-                                  xtol=eps, maxiter=max_iters)
-
-    # get back pressure from log p
-    isentprs[good] = np.exp(log_p_solved)
-
-    # Mask out points we know are bad as well as points that are beyond the max pressure
-    isentprs[~(good & _less_or_close(isentprs, np.max(pressure.m)))] = np.nan
+    plan = IsentropicPlan(levels, pressure, temperature, vertical_dim=vertical_dim,
+                          max_iters=max_iters, eps=eps, bottom_up_search=bottom_up_search)
 
     # create list for storing output data
-    ret = [units.Quantity(isentprs, 'hPa')]
+    ret = [plan.pressure]
 
     # if temperature_out = true, calculate temperature and output as last item in list
     if temperature_out:
-        ret.append(units.Quantity((isentlevs_nd / ((mpconsts.P0.m / isentprs) ** ka)), 'K'))
+        ret.append(plan.temperature)
 
     # do an interpolation for each additional argument
     if args:
-        others = interpolate_1d(isentlevels, pres_theta.m, *(arr[sorter] for arr in args),
-                                axis=vertical_dim, return_list_always=True)
-        ret.extend(others)
+        ret.extend(plan.interpolate(*args))
 
     return ret
 
@@ -3362,7 +3567,8 @@ def mixed_parcel(pressure, temperature, dewpoint, parcel_start_pressure=None,
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]')
-def mixed_layer(pressure, *args, height=None, bottom=None, depth=None, interpolate=True):
+def mixed_layer(pressure, *args, height=None, bottom=None, depth=None, interpolate=True,
+                vertical_dim=0):
     r"""Mix variable(s) over a layer, yielding a mass-weighted average.
 
     This function will integrate a data variable with respect to pressure and determine the
@@ -3390,6 +3596,9 @@ def mixed_layer(pressure, *args, height=None, bottom=None, depth=None, interpola
     interpolate : bool, optional
         Interpolate the top and bottom points if they are not in the given data (default True)
 
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
+
     Returns
     -------
     `pint.Quantity`
@@ -3421,14 +3630,22 @@ def mixed_layer(pressure, *args, height=None, bottom=None, depth=None, interpola
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Since this function returns scalar values when given a profile, this will return Pint
-    Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the mixed values are calculated for every
+    column along ``vertical_dim`` at once using `LayerIndex`, and the results have that
+    dimension removed. In this case, ``pressure`` may also be one-dimensional, ``bottom`` and
+    ``depth`` may be given as arrays with one value per column, the top and bottom of the
+    layer are always interpolated, and columns where the layer extends outside of the data
+    are NaN. This will return Pint Quantities even when given xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``p``, ``heights`` parameters to ``pressure``, ``height``
 
     """
+    if _is_gridded(pressure, height, *args):
+        layer = LayerIndex(pressure, height=height, bottom=bottom, depth=depth,
+                           vertical_dim=vertical_dim)
+        return layer.average(*args)
+
     if depth is None:
         depth = units.Quantity(100, 'hPa')
     layer = get_layer(pressure, *args, height=height, bottom=bottom,
@@ -2,20 +2,23 @@
 # Distributed under the terms of the BSD 3-Clause License.
 # SPDX-License-Identifier: BSD-3-Clause
 """Contains a collection of generally useful calculation tools."""
+from collections import OrderedDict
 import contextlib
 import functools
+import hashlib
+from itertools import chain
 from inspect import Parameter, signature
-from operator import itemgetter
 
 import numpy as np
 from numpy.core.numeric import normalize_axis_index
 import numpy.ma as ma
+import pandas as pd
 from pyproj import CRS, Geod, Proj
 from scipy.spatial import cKDTree
 import xarray as xr
 
 from .. import _warnings
-from ..cbook import broadcast_indices
+from ..cbook import broadcast_indices, lru_cache_by_value
 from ..interpolate import interpolate_1d, log_interpolate_1d
 from ..package_tools import Exporter
 from ..units import check_units, concatenate, units
@@ -39,6 +42,11 @@ BASE_DEGREE_MULTIPLIER = units.Quantity(22.5, 'degree')
 DIR_DICT = {dir_str: i * BASE_DEGREE_MULTIPLIER for i, dir_str in enumerate(DIR_STRS)}
 DIR_DICT[UND] = units.Quantity(np.nan, 'degree')
 
+# Lookup tables indexed by position in DIR_STRS
+_DIR_INDEX = {dir_str: i for i, dir_str in enumerate(DIR_STRS)}
+_DIR_ABBREVIATIONS = np.array(DIR_STRS)
+_DIR_ANGLES = units.Quantity([DIR_DICT[dir_str].m for dir_str in DIR_STRS], 'degree')
+
 
 @exporter.export
 def resample_nn_1d(a, centers):
@@ -95,8 +103,8 @@ def nearest_intersection_idx(a, b):
 
 @exporter.export
 @preprocess_and_wrap()
-@units.wraps(('=A', '=B'), ('=A', '=B', '=B', None, None))
-def find_intersections(x, a, b, direction='all', log_x=False):
+@units.wraps(('=A', '=B'), ('=A', '=B', '=B', None, None, None))
+def find_intersections(x, a, b, direction='all', log_x=False, vertical_dim=0):
     """Calculate the best estimate of intersection.
 
     Calculates the best estimates of the intersection of two y-value
@@ -116,6 +124,8 @@ def find_intersections(x, a, b, direction='all', log_x=False):
     log_x : bool, optional
         Use logarithmic interpolation along the `x` axis (i.e. for finding intersections
         in pressure coordinates). Default is False.
+    vertical_dim : int, optional
+        Axis number of the dimension to search along when given gridded data. Defaults to 0.
 
     Returns
     -------
@@ -127,7 +137,17 @@ def find_intersections(x, a, b, direction='all', log_x=False):
     This function implicitly converts `xarray.DataArray` to `pint.Quantity`, with the results
     given as `pint.Quantity`.
 
+    Given higher-dimension data (e.g. a grid of profiles), the intersections are found for
+    every column along ``vertical_dim`` at once. The results are then masked arrays laid out
+    like the data, with the intersections of each column in order along ``vertical_dim``
+    (whose length becomes the largest number of intersections in any column) and masked
+    beyond the last one. In this case, ``x`` may also be one-dimensional, and intersections
+    that cannot be calculated due to missing values are ignored.
+
     """
+    if _is_gridded(x, a, b):
+        return _find_intersections_grid(x, a, b, direction, log_x, vertical_dim)
+
     # Change x to logarithmic if log_x=True
     if log_x is True:
         x = np.log(x)
@@ -187,6 +207,60 @@ def find_intersections(x, a, b, direction='all', log_x=False):
     return intersect_x[mask & duplicate_mask], intersect_y[mask & duplicate_mask]
 
 
+def _find_intersections_grid(x, a, b, direction, log_x, vertical_dim):
+    """Find the intersections in every column of gridded data as masked arrays."""
+    if direction not in ('all', 'increasing', 'decreasing'):
+        raise ValueError(f'Unknown option for direction: {direction}')
+
+    x, a, b = _to_columns(vertical_dim, *(np.ma.filled(np.ma.asarray(arr, dtype=float),
+                                                       np.nan) for arr in (x, a, b)))
+
+    # Change x to logarithmic if log_x=True
+    if log_x is True:
+        x = np.log(x)
+
+    # Calculate the intersection for every pair of consecutive points, as in the 1D case
+    difference = a - b
+    x0, x1 = x[..., :-1], x[..., 1:]
+    a0, a1 = a[..., :-1], a[..., 1:]
+    delta_y0, delta_y1 = difference[..., :-1], difference[..., 1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        intersect_x = (delta_y1 * x0 - delta_y0 * x1) / (delta_y1 - delta_y0)
+        intersect_y = ((intersect_x - x0) / (x1 - x0)) * (a1 - a0) + a0
+
+    # Return x to linear if log_x is True
+    if log_x is True:
+        intersect_x = np.exp(intersect_x)
+
+    # Only keep those where the sign of the difference changes
+    crossing = ((np.diff(np.sign(difference), axis=-1) != 0) & np.isfinite(intersect_x)
+                & np.isfinite(intersect_y))
+    sign_change = np.sign(delta_y1)
+
+    # Gather the intersections to the start of each column, then drop all but the last of
+    # any duplicates
+    order = np.argsort(~crossing, axis=-1, kind='stable')
+    crossing, intersect_x, intersect_y, sign_change = (
+        np.take_along_axis(arr, order, axis=-1)
+        for arr in (crossing, intersect_x, intersect_y, sign_change))
+    keep = crossing.copy()
+    keep[..., :-1] &= ~(crossing[..., 1:] & (intersect_x[..., 1:] == intersect_x[..., :-1]))
+
+    # Make a mask based on the direction of sign change desired
+    if direction == 'increasing':
+        keep &= sign_change > 0
+    elif direction == 'decreasing':
+        keep &= sign_change < 0
+
+    # Gather what remains, trimming to the most intersections in any column
+    order = np.argsort(~keep, axis=-1, kind='stable')
+    size = np.max(np.sum(keep, axis=-1), initial=0)
+    keep, intersect_x, intersect_y = (np.take_along_axis(arr, order, axis=-1)[..., :size]
+                                      for arr in (keep, intersect_x, intersect_y))
+    return tuple(np.moveaxis(np.ma.masked_array(arr, mask=~keep), -1, vertical_dim)
+                 for arr in (intersect_x, intersect_y))
+
+
 def _next_non_masked_element(a, idx):
     """Return the next non masked element of a masked array.
 
@@ -240,7 +314,7 @@ def _delete_masked_points(*arrs):
 
 @exporter.export
 @preprocess_and_wrap()
-def reduce_point_density(points, radius, priority=None):
+def reduce_point_density(points, radius, priority=None, *, cache=False):
     r"""Return a mask to reduce the density of points in irregularly-spaced data.
 
     This function is used to down-sample a collection of scattered points (e.g. surface
@@ -262,6 +336,10 @@ def reduce_point_density(points, radius, priority=None):
     priority : (N, M) array-like, optional
         If given, this should have the same shape as ``points``; these values will
         be used to control selection priority for points.
+    cache : bool, optional
+        If True, remember the mask for these points, radius and priority so that it is
+        returned without being recalculated when called again with the same values (e.g.
+        when plotting many variables from the same stations). Defaults to False.
 
     Returns
     -------
@@ -276,6 +354,16 @@ def reduce_point_density(points, radius, priority=None):
     ... priority=np.array([0.1, 0.9, 0.3]))
     array([False, True, False])
 
+    Notes
+    -----
+    Points are considered in order of decreasing priority (or in their original order), and
+    each is kept unless it is within ``radius`` of a point already kept. Rather than
+    considering every point in turn, points are binned into cells small enough that at most
+    one point in each can be kept. The neighbors of the first undecided point in every cell
+    are found at once, and those with no undecided neighbor before them are kept, removing
+    their neighbors, repeating until every point is decided. This keeps the same points as
+    considering them in turn, and is much faster when many points are kept.
+
     """
     # Handle input with units. Assume meters if units are not specified
     if hasattr(radius, 'units'):
@@ -288,33 +376,95 @@ def reduce_point_density(points, radius, priority=None):
     if points.ndim < 2:
         points = points.reshape(-1, 1)
 
-    # Identify good points--finite values (e.g. not NaN or inf). Set bad 0, but we're going to
-    # ignore anyway. It's easier for managing indices to keep the original points in the group.
-    good_vals = np.isfinite(points)
-    points = np.where(good_vals, points, 0)
+    if cache:
+        key = _reduce_point_density_key(points, radius, priority)
+        if key in _REDUCE_POINT_DENSITY_CACHE:
+            _REDUCE_POINT_DENSITY_CACHE.move_to_end(key)
+            return _REDUCE_POINT_DENSITY_CACHE[key].copy()
+
+    # Identify good points--finite values (e.g. not NaN or inf), which are the only ones
+    # we consider.
+    keep = np.logical_and.reduce(np.isfinite(points), axis=-1)
+    good = np.flatnonzero(keep)
+    good_points = points[good]
 
     # Make a kd-tree to speed searching of data.
-    tree = cKDTree(points)
+    tree = cKDTree(good_points, balanced_tree=False, compact_nodes=False)
+
+    # Rank points by the order they are considered in, with 0 first
+    rank = np.arange(len(points))
+    if priority is not None:
+        rank[np.argsort(priority)[::-1]] = np.arange(len(points))
+    rank = rank[good]
+    by_rank = np.argsort(rank)
+
+    # Bin points into cells small enough that at most one point in each can be kept. These
+    # are only used to choose which points to consider together, so it does not matter if
+    # the hash of the cell indices puts far apart cells together.
+    cell_size = radius / np.sqrt(points.shape[-1]) if radius > 0 else 1.
+    cells = (np.floor(good_points / cell_size).astype(np.int64)
+             @ 1_000_003 ** np.arange(points.shape[-1], dtype=np.int64))
+
+    kept = np.zeros(len(good), dtype=bool)
+    undecided = np.ones(len(good), dtype=bool)
+    num_undecided = len(good)
+    while num_undecided:
+        # Consider the first undecided point in each cell, skipping those with another one
+        # before them within the radius, which certainly can't be kept yet.
+        order = by_rank[undecided[by_rank]]
+        candidates = order[np.unique(cells[order], return_index=True)[1]]
+        pairs = cKDTree(good_points[candidates]).query_pairs(radius, output_type='ndarray')
+        ranks = rank[candidates[pairs]]
+        candidates = np.delete(candidates, np.where(ranks[:, 0] > ranks[:, 1],
+                                                    pairs[:, 0], pairs[:, 1]))
+
+        # Keep the candidates without an undecided neighbor that comes before them, and
+        # remove all of their neighbors
+        neighbors = tree.query_ball_point(good_points[candidates], radius)
+        counts = np.array([len(point_neighbors) for point_neighbors in neighbors], dtype=int)
+        owners = np.repeat(np.arange(len(candidates)), counts)
+        neighbors = np.fromiter(chain.from_iterable(neighbors), dtype=int, count=counts.sum())
+        blocked = undecided[neighbors] & (rank[neighbors] < rank[candidates[owners]])
+        new = np.ones(len(candidates), dtype=bool)
+        new[owners[blocked]] = False
+        kept[candidates[new]] = True
+        undecided[neighbors[new[owners]]] = False
+
+        # Stop once this only decides a few points at a time (e.g. for a line of points in
+        # order of priority)
+        num_decided = num_undecided - undecided.sum()
+        num_undecided -= num_decided
+        if num_decided < 0.01 * num_undecided:
+            break
+
+    # Finish any remaining points one at a time, in order
+    for ind in by_rank[undecided[by_rank]]:
+        if undecided[ind]:
+            kept[ind] = True
+            undecided[tree.query_ball_point(good_points[ind], radius)] = False
+
+    keep[good] = kept
+
+    if cache:
+        _REDUCE_POINT_DENSITY_CACHE[key] = keep.copy()
+        while len(_REDUCE_POINT_DENSITY_CACHE) > _REDUCE_POINT_DENSITY_CACHE_SIZE:
+            _REDUCE_POINT_DENSITY_CACHE.popitem(last=False)
 
-    # Need to use sorted indices rather than sorting the position
-    # so that the keep mask matches *original* order.
-    sorted_indices = range(len(points)) if priority is None else np.argsort(priority)[::-1]
+    return keep
 
-    # Keep all good points initially
-    keep = np.logical_and.reduce(good_vals, axis=-1)
 
-    # Loop over all the potential points
-    for ind in sorted_indices:
-        # Only proceed if we haven't already excluded this point
-        if keep[ind]:
-            # Find the neighbors and eliminate them
-            neighbors = tree.query_ball_point(points[ind], radius)
-            keep[neighbors] = False
+_REDUCE_POINT_DENSITY_CACHE = OrderedDict()
+_REDUCE_POINT_DENSITY_CACHE_SIZE = 16
 
-            # We just removed ourselves, so undo that
-            keep[ind] = True
 
-    return keep
+def _reduce_point_density_key(points, radius, priority):
+    """Return a key identifying the arguments to `reduce_point_density`."""
+    digest = hashlib.blake2b(np.ascontiguousarray(points, dtype=float).data)
+    if priority is not None:
+        priority = np.asarray(priority)
+        digest.update(str(priority.dtype).encode())
+        digest.update(np.ascontiguousarray(priority).data)
+    return points.shape, float(radius), priority is None, digest.hexdigest()
 
 
 def _get_bound_pressure_height(pressure, bound, height=None, interpolate=True):
@@ -429,7 +579,8 @@ def _get_bound_pressure_height(pressure, bound, height=None, interpolate=True):
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[length]')
-def get_layer_heights(height, depth, *args, bottom=None, interpolate=True, with_agl=False):
+def get_layer_heights(height, depth, *args, bottom=None, interpolate=True, with_agl=False,
+                      vertical_dim=0):
     """Return an atmospheric layer from upper air data with the requested bottom and depth.
 
     This function will subset an upper air dataset to contain only the specified layer using
@@ -451,6 +602,8 @@ def get_layer_heights(height, depth, *args, bottom=None, interpolate=True, with_
     with_agl : bool, optional
         Returns the height as above ground level by subtracting the minimum height in the
         provided height. Defaults to False.
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
 
     Returns
     -------
@@ -459,13 +612,24 @@ def get_layer_heights(height, depth, *args, bottom=None, interpolate=True, with_
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Also, this will return Pint Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the layer is found in every column along
+    ``vertical_dim`` at once, and masked arrays laid out like the data are returned, whose
+    unmasked values for each column are those returned for that profile. Where needed, the
+    outermost points outside of the layer hold the values interpolated to its bounds.
+    ``bottom`` and ``depth`` may then have one value per column, and columns where the layer
+    extends outside of the data are entirely masked. To extract the same layer many times, use
+    `LayerIndex.from_heights` directly. This will return Pint Quantities even when given
+    xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``heights`` parameter to ``height``
 
     """
+    if _is_gridded(height, *args):
+        layer = LayerIndex.from_heights(height, depth, bottom=bottom, with_agl=with_agl,
+                                        vertical_dim=vertical_dim)
+        return layer.masked(*args, interpolate=interpolate)
+
     # Make sure pressure and datavars are the same length
     for datavar in args:
         if len(height) != len(datavar):
@@ -527,7 +691,8 @@ def get_layer_heights(height, depth, *args, bottom=None, interpolate=True, with_
 @exporter.export
 @preprocess_and_wrap()
 @check_units('[pressure]')
-def get_layer(pressure, *args, height=None, bottom=None, depth=None, interpolate=True):
+def get_layer(pressure, *args, height=None, bottom=None, depth=None, interpolate=True,
+              vertical_dim=0):
     r"""Return an atmospheric layer from upper air data with the requested bottom and depth.
 
     This function will subset an upper air dataset to contain only the specified layer. The
@@ -554,6 +719,8 @@ def get_layer(pressure, *args, height=None, bottom=None, depth=None, interpolate
     interpolate : bool, optional
         Interpolate the top and bottom points if they are not in the given data. Defaults
         to True.
+    vertical_dim : int, optional
+        Axis number of vertical dimension when given gridded data. Defaults to 0.
 
     Returns
     -------
@@ -562,13 +729,25 @@ def get_layer(pressure, *args, height=None, bottom=None, depth=None, interpolate
 
     Notes
     -----
-    Only functions on 1D profiles (not higher-dimension vertical cross sections or grids).
-    Also, this will return Pint Quantities even when given xarray DataArray profiles.
+    Given higher-dimension data (e.g. a 3D grid), the layer is found in every column along
+    ``vertical_dim`` at once, and masked arrays laid out like the data are returned, whose
+    unmasked values for each column are those returned for that profile. Where needed, the
+    outermost points outside of the layer hold the values interpolated to its bounds. In this
+    case, ``pressure`` may also be one-dimensional, ``bottom`` and ``depth`` may have one value
+    per column, and columns where the layer extends outside of the data are entirely masked.
+    Without interpolation, only the levels within the layer are unmasked. To extract the same
+    layer many times, use `LayerIndex` directly. This will return Pint Quantities even when
+    given xarray DataArray profiles.
 
     .. versionchanged:: 1.0
        Renamed ``heights`` parameter to ``height``
 
     """
+    if _is_gridded(pressure, height, *args):
+        layer = LayerIndex(pressure, height=height, bottom=bottom, depth=depth,
+                           vertical_dim=vertical_dim)
+        return layer.masked(*args, interpolate=interpolate)
+
     # If we get the depth kwarg, but it's None, set it to the default as well
     if depth is None:
         depth = units.Quantity(100, 'hPa')
@@ -635,6 +814,484 @@ def get_layer(pressure, *args, height=None, bottom=None, depth=None, interpolate
     return ret
 
 
+def _is_gridded(*args):
+    """Determine whether any of the arguments have more than one dimension."""
+    return any(np.ndim(arg) > 1 for arg in args)
+
+
+def _to_columns(vertical_dim, *arrs):
+    """Broadcast arrays to a common shape and move the vertical dimension to the end.
+
+    One-dimensional arrays (e.g. a pressure coordinate shared by all columns) are placed along
+    ``vertical_dim`` of the highest-dimensional array before broadcasting. `None` is passed
+    through unchanged.
+    """
+    ndim = max(np.ndim(arr) for arr in arrs if arr is not None)
+    arrs = [arr if arr is None or np.ndim(arr) != 1 else _broadcast_to_axis(arr, vertical_dim,
+                                                                             ndim)
+            for arr in arrs]
+    shape = np.broadcast_shapes(*(np.shape(arr) for arr in arrs if arr is not None))
+    return [arr if arr is None else np.moveaxis(np.broadcast_to(arr, shape), vertical_dim, -1)
+            for arr in arrs]
+
+
+def _make_ascending(coord, *args):
+    """Reverse the last dimension of all arrays if ``coord`` decreases along it."""
+    if np.nanmean(coord[..., -1] - coord[..., 0]) < 0:
+        return [arr if arr is None else arr[..., ::-1] for arr in (coord, *args)]
+    return [coord, *args]
+
+
+def _bracket_bound(coord, bound):
+    """Find the levels bracketing a bound in every column of an ascending coordinate.
+
+    ``coord`` has the vertical dimension last, and ``bound`` is broadcast against
+    ``coord[..., 0]``. Returns the index of the level below the bound and the linear weight of
+    the level above it, both with a trailing dimension of length one. The weight is NaN for
+    columns where the bound lies outside the range of ``coord``.
+    """
+    bound = np.asarray(bound)[..., np.newaxis]
+    index = np.sum(coord < bound, axis=-1, keepdims=True) - 1
+    index = np.clip(index, 0, coord.shape[-1] - 2)
+    lower = np.take_along_axis(coord, index, axis=-1)
+    upper = np.take_along_axis(coord, index + 1, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = np.clip((bound - lower) / (upper - lower), 0, 1)
+
+    in_range = (_greater_or_close(bound, coord[..., :1])
+                & _less_or_close(bound, coord[..., -1:]))
+    return index, np.where(in_range, weight, np.nan)
+
+
+def _interp_bracket(arr, index, weight):
+    """Linearly interpolate the last dimension of an array using `_bracket_bound` output."""
+    lower = np.take_along_axis(arr, index, axis=-1)
+    upper = np.take_along_axis(arr, index + 1, axis=-1)
+    return lower + weight * (upper - lower)
+
+
+def _get_bound_pressure_height_columns(pressure, bound, height=None):
+    """Calculate the bounding pressure and height in each column of gridded data.
+
+    This is the gridded analog of `_get_bound_pressure_height`, always interpolating.
+    ``pressure`` and ``height`` have the vertical dimension last, with pressure decreasing
+    along it, and ``bound`` (in units of pressure or height) is broadcast against
+    ``pressure[..., 0]``. Pressure is interpolated linearly in height, and height
+    logarithmically in pressure. If no heights are provided, a standard atmosphere
+    ([NOAA1976]_) is assumed. Columns where the bound lies outside of the data are NaN.
+    """
+    # avoid circular import if basic.py ever imports something from tools.py
+    from .basic import height_to_pressure_std, pressure_to_height_std
+
+    log_pressure = -np.log(pressure.m)
+    if bound.check('[length]**-1 * [mass] * [time]**-2'):
+        bound_pressure = bound.to(pressure.units)
+        index, weight = _bracket_bound(log_pressure, -np.log(bound_pressure.m))
+        if height is not None:
+            bound_height = units.Quantity(_interp_bracket(height.m, index, weight)[..., 0],
+                                          height.units)
+        else:
+            bound_pressure = np.where(np.isnan(weight[..., 0]), np.nan, bound_pressure)
+            bound_height = pressure_to_height_std(bound_pressure)
+    elif bound.check('[length]'):
+        if height is not None:
+            bound_height = bound.to(height.units)
+            index, weight = _bracket_bound(height.m, bound_height.m)
+            bound_pressure = units.Quantity(
+                _interp_bracket(pressure.m, index, weight)[..., 0], pressure.units)
+        else:
+            bound_height = bound
+            bound_pressure = height_to_pressure_std(bound).to(pressure.units)
+            _, weight = _bracket_bound(log_pressure, -np.log(bound_pressure.m))
+            bound_pressure = np.where(np.isnan(weight[..., 0]), np.nan, bound_pressure)
+    else:
+        raise ValueError('Bound must be specified in units of length or pressure.')
+
+    # Mark both bounds as missing where either could not be found
+    missing = np.isnan(bound_pressure) | np.isnan(bound_height)
+    return np.where(missing, np.nan, bound_pressure), np.where(missing, np.nan, bound_height)
+
+
+@exporter.export
+class LayerIndex:
+    r"""Locate an atmospheric layer in every column of gridded data for repeated use.
+
+    Finding the bounds of a layer and the weights needed to interpolate to them is the
+    expensive part of extracting a layer. This does so once for every column of gridded data
+    (or a single profile), after which any number of variables on the same levels can be
+    clipped to the layer or averaged and integrated through it. Layer means and integrals are
+    computed as a single weighted sum over the original levels, with the weights calculated
+    the first time each kind of reduction is requested and reused afterwards.
+
+    The bottom of the layer can be specified with a pressure or height above the surface
+    pressure, and defaults to the surface pressure of each column. The depth of the layer can
+    be specified in terms of pressure or height above the bottom of the layer. The top and
+    bottom of the layer are always interpolated (logarithmically in pressure) if they are not
+    in the data.
+
+    Parameters
+    ----------
+    pressure : `pint.Quantity`
+        Atmospheric pressure, either for every column or a single profile shared by all
+    height: `pint.Quantity`, optional
+        Atmospheric heights corresponding to the given pressures. Defaults to using
+        heights calculated from ``pressure`` assuming a standard atmosphere [NOAA1976]_.
+    bottom : `pint.Quantity`, optional
+        Bottom of the layer as a pressure or height above the surface pressure, either a
+        single value or one value per column. Defaults to the highest pressure or lowest
+        height given.
+    depth : `pint.Quantity`, optional
+        Thickness of the layer as a pressure or height above the bottom of the layer, either
+        a single value or one value per column. Defaults to 100 hPa.
+    vertical_dim : int, optional
+        Axis number of vertical dimension. Defaults to 0.
+
+    Attributes
+    ----------
+    coordinate : `pint.Quantity`
+        The pressure (or height, for layers created with `from_heights`) of every column
+        clipped to the layer, with the vertical dimension last and ordered from the bottom of
+        the layer to its top.
+
+    Examples
+    --------
+    >>> from metpy.calc import LayerIndex
+    >>> from metpy.units import units
+    >>> p = [1000, 925, 850, 700, 500] * units.hPa
+    >>> T = [25, 20, 16, 8, -8] * units.degC
+    >>> Td = [20, 16, 12, 0, -20] * units.degC
+    >>> layer = LayerIndex(p, depth=200 * units.hPa)
+    >>> layer.average(T, Td)
+    [<Quantity(18.8752531, 'degree_Celsius')>, <Quantity(14.5316296, 'degree_Celsius')>]
+
+    Notes
+    -----
+    Every column is clipped to the layer rather than subset, replacing the points outside
+    of the layer with the values interpolated to its nearest bound. This keeps the same
+    number of points in every column, and sums and integrals over the clipped points are
+    those over the layer. Columns where the layer extends outside of the data are NaN.
+
+    Variables given to the methods must be `pint.Quantity` and have the same vertical
+    dimension as ``pressure``; any other dimensions are broadcast against those of
+    ``pressure``, so a single pressure profile can be used for a whole grid.
+
+    See Also
+    --------
+    get_layer, get_layer_heights, mean_pressure_weighted, weighted_continuous_average
+
+    """
+
+    def __init__(self, pressure, height=None, bottom=None, depth=None, vertical_dim=0):
+        """Find the layer in every column of the data."""
+        # A single profile shared by all columns has only the vertical dimension
+        pressure, height = _to_columns(vertical_dim if _is_gridded(pressure, height) else 0,
+                                       pressure, height)
+        flip = np.nanmean(pressure[..., -1].m - pressure[..., 0].m) > 0
+        if flip:
+            pressure = pressure[..., ::-1]
+            height = None if height is None else height[..., ::-1]
+
+        # If we get the depth kwarg, but it's None, set it to the default as well
+        if depth is None:
+            depth = units.Quantity(100, 'hPa')
+
+        # If the bottom is not specified, make it the surface pressure
+        if bottom is None:
+            bottom = pressure[..., 0]
+
+        # Make sure every column has its own levels when the bounds vary by column
+        shape = np.broadcast_shapes(pressure.shape[:-1], np.shape(bottom), np.shape(depth))
+        pressure = np.broadcast_to(pressure, shape + pressure.shape[-1:])
+        if height is not None:
+            height = np.broadcast_to(height, pressure.shape)
+
+        bottom_pressure, bottom_height = _get_bound_pressure_height_columns(pressure, bottom,
+                                                                            height=height)
+
+        # Calculate the top in whatever units depth is in
+        if depth.check('[length]**-1 * [mass] * [time]**-2'):
+            top = bottom_pressure - depth
+        elif depth.check('[length]'):
+            top = bottom_height + depth
+        else:
+            raise ValueError('Depth must be specified in units of length or pressure')
+
+        top_pressure, _ = _get_bound_pressure_height_columns(pressure, top, height=height)
+
+        log_pressure = -np.log(pressure.m)
+        self._set_bounds(log_pressure, -np.log(bottom_pressure.m_as(pressure.units)),
+                         -np.log(top_pressure.m_as(pressure.units)), vertical_dim, flip)
+        self._levels = pressure
+        self.coordinate = units.Quantity(np.exp(-self._clip(log_pressure)), pressure.units)
+
+    @classmethod
+    def from_heights(cls, height, depth, bottom=None, with_agl=False, vertical_dim=0):
+        """Find a layer specified by height in every column of the data.
+
+        This is the analog of `get_layer_heights`, with heights interpolated linearly.
+
+        Parameters
+        ----------
+        height : `pint.Quantity`
+            Atmospheric height, either for every column or a single profile shared by all
+        depth : `pint.Quantity`
+            Thickness of the layer, either a single value or one value per column
+        bottom : `pint.Quantity`, optional
+            Bottom of the layer, either a single value or one value per column. Defaults to
+            the lowest height given.
+        with_agl : bool, optional
+            Use heights above ground level by subtracting the minimum height of each column.
+            Defaults to False.
+        vertical_dim : int, optional
+            Axis number of vertical dimension. Defaults to 0.
+
+        Returns
+        -------
+        `LayerIndex`
+            The layer in every column
+
+        """
+        height, = _to_columns(vertical_dim if _is_gridded(height) else 0, height)
+        flip = np.nanmean(height[..., -1].m - height[..., 0].m) < 0
+        if flip:
+            height = height[..., ::-1]
+
+        # If we want things in AGL, subtract the minimum height from all height values
+        if with_agl:
+            height = height - units.Quantity(np.nanmin(height.m, axis=-1, keepdims=True),
+                                             height.units)
+
+        # If the bottom is not specified, make it the surface
+        if bottom is None:
+            bottom = height[..., 0]
+
+        shape = np.broadcast_shapes(height.shape[:-1], np.shape(bottom), np.shape(depth))
+        height = np.broadcast_to(height, shape + height.shape[-1:])
+
+        layer = cls.__new__(cls)
+        layer._set_bounds(height.m, bottom.m_as(height.units),
+                          (bottom + depth).m_as(height.units), vertical_dim, flip)
+        layer._levels = height
+        layer.coordinate = units.Quantity(layer._clip(height.m), height.units)
+        return layer
+
+    def _set_bounds(self, coord, bottom, top, vertical_dim, flip):
+        """Find the layer bounds within the columns of an ascending coordinate."""
+        self._vertical_dim = vertical_dim
+        self._flip = flip
+        self._bottom_index, self._bottom_weight = _bracket_bound(coord, bottom)
+        self._top_index, self._top_weight = _bracket_bound(coord, top)
+        self._valid = ~(np.isnan(self._bottom_weight) | np.isnan(self._top_weight))
+
+        bottom = np.asarray(bottom)[..., np.newaxis]
+        top = np.asarray(top)[..., np.newaxis]
+        self._below = coord < bottom
+        self._above = coord > top
+
+        # Points kept when subsetting: those within the layer, along with the outermost
+        # points outside of it, which hold the interpolated bounds, unless the bounds are
+        # already in the data
+        inside = _greater_or_close(coord, bottom) & _less_or_close(coord, top)
+        levels = np.arange(coord.shape[-1])
+        bottom_point = ((levels == np.sum(self._below, axis=-1, keepdims=True) - 1)
+                        & ~np.any(np.isclose(coord, bottom), axis=-1, keepdims=True))
+        top_point = ((levels == coord.shape[-1] - np.sum(self._above, axis=-1, keepdims=True))
+                     & ~np.any(np.isclose(coord, top), axis=-1, keepdims=True))
+        self._inside = inside & self._valid
+        self._keep = (inside | bottom_point | top_point) & self._valid
+        self._weights = {}
+
+    def _columns(self, arr):
+        """Arrange an array as columns matching the layer."""
+        arr = np.asarray(arr)
+        if arr.ndim > 1:
+            arr = np.moveaxis(arr, self._vertical_dim, -1)
+        if self._flip:
+            arr = arr[..., ::-1]
+        return np.broadcast_to(arr, np.broadcast_shapes(arr.shape, self._below.shape))
+
+    def _clip(self, arr):
+        """Clip columns of data to the layer."""
+        index_shape = arr.shape[:-1] + (1,)
+        bottom = _interp_bracket(arr, np.broadcast_to(self._bottom_index, index_shape),
+                                 self._bottom_weight)
+        top = _interp_bracket(arr, np.broadcast_to(self._top_index, index_shape),
+                              self._top_weight)
+        clipped = np.where(self._below, bottom, arr)
+        clipped = np.where(self._above, top, clipped)
+        return np.where(self._valid, clipped, np.nan)
+
+    def _to_masked(self, columns, keep):
+        """Convert columns to a masked array laid out like the original data."""
+        data = np.ma.masked_array(columns.m, mask=~np.broadcast_to(keep, columns.shape))
+        if self._flip:
+            data = data[..., ::-1]
+        if data.ndim > 1:
+            data = np.moveaxis(data, -1, self._vertical_dim)
+        return units.Quantity(data, columns.units)
+
+    def _scatter(self, weights):
+        """Convert weights for the clipped points to weights for the original levels."""
+        ret = np.where(self._below | self._above, 0, weights)
+        for outside, index, weight in ((self._below, self._bottom_index, self._bottom_weight),
+                                       (self._above, self._top_index, self._top_weight)):
+            total = np.sum(weights, axis=-1, keepdims=True, where=outside)
+            for level, part in ((index, 1 - weight), (index + 1, weight)):
+                np.put_along_axis(ret, level,
+                                  np.take_along_axis(ret, level, axis=-1) + total * part,
+                                  axis=-1)
+        return np.where(self._valid, ret, np.nan)
+
+    def _reduce(self, kind, args, scale=None):
+        """Calculate a weighted sum of each variable over the original levels."""
+        if kind not in self._weights:
+            coord = self.coordinate.m
+            half_widths = np.diff(coord, axis=-1) / 2
+            weights = np.zeros_like(coord)
+            weights[..., 1:] += half_widths
+            weights[..., :-1] += half_widths
+            if kind == 'pressure':
+                weights *= coord
+            if kind != 'integral':
+                weights /= np.sum(weights, axis=-1, keepdims=True)
+            self._weights[kind] = self._scatter(weights)
+        weights = self._weights[kind]
+
+        # Levels outside of the layer have no weight, so do not let missing values there
+        # make the result missing
+        ret = []
+        for arr in args:
+            total = np.sum(np.where(weights != 0, weights * self._columns(arr.m), 0), axis=-1)
+            ret.append(units.Quantity(total, arr.units if scale is None
+                                      else arr.units * scale))
+        return ret
+
+    def clip(self, *args):
+        """Clip variables to the layer.
+
+        Points outside of the layer are replaced with values interpolated to its nearest
+        bound, so that every column keeps the same number of points.
+
+        Parameters
+        ----------
+        args : `pint.Quantity`
+            Atmospheric variable(s) on the levels used to find the layer
+
+        Returns
+        -------
+        list of `pint.Quantity`
+            The layer coordinate followed by each of the clipped variables, with the vertical
+            dimension last and ordered from the bottom of the layer to its top
+
+        """
+        return [self.coordinate, *(units.Quantity(self._clip(self._columns(arr.m)), arr.units)
+                                   for arr in args)]
+
+    def masked(self, *args, interpolate=True):
+        """Subset variables to the layer using masked arrays.
+
+        This returns the same values for every column as `get_layer` would for that profile.
+        Where needed, the outermost points outside of the layer are replaced with values at
+        the bounds of the layer and left unmasked.
+
+        Parameters
+        ----------
+        args : `pint.Quantity`
+            Atmospheric variable(s) on the levels used to find the layer
+        interpolate : bool, optional
+            Include the values interpolated to the top and bottom of the layer. Otherwise,
+            only the levels within the layer are left unmasked. Defaults to True.
+
+        Returns
+        -------
+        list of `pint.Quantity`
+            The layer coordinate followed by each of the variables as masked arrays, laid
+            out like the original data
+
+        """
+        if interpolate:
+            return [self._to_masked(arr, self._keep) for arr in self.clip(*args)]
+        return [self._to_masked(arr, self._inside)
+                for arr in (self._levels, *(units.Quantity(self._columns(arr.m), arr.units)
+                                            for arr in args))]
+
+    def integrate(self, *args):
+        r"""Integrate variables through the layer with respect to its coordinate.
+
+        The integral is taken from the bottom of the layer to its top, so is negative for
+        positive variables in a layer defined by pressure.
+
+        Parameters
+        ----------
+        args : `pint.Quantity`
+            Atmospheric variable(s) on the levels used to find the layer
+
+        Returns
+        -------
+        list of `pint.Quantity`
+            The integral of each variable for every column
+
+        """
+        return self._reduce('integral', args, self.coordinate.units)
+
+    def average(self, *args):
+        r"""Calculate the weighted-continuous average of variables through the layer.
+
+        This is the same as `weighted_continuous_average` (and `mixed_layer`) for a layer
+        defined by pressure.
+
+        Parameters
+        ----------
+        args : `pint.Quantity`
+            Atmospheric variable(s) on the levels used to find the layer
+
+        Returns
+        -------
+        list of `pint.Quantity`
+            The average of each variable for every column
+
+        """
+        return self._reduce('average', args)
+
+    def mean_pressure_weighted(self, *args):
+        r"""Calculate the pressure-weighted mean of variables through the layer.
+
+        This is the same as `mean_pressure_weighted`, and requires a layer defined by
+        pressure.
+
+        Parameters
+        ----------
+        args : `pint.Quantity`
+            Atmospheric variable(s) on the levels used to find the layer
+
+        Returns
+        -------
+        list of `pint.Quantity`
+            The pressure-weighted mean of each variable for every column
+
+        """
+        if not self.coordinate.check('[pressure]'):
+            raise ValueError('Pressure-weighted means require a layer found using pressure.')
+        return self._reduce('pressure', args)
+
+
+def _clip_to_layer(coord, bottom, top, *args):
+    """Clip columns of data to a layer, replacing points outside it with values at its bounds.
+
+    ``coord`` must be ascending along the last dimension, and ``bottom`` and ``top`` are
+    broadcast against ``coord[..., 0]``. Points below (above) the layer are replaced with the
+    value linearly interpolated to the bottom (top) of the layer, so every column keeps the
+    same number of points and any segments outside the layer have zero width. This makes sums
+    over consecutive points and trapezoidal integrals over the clipped columns equal to those
+    over the layer itself. Columns where either bound lies outside of the data are all NaN.
+
+    Returns the clipped coordinate followed by each of the clipped ``args``.
+    """
+    layer = LayerIndex.__new__(LayerIndex)
+    layer._set_bounds(coord, bottom, top, -1, False)
+    return [layer._clip(arr) for arr in (coord, *args)]
+
+
 @exporter.export
 @preprocess_and_wrap()
 def find_bounding_indices(arr, values, axis, from_below=True):
@@ -673,49 +1330,31 @@ def find_bounding_indices(arr, values, axis, from_below=True):
         Boolean array indicating where the search found proper bounds for the desired value
 
     """
-    # The shape of generated indices is the same as the input, but with the axis of interest
-    # replaced by the number of values to search for.
-    indices_shape = list(arr.shape)
-    indices_shape[axis] = len(values)
-
-    # Storage for the found indices and the mask for good locations
-    indices = np.empty(indices_shape, dtype=int)
-    good = np.empty(indices_shape, dtype=bool)
-
-    # Used to put the output in the proper location
-    take = make_take(arr.ndim, axis)
-
-    # Loop over all of the values and for each, see where the value would be found from a
-    # linear search
-    for level_index, value in enumerate(values):
-        # Look for changes in the value of the test for <= value in consecutive points
-        # Taking abs() because we only care if there is a flip, not which direction.
-        switches = np.abs(np.diff((arr <= value).astype(int), axis=axis))
-
-        # Good points are those where it's not just 0's along the whole axis
-        good_search = np.any(switches, axis=axis)
-
+    # Search every column for all of the values at once, in a single pass along the axis of
+    # interest, with the values in a new leading dimension.
+    values = np.asanyarray(values).reshape((-1,) + (1,) * (np.ndim(arr) - 1))
+    columns = np.moveaxis(np.ma.getdata(arr), axis, 0)
+    masked = np.moveaxis(np.ma.getmaskarray(arr), axis, 0) if np.ma.is_masked(arr) else None
+
+    # Look for changes in the value of the test for <= value in consecutive points; index 0
+    # (which can't follow a change) marks where none was found.
+    indices = np.zeros((values.shape[0],) + columns.shape[1:], dtype=int)
+    previous = columns[0] <= values
+    for level_index in range(1, columns.shape[0]):
+        current = columns[level_index] <= values
+        switches = current != previous
+        if masked is not None:
+            # Changes to or from masked points don't count
+            switches &= ~(masked[level_index - 1] | masked[level_index])
         if from_below:
-            # Look for the first switch; need to add 1 to the index since argmax is giving the
-            # index within the difference array, which is one smaller.
-            index = switches.argmax(axis=axis) + 1
-        else:
-            # Generate a list of slices to reverse the axis of interest so that searching from
-            # 0 to N is starting at the "top" of the axis.
-            arr_slice = [slice(None)] * arr.ndim
-            arr_slice[axis] = slice(None, None, -1)
+            # Keep the first change found
+            switches &= indices == 0
+        indices[switches] = level_index
+        previous = current
 
-            # Same as above, but we use the slice to come from the end; then adjust those
-            # indices to measure from the front.
-            index = arr.shape[axis] - 1 - switches[tuple(arr_slice)].argmax(axis=axis)
-
-        # Set all indices where the results are not good to 0
-        index[~good_search] = 0
-
-        # Put the results in the proper slice
-        store_slice = take(level_index)
-        indices[store_slice] = index
-        good[store_slice] = good_search
+    # Good points are those where there was a change somewhere along the axis
+    good = np.moveaxis(indices > 0, 0, axis)
+    indices = np.moveaxis(indices, 0, axis)
 
     # Create index values for broadcasting arrays
     above = broadcast_indices(indices, arr.shape, axis)
@@ -885,7 +1524,8 @@ def nominal_lat_lon_grid_deltas(longitude, latitude, geod=None):
 
 @exporter.export
 @preprocess_and_wrap()
-def azimuth_range_to_lat_lon(azimuths, ranges, center_lon, center_lat, geod=None):
+def azimuth_range_to_lat_lon(azimuths, ranges, center_lon, center_lat, geod=None, *,
+                             approximate=False, cache=False):
     """Convert azimuth and range locations in a polar coordinate system to lat/lon coordinates.
 
     Pole refers to the origin of the coordinate system.
@@ -904,6 +1544,15 @@ def azimuth_range_to_lat_lon(azimuths, ranges, center_lon, center_lat, geod=None
     geod : `pyproj.Geod` or ``None``
         PyProj Geod to use for forward azimuth and distance calculations. If ``None``, use a
         default spherical ellipsoid.
+    approximate : bool, optional
+        If True, treat an ellipsoidal ``geod`` as a sphere with its Gaussian radius of
+        curvature at the pole, so that the locations are calculated analytically. For the
+        WGS84 ellipsoid, the locations are then within about 0.35% of the range (about 800 m
+        at 230 km) of the exact ones. Defaults to False.
+    cache : bool, optional
+        If True, remember the locations for these azimuths, ranges, pole and ``geod`` so
+        that they are returned without being recalculated when called again with the same
+        values (e.g. for every volume scanned by a radar). Defaults to False.
 
     Returns
     -------
@@ -913,6 +1562,10 @@ def azimuth_range_to_lat_lon(azimuths, ranges, center_lon, center_lat, geod=None
     -----
     Credit to Brian Blaylock for the original implementation.
 
+    On a sphere, the locations are found analytically, as the inverse of an azimuthal
+    equidistant projection centered on the pole, which matches the geodesic calculation to
+    within round-off.
+
     """
     g = Geod(ellps='sphere') if geod is None else geod
     try:  # convert range units to meters
@@ -925,14 +1578,52 @@ def azimuth_range_to_lat_lon(azimuths, ranges, center_lon, center_lat, geod=None
         _warnings.warn(
             'Azimuth values are not a Pint-Quantity, assuming values are in degrees.'
         )
-    rng2d, az2d = np.meshgrid(ranges, azimuths)
-    lats = np.full(az2d.shape, center_lat)
-    lons = np.full(az2d.shape, center_lon)
-    lon, lat, _ = g.fwd(lons, lats, az2d, rng2d)
+    azimuths = np.asarray(azimuths, dtype=float).reshape(-1)
+    ranges = np.asarray(ranges, dtype=float).reshape(-1)
+
+    if cache:
+        lon, lat = _azimuth_range_to_lat_lon_cached(azimuths, ranges, float(center_lon),
+                                                    float(center_lat), g.initstring,
+                                                    bool(approximate and not g.sphere))
+        return lon.copy(), lat.copy()
+
+    return _azimuth_range_to_lat_lon(azimuths, ranges, center_lon, center_lat, g, approximate)
+
+
+def _azimuth_range_to_lat_lon(azimuths, ranges, center_lon, center_lat, geod, approximate):
+    """Calculate the locations for `azimuth_range_to_lat_lon` from degrees and meters."""
+    if geod.sphere or approximate:
+        # Solve for the locations on the sphere with the curvature of the ellipsoid at the pole
+        center = np.deg2rad(center_lat)
+        radius = geod.a * np.sqrt(1 - geod.es) / (1 - geod.es * np.sin(center) ** 2)
+        az = np.deg2rad(azimuths)[:, None]
+        dist = ranges / radius
+        sin_lat = (np.sin(center) * np.cos(dist)
+                   + np.cos(center) * np.sin(dist) * np.cos(az))
+        lon = center_lon + np.rad2deg(np.arctan2(np.sin(az) * np.sin(dist) * np.cos(center),
+                                                 np.cos(dist) - np.sin(center) * sin_lat))
+        lon = (lon + 180) % 360 - 180
+        lat = np.rad2deg(np.arcsin(sin_lat))
+    else:
+        rng2d, az2d = np.meshgrid(ranges, azimuths)
+        lats = np.full(az2d.shape, center_lat)
+        lons = np.full(az2d.shape, center_lon)
+        lon, lat, _ = geod.fwd(lons, lats, az2d, rng2d)
 
     return lon, lat
 
 
+@lru_cache_by_value(maxsize=16)
+def _azimuth_range_to_lat_lon_cached(azimuths, ranges, center_lon, center_lat, initstring,
+                                     approximate):
+    """Calculate the locations for `azimuth_range_to_lat_lon`, remembering recent results.
+
+    The `pyproj.Geod` is given by its initialization string, since it is not hashable.
+    """
+    return _azimuth_range_to_lat_lon(azimuths, ranges, center_lon, center_lat,
+                                     Geod(initstring), approximate)
+
+
 def xarray_derivative_wrap(func):
     """Decorate the derivative functions to make them work nicely with DataArrays.
 
@@ -1771,10 +2462,14 @@ def parse_angle(input_dir):
         abb_dir = _clean_direction([_abbreviate_direction(input_dir)])[0]
         return DIR_DICT[abb_dir]
     elif hasattr(input_dir, '__len__'):  # handle np.array, pd.Series, list, and array-like
-        input_dir_str = ','.join(_clean_direction(input_dir, preprocess=True))
-        abb_dir_str = _abbreviate_direction(input_dir_str)
-        abb_dirs = _clean_direction(abb_dir_str.split(','))
-        return units.Quantity.from_list(itemgetter(*abb_dirs)(DIR_DICT))
+        # Parse each distinct string once, then look up all of the angles by index. Anything
+        # that is not a string (including None, which is coded as -1) is undefined.
+        input_dir = np.asarray(input_dir)
+        codes, uniques = pd.factorize(input_dir.ravel())
+        index = np.array([_DIR_INDEX.get(_abbreviate_direction(the_dir), _DIR_INDEX[UND])
+                          if isinstance(the_dir, str) else _DIR_INDEX[UND]
+                          for the_dir in [*uniques, None]], dtype=int)
+        return _DIR_ANGLES[index[codes].reshape(input_dir.shape)]
     else:  # handle unrecognizable scalar
         return units.Quantity(np.nan, 'degree')
 
@@ -1847,7 +2542,6 @@ def angle_to_direction(input_angle, full=False, level=3):
 
     np_input_angle = np.array(input_angle).astype(float)
     origshape = np_input_angle.shape
-    ndarray = len(origshape) > 1
     # clean any numeric strings, negatives, and None does not handle strings with alphabet
     input_angle = units.Quantity(np_input_angle, origin_units)
     input_angle[input_angle < 0] = np.nan
@@ -1865,14 +2559,7 @@ def angle_to_direction(input_angle, full=False, level=3):
         err_msg = 'Level of complexity cannot be less than 1 or greater than 3!'
         raise ValueError(err_msg)
 
-    angle_dict = {
-        i * BASE_DEGREE_MULTIPLIER.m * nskip: dir_str
-        for i, dir_str in enumerate(DIR_STRS[::nskip])
-    }
-    angle_dict[MAX_DEGREE_ANGLE.m] = 'N'  # handle edge case of 360.
-    angle_dict[UND_ANGLE] = UND
-
-    # round to the nearest angles for dict lookup
+    # round to the nearest angles for table lookup
     # 0.001 is subtracted so there's an equal number of dir_str from
     # np.arange(0, 360, 22.5), or else some dir_str will be preferred
 
@@ -1885,24 +2572,17 @@ def angle_to_direction(input_angle, full=False, level=3):
     #  'S', 'S', 'SW', 'SW', 'W', 'W', 'NW', 'NW']
 
     multiplier = np.round((norm_angles / BASE_DEGREE_MULTIPLIER / nskip) - 0.001).m
-    round_angles = multiplier * BASE_DEGREE_MULTIPLIER.m * nskip
-    round_angles[np.where(np.isnan(round_angles))] = UND_ANGLE
-    if ndarray:
-        round_angles = round_angles.flatten()
-    dir_str_arr = itemgetter(*round_angles)(angle_dict)  # returns str or tuple
-    if full:
-        dir_str_arr = ','.join(dir_str_arr)
-        dir_str_arr = _unabbreviate_direction(dir_str_arr)
-        dir_str_arr = dir_str_arr.split(',')
-        if scalar:
-            return dir_str_arr[0]
-        else:
-            return np.array(dir_str_arr).reshape(origshape)
+
+    # Convert to indices into DIR_STRS, wrapping 360 back to N
+    index = np.full(multiplier.shape, _DIR_INDEX[UND])
+    valid = np.isfinite(multiplier)
+    index[valid] = (multiplier[valid] * nskip).astype(int) % _DIR_INDEX[UND]
+
+    dir_str_arr = (_FULL_DIR_STRS if full else _DIR_ABBREVIATIONS)[index]
+    if scalar:
+        return dir_str_arr[0].item()
     else:
-        if scalar:
-            return dir_str_arr
-        else:
-            return np.array(dir_str_arr).reshape(origshape)
+        return dir_str_arr.reshape(origshape)
 
 
 def _unabbreviate_direction(abb_dir_str):
@@ -1918,6 +2598,9 @@ def _unabbreviate_direction(abb_dir_str):
             ).strip()
 
 
+_FULL_DIR_STRS = np.array([_unabbreviate_direction(dir_str) for dir_str in DIR_STRS])
+
+
 def _remove_nans(*variables):
     """Remove NaNs from arrays that cause issues with calculations.
 
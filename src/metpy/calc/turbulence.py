@@ -3,10 +3,13 @@
 # SPDX-License-Identifier: BSD-3-Clause
 r"""Contains calculations related to turbulence and time series perturbations."""
 
+from collections import deque
+
 import numpy as np
 
 from .tools import make_take
 from ..package_tools import Exporter
+from ..units import units
 from ..xarray import preprocess_and_wrap
 
 exporter = Exporter(globals())
@@ -247,3 +250,186 @@ def friction_velocity(u, w, v=None, perturbation=False, axis=-1):
     # square root of that. This is faster than np.power(..., 0.25)
     np.sqrt(kf, out=kf)
     return np.sqrt(kf)
+
+
+@exporter.export
+class TurbulenceWindows:
+    r"""Accumulate turbulence statistics over windows of a long time series in chunks.
+
+    Long, high-rate time series (e.g. weeks of 20 Hz sonic anemometer data) are fed to
+    `update` one chunk at a time. Means and covariances of the velocity components (and
+    optionally a scalar) are accumulated for blocks of ``step`` samples using Welford's
+    method, combining the statistics of each chunk with those of the block so far. Once
+    ``window`` samples have been seen, the blocks making up each window are combined into
+    its turbulence kinetic energy, kinematic fluxes and friction velocity, which are returned
+    by the call to `update` that completes the window.
+
+    Only the statistics of the blocks in the latest window are kept, so memory use does not
+    grow with the length of the time series or the size of the chunks.
+
+    Parameters
+    ----------
+    window : int
+        The number of samples in each averaging window (e.g. 36000 for 30-minute windows of
+        20 Hz data).
+    step : int, optional
+        The number of samples between the starts of successive windows, which must divide
+        ``window``. Defaults to ``window``, giving consecutive block averages; smaller values
+        give overlapping (rolling) windows.
+    axis : int, optional
+        The index of the time axis of the chunks. Defaults to -1.
+
+    Attributes
+    ----------
+    count : int
+        The number of samples consumed so far.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from metpy.calc import TurbulenceWindows
+    >>> from metpy.units import units
+    >>> rng = np.random.default_rng(0)
+    >>> u, v, w = rng.normal(scale=[[2], [1], [0.5]], size=(3, 1000)) * units('m/s')
+    >>> windows = TurbulenceWindows(500)
+    >>> stats = [windows.update(u[i:i + 300], v[i:i + 300], w[i:i + 300])
+    ...          for i in range(0, 1000, 300)]
+    >>> [len(s['tke']) for s in stats]
+    [0, 1, 0, 1]
+
+    Notes
+    -----
+    Each window gives the same values as calling `tke`, `kinematic_flux` and
+    `friction_velocity` on the samples in that window. Windows are numbered from the start of
+    the time series, and a final window with fewer than ``window`` samples is never returned.
+    Results are stacked along the last dimension, with any other dimensions of the chunks
+    (e.g. multiple sensors) before it.
+
+    See Also
+    --------
+    tke, kinematic_flux, friction_velocity
+
+    """
+
+    def __init__(self, window, step=None, axis=-1):
+        """Set up the windows to accumulate."""
+        step = window if step is None else step
+        if window < 1 or step < 1 or window % step:
+            raise ValueError('window must be a positive multiple of step.')
+        self.window = window
+        self.step = step
+        self.axis = axis
+        self.count = 0
+        self._units = None
+        self._block = None
+        self._blocks = deque(maxlen=window // step)
+
+    def update(self, u, v, w, scalar=None):
+        r"""Add a chunk of samples and return the statistics of any windows it completes.
+
+        Parameters
+        ----------
+        u : `pint.Quantity`
+            The wind component along the x-axis
+        v : `pint.Quantity`
+            The wind component along the y-axis
+        w : `pint.Quantity`
+            The wind component along the z-axis
+        scalar : `pint.Quantity`, optional
+            A scalar variable (e.g. temperature) whose vertical kinematic flux is computed.
+            Must be given either with every chunk or never.
+
+        Returns
+        -------
+        dict
+            For each window completed by this chunk, in order: ``'start'``, the index of the
+            first sample of the window; ``'mean_u'``, ``'mean_v'``, ``'mean_w'`` and
+            (with ``scalar``) ``'mean_scalar'``, the mean of each variable; ``'tke'``, the
+            turbulence kinetic energy; ``'u_w_flux'``, ``'v_w_flux'`` and (with ``scalar``)
+            ``'w_scalar_flux'``, the vertical kinematic fluxes; and ``'friction_velocity'``.
+
+        """
+        values = [u, v, w] + ([] if scalar is None else [scalar])
+        if self._units is None:
+            speed = getattr(u, 'units', units.dimensionless)
+            self._units = [speed] * 3
+            if scalar is not None:
+                self._units.append(getattr(scalar, 'units', units.dimensionless))
+        elif len(values) != len(self._units):
+            raise ValueError('scalar must be given with every chunk or never.')
+        data = np.stack([np.moveaxis(units.Quantity(value).m_as(unit), self.axis, -1)
+                         for value, unit in zip(values, self._units)])
+
+        results = []
+        offset = 0
+        while offset < data.shape[-1]:
+            filled = self.count % self.step
+            stop = min(offset + self.step - filled, data.shape[-1])
+            chunk = _Moments.from_samples(data[..., offset:stop])
+            self._block = chunk if self._block is None else self._block.merge(chunk)
+            self.count += stop - offset
+            offset = stop
+
+            if self.count % self.step == 0:
+                self._blocks.append(self._block)
+                self._block = None
+                if self.count >= self.window:
+                    window = self._blocks[0]
+                    for block in list(self._blocks)[1:]:
+                        window = window.merge(block)
+                    results.append((self.count - self.window, window))
+
+        return self._window_statistics(results, data.shape[1:-1])
+
+    def _window_statistics(self, results, shape):
+        """Collect the turbulence statistics of completed windows into arrays."""
+        speed = self._units[0]
+        if results:
+            starts, moments = zip(*results)
+            mean = np.stack([m.mean for m in moments], axis=-1)
+            cov = np.stack([m.comoment / m.count for m in moments], axis=-1)
+        else:
+            starts = ()
+            num = len(self._units)
+            mean = np.empty((num, *shape, 0))
+            cov = np.empty((num, num, *shape, 0))
+
+        stats = {'start': np.array(starts, dtype=int),
+                 'mean_u': units.Quantity(mean[0], speed),
+                 'mean_v': units.Quantity(mean[1], speed),
+                 'mean_w': units.Quantity(mean[2], speed),
+                 'tke': units.Quantity(0.5 * np.sqrt(cov[0, 0] + cov[1, 1] + cov[2, 2]),
+                                       speed),
+                 'u_w_flux': units.Quantity(cov[0, 2], speed**2),
+                 'v_w_flux': units.Quantity(cov[1, 2], speed**2),
+                 'friction_velocity': units.Quantity(np.sqrt(np.hypot(cov[0, 2], cov[1, 2])),
+                                                     speed)}
+        if len(self._units) > 3:
+            stats['mean_scalar'] = units.Quantity(mean[3], self._units[3])
+            stats['w_scalar_flux'] = units.Quantity(cov[2, 3], speed * self._units[3])
+        return stats
+
+
+class _Moments:
+    """Count, means and co-moments of several variables, combined with Chan's method."""
+
+    def __init__(self, count, mean, comoment):
+        self.count = count
+        self.mean = mean
+        self.comoment = comoment
+
+    @classmethod
+    def from_samples(cls, data):
+        """Calculate the moments of samples along the last axis of data."""
+        mean = data.mean(axis=-1)
+        anomaly = data - mean[..., None]
+        return cls(data.shape[-1], mean,
+                   np.einsum('i...t,j...t->ij...', anomaly, anomaly))
+
+    def merge(self, other):
+        """Combine with the moments of another set of samples."""
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return _Moments(count, self.mean + delta * (other.count / count),
+                        self.comoment + other.comoment
+                        + delta[:, None] * delta[None, :] * (self.count * other.count / count))
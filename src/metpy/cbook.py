@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Collection of generally useful utility code from the cookbook."""
 
+import functools
 import os
 from pathlib import Path
 
@@ -10,6 +11,7 @@ import numpy as np
 import pooch
 
 from . import __version__
+from .units import units
 
 pooch_kwargs = {'path': pooch.os_cache('metpy'), 'version': 'v' + __version__,
                 'base_url': 'https://github.com/Unidata/MetPy/raw/{version}/staticdata/'}
@@ -129,4 +131,79 @@ def broadcast_indices(indices, shape, axis):
     return tuple(ret)
 
 
-__all__ = ('Registry', 'broadcast_indices', 'get_test_data')
+class _ValueKey:
+    """Hold an argument so that it is hashed and compared by its values and any units."""
+
+    def __init__(self, value):
+        """Find the key for the value."""
+        self.value = value
+        array = np.asarray(getattr(value, 'magnitude', value))
+        self._key = (array.shape, array.dtype.str, array.tobytes(),
+                     str(getattr(value, 'units', '')))
+
+    def __hash__(self):
+        """Hash the key for the value."""
+        return hash(self._key)
+
+    def __eq__(self, other):
+        """Compare the keys of the values."""
+        return isinstance(other, _ValueKey) and self._key == other._key
+
+    @classmethod
+    def wrap(cls, arg):
+        """Wrap arrays, sequences, and quantities so they are compared by value.
+
+        An `xarray.DataArray` is replaced by its data, with its units if it has any.
+        """
+        import xarray as xr
+
+        if isinstance(arg, xr.DataArray):
+            if 'units' in arg.attrs and not hasattr(arg.data, 'units'):
+                arg = units.Quantity(arg.data, arg.attrs['units'])
+            else:
+                arg = arg.data
+
+        if isinstance(arg, (np.ndarray, list, tuple)) or hasattr(arg, 'units'):
+            return cls(arg)
+        return arg
+
+    @staticmethod
+    def unwrap(arg):
+        """Return the original argument."""
+        return arg.value if isinstance(arg, _ValueKey) else arg
+
+
+def lru_cache_by_value(maxsize=32):
+    """Cache the results of a function, like `functools.lru_cache`, for arrays as arguments.
+
+    Arguments that are arrays, sequences, or `pint.Quantity` are compared by their values and
+    units rather than their identity, so they do not need to be hashable. An
+    `xarray.DataArray` is passed on as its data, a `pint.Quantity` if it has units, and its
+    coordinates are not considered. Other arguments must be hashable, as for
+    `functools.lru_cache`. The same result is returned for repeated calls, so it should not be
+    modified.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of results kept, discarding the least recently used ones.
+
+    """
+    def dec(func):
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(*args, **kwargs):
+            return func(*map(_ValueKey.unwrap, args),
+                        **{name: _ValueKey.unwrap(arg) for name, arg in kwargs.items()})
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached(*map(_ValueKey.wrap, args),
+                          **{name: _ValueKey.wrap(arg) for name, arg in kwargs.items()})
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return dec
+
+
+__all__ = ('Registry', 'broadcast_indices', 'get_test_data', 'lru_cache_by_value')
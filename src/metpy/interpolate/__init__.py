@@ -6,6 +6,7 @@ r"""Provides tools for interpolating data."""
 from .grid import *  # noqa: F403
 from .one_dimension import *  # noqa: F403
 from .points import *  # noqa: F403
+from .radar import *  # noqa: F403
 from .slices import *  # noqa: F403
 from .tools import *  # noqa: F403
 from ..package_tools import set_module
@@ -13,6 +14,7 @@ from ..package_tools import set_module
 __all__ = grid.__all__[:]  # pylint: disable=undefined-variable
 __all__.extend(one_dimension.__all__)  # pylint: disable=undefined-variable
 __all__.extend(points.__all__)  # pylint: disable=undefined-variable
+__all__.extend(radar.__all__)  # pylint: disable=undefined-variable
 __all__.extend(slices.__all__)  # pylint: disable=undefined-variable
 __all__.extend(tools.__all__)  # pylint: disable=undefined-variable
 
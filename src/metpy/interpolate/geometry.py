@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Tools for working with geometric objects (points, triangles, polygons)."""
 
+from itertools import chain
 import logging
 import math
 
@@ -253,6 +254,44 @@ def find_natural_neighbors(tri, grid_points):
     circumcenters: numpy.ndarray
         Circumcenter for each triangle in ``tri``.
 
+    See Also
+    --------
+    find_natural_neighbor_triangles
+
+    """
+    grid, triangles, circumcenters = find_natural_neighbor_triangles(tri, grid_points)
+
+    members = {key: [] for key in range(len(grid_points))}
+    for point, triangle in zip(grid.tolist(), triangles.tolist()):
+        members[point].append(triangle)
+
+    return members, circumcenters
+
+
+def find_natural_neighbor_triangles(tri, grid_points):
+    r"""Return every pair of grid cell and natural neighbor triangle as flat arrays.
+
+    This is `find_natural_neighbors` for many grid cells at once, with the circumcircles of
+    all of the triangles calculated together and a single search for the grid cells within
+    them.
+
+    Parameters
+    ----------
+    tri: `scipy.spatial.Delaunay`
+        A Delaunay Triangulation.
+    grid_points: (X, Y) numpy.ndarray
+        Locations of grids.
+
+    Returns
+    -------
+    grid: (K, ) numpy.ndarray
+        Index of the grid cell of each pair, in ascending order.
+    triangles: (K, ) numpy.ndarray
+        Simplex code of the natural neighbor triangle of each pair, in ascending order for
+        each grid cell.
+    circumcenters: numpy.ndarray
+        Circumcenter for each triangle in ``tri``.
+
     """
     # Used for fast identification of points with a radius of another point
     tree = cKDTree(grid_points)
@@ -260,23 +299,73 @@ def find_natural_neighbors(tri, grid_points):
     # Mask for points that are outside the triangulation
     in_triangulation = tri.find_simplex(tree.data) >= 0
 
-    circumcenters = []
-    members = {key: [] for key in range(len(tree.data))}
-    for i, indices in enumerate(tri.simplices):
-        # Find the circumcircle (center and radius) for the triangle.
-        triangle = tri.points[indices]
-        cc = circumcenter(*triangle)
-        r = circumcircle_radius(*triangle)
-        circumcenters.append(cc)
-
-        # Find all grid points within the circumcircle.
-        for point in tree.query_ball_point(cc, r):
-            # If this point is within the triangulation, add this triangle to its list of
-            # natural neighbors
-            if in_triangulation[point]:
-                members[point].append(i)
-
-    return members, np.array(circumcenters)
+    # Find the circumcircle (center and radius) of every triangle, skipping degenerate ones
+    circumcenters, radii = circumcircles(tri.points[tri.simplices])
+    good = np.flatnonzero(np.isfinite(radii))
+
+    # Find all grid points within each circumcircle that are within the triangulation
+    matches = tree.query_ball_point(circumcenters[good], radii[good])
+    counts = np.fromiter(map(len, matches), dtype=np.intp, count=len(matches))
+    triangles = np.repeat(good, counts)
+    grid = np.fromiter(chain.from_iterable(matches), dtype=np.intp, count=counts.sum())
+    keep = in_triangulation[grid]
+    grid = grid[keep]
+    triangles = triangles[keep]
+
+    order = np.lexsort((triangles, grid))
+    return grid[order], triangles[order], circumcenters
+
+
+def circumcircles(triangles):
+    r"""Calculate the circumcenters and circumcircle radii of many triangles at once.
+
+    Parameters
+    ----------
+    triangles: (N, 3, 2) numpy.ndarray
+        Coordinates of the vertices of each triangle
+
+    Returns
+    -------
+    cc: (N, 2) numpy.ndarray
+        circumcenter coordinates, which are NaN for degenerate triangles
+    r: (N, ) numpy.ndarray
+        circumcircle radii, which are NaN for degenerate triangles
+
+    See Also
+    --------
+    circumcenter, circumcircle_radius
+
+    """
+    a_x, b_x, c_x = triangles[..., 0].T
+    a_y, b_y, c_y = triangles[..., 1].T
+
+    bc_y_diff = b_y - c_y
+    ca_y_diff = c_y - a_y
+    ab_y_diff = a_y - b_y
+    cb_x_diff = c_x - b_x
+    ac_x_diff = a_x - c_x
+    ba_x_diff = b_x - a_x
+
+    d_div = (a_x * bc_y_diff + b_x * ca_y_diff + c_x * ab_y_diff)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d_inv = np.where(d_div == 0, np.nan, 0.5 / d_div)
+
+    a_mag = a_x**2 + a_y**2
+    b_mag = b_x**2 + b_y**2
+    c_mag = c_x**2 + c_y**2
+
+    cx = (a_mag * bc_y_diff + b_mag * ca_y_diff + c_mag * ab_y_diff) * d_inv
+    cy = (a_mag * cb_x_diff + b_mag * ac_x_diff + c_mag * ba_x_diff) * d_inv
+
+    pt0, pt1, pt2 = triangles.transpose(1, 2, 0)
+    a = np.sqrt(dist_2(*pt0, *pt1))
+    b = np.sqrt(dist_2(*pt1, *pt2))
+    c = np.sqrt(dist_2(*pt2, *pt0))
+    t_area = triangle_area(pt0, pt1, pt2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.where((t_area > 0) & np.isfinite(d_inv), (a * b * c) / (4 * t_area), np.nan)
+
+    return np.column_stack([cx, cy]), r
 
 
 def find_nn_triangles_point(tri, cur_tri, point):
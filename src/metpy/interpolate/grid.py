@@ -3,12 +3,19 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Tools and calculations for interpolating specifically to a grid."""
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+import xarray as xr
 
-from .points import (interpolate_to_points, inverse_distance_to_points,
+from .points import (barnes_to_points, interpolate_to_points, Interpolator,
+                     inverse_distance_to_isobaric_points, inverse_distance_to_points,
                      natural_neighbor_to_points)
+from .tools import observation_mask
 from ..package_tools import Exporter
 from ..pandas import preprocess_pandas
+from ..units import units
 
 exporter = Exporter(globals())
 
@@ -221,12 +228,129 @@ def inverse_distance_to_grid(xp, yp, variable, grid_x, grid_y, r, gamma=None, ka
     return img.reshape(grid_x.shape)
 
 
+@exporter.export
+def barnes_to_grid(xp, yp, variable, grid_x, grid_y, r, kappa, gamma=0.3, passes=2,
+                   min_neighbors=3):
+    r"""Generate a multi-pass Barnes analysis of the given points on a regular grid.
+
+    Each pass after the first corrects the analysis using the differences between the
+    observations and the analysis at the observations, following [Koch1983]_.
+
+    Parameters
+    ----------
+    xp: (N, ) numpy.ndarray
+        x-coordinates of observations.
+    yp: (N, ) numpy.ndarray
+        y-coordinates of observations.
+    variable: (N, ...) numpy.ndarray
+        observation values associated with (xp, yp) pairs.
+        IE, variable[i] is a unique observation at (xp[i], yp[i]). Any dimensions after the
+        first, such as several variables or times, are analyzed together.
+    grid_x: (M, 2) numpy.ndarray
+        Meshgrid associated with x dimension.
+    grid_y: (M, 2) numpy.ndarray
+        Meshgrid associated with y dimension.
+    r: float
+        Radius from grid center, within which observations
+        are considered and weighted.
+    kappa: float
+        Response parameter for the first pass of the analysis.
+    gamma: float
+        Adjustable smoothing parameter for the correction passes. Default 0.3.
+    passes: int
+        Total number of passes of the analysis. Default 2.
+    min_neighbors: int
+        Minimum number of neighbors needed to analyze a grid point. Default is 3.
+
+    Returns
+    -------
+    img: (M, N, ...) numpy.ndarray
+        Analyzed values on a 2-dimensional grid
+
+    See Also
+    --------
+    barnes_to_points
+
+    """
+    # Handle grid-to-points conversion, and use function from `interpolation`
+    points_obs = list(zip(xp, yp))
+    points_grid = generate_grid_coords(grid_x, grid_y)
+    img = barnes_to_points(points_obs, variable, points_grid, r, kappa, gamma=gamma,
+                           passes=passes, min_neighbors=min_neighbors)
+    return img.reshape(grid_x.shape + img.shape[1:])
+
+
+@exporter.export
+def inverse_distance_to_isobaric_grid(xp, yp, pressure, variable, grid_x, grid_y, levels, r,
+                                      vertical_radius, gamma=None, kappa=None,
+                                      min_neighbors=3, kind='cressman', workers=1):
+    r"""Generate an inverse distance interpolation in three dimensions to an isobaric grid.
+
+    Values are assigned to the grid on every level by weighting the observations based on
+    either [Cressman1959]_ or [Barnes1964]_, using their horizontal distances and their
+    differences in the natural logarithm of pressure.
+
+    Parameters
+    ----------
+    xp: (N, ) numpy.ndarray
+        x-coordinates of observations.
+    yp: (N, ) numpy.ndarray
+        y-coordinates of observations.
+    pressure: (N, ) numpy.ndarray
+        Pressure of observations.
+    variable: (N, ...) numpy.ndarray
+        Observation values associated with (xp, yp, pressure). Any dimensions after the
+        first, such as several variables, are interpolated together.
+    grid_x: (M, 2) numpy.ndarray
+        Meshgrid associated with x dimension.
+    grid_y: (M, 2) numpy.ndarray
+        Meshgrid associated with y dimension.
+    levels: (L, ) numpy.ndarray
+        Pressure levels of the grid.
+    r: float
+        Radius from grid center, within which observations
+        are considered and weighted.
+    vertical_radius: float
+        Difference in the natural logarithm of pressure equivalent to ``r``.
+    gamma: float
+        Adjustable smoothing parameter for the barnes interpolation. Default None.
+    kappa: float
+        Response parameter for barnes interpolation. Default None.
+    min_neighbors: int
+        Minimum number of neighbors needed to perform barnes or cressman interpolation
+        for a point. Default is 3.
+    kind: str
+        Specify what inverse distance weighting interpolation to use.
+        Options: 'cressman' or 'barnes'. Default 'cressman'
+    workers: int
+        Number of threads used to interpolate the levels. Default 1.
+
+    Returns
+    -------
+    img: (L, M, N) numpy.ndarray
+        Interpolated values on a 3-dimensional grid
+
+    See Also
+    --------
+    inverse_distance_to_isobaric_points, inverse_distance_to_grid
+
+    """
+    # Handle grid-to-points conversion, and use function from `interpolation`
+    points_obs = list(zip(xp, yp))
+    points_grid = generate_grid_coords(grid_x, grid_y)
+    img = inverse_distance_to_isobaric_points(points_obs, pressure, variable, points_grid,
+                                              levels, r, vertical_radius, gamma=gamma,
+                                              kappa=kappa, min_neighbors=min_neighbors,
+                                              kind=kind, workers=workers)
+    return img.reshape(img.shape[:1] + grid_x.shape + img.shape[2:])
+
+
 @exporter.export
 @preprocess_pandas
 def interpolate_to_grid(x, y, z, interp_type='linear', hres=50000,
                         minimum_neighbors=3, gamma=0.25, kappa_star=5.052,
                         search_radius=None, rbf_func='linear', rbf_smooth=0,
-                        boundary_coords=None):
+                        boundary_coords=None, rbf_neighbors=None):
     r"""Interpolate given (x,y), observation (z) pairs to a grid based on given parameters.
 
     Parameters
@@ -267,6 +391,10 @@ def interpolate_to_grid(x, y, z, interp_type='linear', hres=50000,
     boundary_coords: dict
         Optional dictionary containing coordinates of the study area boundary. Dictionary
         should be in format: {'west': west, 'south': south, 'east': east, 'north': north}
+    rbf_neighbors: int, optional
+        Number of nearest observations used for each point in rbf interpolation. If given,
+        the interpolation is done with `~metpy.interpolate.rbf_to_points`, which scales to
+        large numbers of observations. Defaults to using all observations.
 
     Returns
     -------
@@ -301,11 +429,169 @@ def interpolate_to_grid(x, y, z, interp_type='linear', hres=50000,
     img = interpolate_to_points(points_obs, z, points_grid, interp_type=interp_type,
                                 minimum_neighbors=minimum_neighbors, gamma=gamma,
                                 kappa_star=kappa_star, search_radius=search_radius,
-                                rbf_func=rbf_func, rbf_smooth=rbf_smooth)
+                                rbf_func=rbf_func, rbf_smooth=rbf_smooth,
+                                rbf_neighbors=rbf_neighbors)
 
     return grid_x, grid_y, img.reshape(grid_x.shape)
 
 
+@exporter.export
+@preprocess_pandas
+def interpolate_to_grid_as_dataset(x, y, z, interp_type='linear', hres=50000,
+                                   minimum_neighbors=3, gamma=0.25, kappa_star=5.052,
+                                   search_radius=None, rbf_func='linear', rbf_smooth=0,
+                                   boundary_coords=None, axis=0, dim='field', workers=1,
+                                   rbf_neighbors=None):
+    r"""Interpolate many fields observed at the same (x,y) points to a grid as a Dataset.
+
+    This is `interpolate_to_grid` for any number of variables or times at once. The grid is
+    generated once, and observations that are missing or at repeated coordinates are removed
+    separately for each field. Fields with the same observations remaining share the
+    neighbors and weights found for the interpolation, and each distinct set of
+    observations can be interpolated in parallel.
+
+    Parameters
+    ----------
+    x: array-like
+        x coordinate
+    y: array-like
+        y coordinate
+    z: array-like or dict
+        Observation values, with the observations along ``axis`` and at most one other
+        dimension, such as time or several fields. May also be a dictionary mapping variable
+        names to such arrays.
+    interp_type: str
+        What type of interpolation to use. Available options include:
+        1) "linear", "nearest", "cubic", or "rbf" from `scipy.interpolate`.
+        2) "natural_neighbor", "barnes", or "cressman" from `metpy.interpolate`.
+        Default "linear".
+    hres: float
+        The horizontal resolution of the generated grid, given in the same units as the
+        x and y parameters. Default 50000.
+    minimum_neighbors: int
+        Minimum number of neighbors needed to perform Barnes or Cressman interpolation for a
+        point. Default is 3.
+    gamma: float
+        Adjustable smoothing parameter for the barnes interpolation. Default 0.25.
+    kappa_star: float
+        Response parameter for barnes interpolation, specified nondimensionally
+        in terms of the Nyquist. Default 5.052
+    search_radius: float
+        A search radius to use for the Barnes and Cressman interpolation schemes.
+        If search_radius is not specified, it will default to 5 times the average spacing of
+        observations.
+    rbf_func: str
+        Specifies which function to use for Rbf interpolation.
+        Options include: 'multiquadric', 'inverse', 'gaussian', 'linear', 'cubic',
+        'quintic', and 'thin_plate'. Default 'linear'. See `scipy.interpolate.Rbf` for more
+        information.
+    rbf_smooth: float
+        Smoothing value applied to rbf interpolation.  Higher values result in more smoothing.
+    boundary_coords: dict
+        Optional dictionary containing coordinates of the study area boundary. Dictionary
+        should be in format: {'west': west, 'south': south, 'east': east, 'north': north}
+    axis: int
+        The axis of two-dimensional observation values corresponding to the observations.
+        Default 0.
+    dim: str
+        Name of the other dimension of the observation values, if any. Default 'field'.
+    workers: int
+        Number of threads used to interpolate fields with different observations remaining.
+        Default 1.
+    rbf_neighbors: int, optional
+        Number of nearest observations used for each point in rbf interpolation. If given,
+        the interpolation is done with `~metpy.interpolate.rbf_to_points`, which scales to
+        large numbers of observations. Defaults to using all observations.
+
+    Returns
+    -------
+    `xarray.Dataset`
+        The interpolated values on the grid, with dimensions (``dim``, y, x), and the grid
+        coordinates as the coordinates x and y. Values given as an array are the variable
+        ``z``.
+
+    See Also
+    --------
+    interpolate_to_grid, Interpolator
+
+    Notes
+    -----
+    This function interpolates points to a Cartesian plane, even if lat/lon coordinates
+    are provided.
+
+    """
+    # Generate the grid
+    if boundary_coords is None:
+        boundary_coords = get_boundary_coords(x, y)
+    grid_x, grid_y = generate_grid(hres, boundary_coords)
+    points_grid = generate_grid_coords(grid_x, grid_y)
+    x = np.asarray(x)
+    y = np.asarray(y)
+
+    # Gather the fields into the columns of a single array
+    fields = z if isinstance(z, Mapping) else {'z': z}
+    columns = []
+    field_units = {}
+    for name, values in fields.items():
+        if hasattr(values, 'units'):
+            field_units[name] = values.units
+            values = values.magnitude
+        values = np.asarray(values, dtype=float)
+        if values.ndim > 2:
+            raise ValueError(f'{name} has more than one dimension besides the observations.')
+        elif values.ndim == 2:
+            values = np.moveaxis(values, axis, 0)
+        if values.shape[0] != len(x):
+            raise ValueError(f'{name} has {values.shape[0]} observations, but there are '
+                             f'{len(x)} coordinates.')
+        columns.append(values.reshape(len(x), -1))
+    sizes = [col.shape[1] for col in columns]
+    columns = np.concatenate(columns, axis=1)
+
+    # Group the columns by their missing observations, finding the observations to use for
+    # each group only once
+    missing, group = np.unique(np.isnan(columns).T, axis=0, return_inverse=True)
+    group = group.reshape(-1)
+
+    def interpolate_group(i):
+        keep = observation_mask(x, y, np.where(missing[i], np.nan, 0.))
+        points_obs = np.column_stack([x[keep], y[keep]])
+        values = columns[keep][:, group == i]
+        if interp_type == 'cubic' or (interp_type == 'rbf' and rbf_neighbors is not None):
+            return interpolate_to_points(points_obs, values, points_grid,
+                                         interp_type=interp_type, rbf_func=rbf_func,
+                                         rbf_smooth=rbf_smooth, rbf_neighbors=rbf_neighbors)
+        interp = Interpolator(points_obs, points_grid, interp_type=interp_type,
+                              minimum_neighbors=minimum_neighbors, gamma=gamma,
+                              kappa_star=kappa_star, search_radius=search_radius,
+                              rbf_func=rbf_func, rbf_smooth=rbf_smooth)
+        return interp.interpolate(values)[0]
+
+    if workers == 1:
+        results = list(map(interpolate_group, range(len(missing))))
+    else:
+        with ThreadPoolExecutor(workers) as pool:
+            results = list(pool.map(interpolate_group, range(len(missing))))
+
+    img = np.empty((len(points_grid), columns.shape[1]))
+    for i, result in enumerate(results):
+        img[:, group == i] = result
+
+    # Split the columns back into variables on the grid
+    data_vars = {}
+    for (name, values), start, size in zip(fields.items(), np.cumsum([0] + sizes), sizes):
+        var = np.moveaxis(img[:, start:start + size].reshape(grid_x.shape + (size,)), -1, 0)
+        dims = (dim, 'y', 'x')
+        if np.ndim(values) == 1:
+            var = var[0]
+            dims = dims[1:]
+        if name in field_units:
+            var = units.Quantity(var, field_units[name])
+        data_vars[name] = (dims, var)
+
+    return xr.Dataset(data_vars, coords={'x': grid_x[0], 'y': grid_y[:, 0]})
+
+
 @exporter.export
 @preprocess_pandas
 def interpolate_to_isosurface(level_var, interp_var, level, bottom_up_search=True):
@@ -323,17 +609,17 @@ def interpolate_to_isosurface(level_var, interp_var, level, bottom_up_search=Tru
     interp_var: array-like (P, M, N)
         Variable on 3D grid with same vertical coordinate as level_var to interpolate to
         given level (e.g., potential temperature on isobaric levels)
-    level: int or float
-        Desired interpolated level (e.g., 2 PVU surface)
+    level: int, float, or array-like
+        Desired interpolated level (e.g., 2 PVU surface), or a 1-D array of levels
     bottom_up_search : bool, optional
         Controls whether to search for levels bottom-up (starting at lower indices),
         or top-down (starting at higher indices). Defaults to True, which is bottom-up search.
 
     Returns
     -------
-    interp_level: (M, N) numpy.ndarray
+    interp_level: (M, N) or (L, M, N) array-like
         The interpolated variable (e.g., potential temperature) on the desired level (e.g.,
-        2 PVU surface)
+        2 PVU surface), or on each of the desired levels
 
     Notes
     -----
@@ -341,21 +627,47 @@ def interpolate_to_isosurface(level_var, interp_var, level, bottom_up_search=Tru
     The prototypical example is interpolation of potential temperature to the dynamic
     tropopause (e.g., 2 PVU surface)
 
+    All of the levels are found with a single pass through the vertical dimension. Dask
+    arrays are interpolated lazily, a chunk at a time, after merging the vertical dimension
+    into a single chunk.
+
     """
+    levels = np.atleast_1d(level)
+
+    # Duck-type Dask arrays to avoid importing Dask
+    if hasattr(level_var, 'rechunk'):
+        import dask.array as da
+
+        level_var = level_var.rechunk({0: -1})
+        interp_var = da.asarray(interp_var).rechunk(level_var.chunks)
+        interp_level = da.map_blocks(_interpolate_to_isosurfaces, level_var, interp_var,
+                                     levels=levels, bottom_up_search=bottom_up_search,
+                                     chunks=((levels.size,),) + level_var.chunks[1:],
+                                     dtype=np.result_type(level_var, interp_var, float))
+    else:
+        interp_level = _interpolate_to_isosurfaces(level_var, interp_var, levels,
+                                                   bottom_up_search)
+
+    return interp_level.squeeze() if np.ndim(level) == 0 else interp_level
+
+
+def _interpolate_to_isosurfaces(level_var, interp_var, levels, bottom_up_search):
+    """Linearly interpolate a variable to each of the levels of another."""
     from ..calc import find_bounding_indices
 
-    # Find index values above and below desired interpolated surface value
-    above, below, good = find_bounding_indices(level_var, [level], axis=0,
+    # Find index values above and below desired interpolated surface values
+    above, below, good = find_bounding_indices(level_var, levels, axis=0,
                                                from_below=bottom_up_search)
 
-    # Linear interpolation of variable to interpolated surface value
-    interp_level = (((level - level_var[above]) / (level_var[below] - level_var[above]))
+    # Linear interpolation of variable to interpolated surface values
+    levels = levels.reshape((-1,) + (1,) * (np.ndim(level_var) - 1))
+    interp_level = (((levels - level_var[above]) / (level_var[below] - level_var[above]))
                     * (interp_var[below] - interp_var[above])) + interp_var[above]
 
     # Handle missing values and instances where no values for surface exist above and below
     interp_level[~good] = np.nan
-    minvar = (np.min(level_var, axis=0) >= level)
-    maxvar = (np.max(level_var, axis=0) <= level)
-    interp_level[0][minvar] = interp_var[-1][minvar]
-    interp_level[0][maxvar] = interp_var[0][maxvar]
-    return interp_level.squeeze()
+    minvar = (np.min(level_var, axis=0) >= levels)
+    maxvar = (np.max(level_var, axis=0) <= levels)
+    interp_level[minvar] = np.broadcast_to(interp_var[-1], minvar.shape)[minvar]
+    interp_level[maxvar] = np.broadcast_to(interp_var[0], maxvar.shape)[maxvar]
+    return interp_level
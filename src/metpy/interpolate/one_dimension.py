@@ -93,82 +93,11 @@ def interpolate_1d(x, xp, *args, axis=0, fill_value=np.nan, return_list_always=F
 
     Notes
     -----
-    xp and args must be the same shape.
+    xp and args must be the same shape. To interpolate more variables with the same xp later,
+    use `InterpolationPlan`.
 
     """
-    # Handle units
-    x, xp = _strip_matching_units(x, xp)
-
-    # Make x an array
-    x = np.asanyarray(x).reshape(-1)
-
-    # Sort input data
-    sort_args = np.argsort(xp, axis=axis)
-    sort_x = np.argsort(x)
-
-    # The shape after all arrays are broadcast to each other
-    final_shape = np.broadcast_shapes(xp.shape, *(a.shape for a in args))
-
-    # indices for sorting
-    sorter = broadcast_indices(sort_args, final_shape, axis)
-
-    # sort xp -- need to make sure it's been manually broadcast due to our use of indices
-    # along all axes.
-    xp = np.broadcast_to(xp, final_shape)
-    xp = xp[sorter]
-
-    # Ensure source arrays are also in sorted order
-    variables = [arr[sorter] for arr in args]
-
-    # Make x broadcast with xp
-    x_array = x[sort_x]
-    expand = [np.newaxis] * len(final_shape)
-    expand[axis] = slice(None)
-    x_array = x_array[tuple(expand)]
-
-    # Calculate value above interpolated value
-    minv = np.apply_along_axis(np.searchsorted, axis, xp, x[sort_x])
-    minv2 = np.copy(minv)
-
-    # If fill_value is none and data is out of bounds, raise value error
-    if ((np.max(minv) == xp.shape[axis]) or (np.min(minv) == 0)) and fill_value is None:
-        raise ValueError('Interpolation point out of data bounds encountered')
-
-    # Warn if interpolated values are outside data bounds, will make these the values
-    # at end of data range.
-    if np.max(minv) == xp.shape[axis]:
-        _warnings.warn('Interpolation point out of data bounds encountered')
-        minv2[minv == xp.shape[axis]] = xp.shape[axis] - 1
-    if np.min(minv) == 0:
-        minv2[minv == 0] = 1
-
-    # Get indices for broadcasting arrays
-    above = broadcast_indices(minv2, final_shape, axis)
-    below = broadcast_indices(minv2 - 1, final_shape, axis)
-
-    if np.any(x_array < xp[below]):
-        _warnings.warn('Interpolation point out of data bounds encountered')
-
-    # Create empty output list
-    ret = []
-
-    # Calculate interpolation for each variable
-    for var in variables:
-        # Var needs to be on the *left* of the multiply to ensure that if it's a pint
-        # Quantity, it gets to control the operation--at least until we make sure
-        # masked arrays and pint play together better. See https://github.com/hgrecco/pint#633
-        var_interp = var[below] + (var[above] - var[below]) * ((x_array - xp[below])
-                                                               / (xp[above] - xp[below]))
-
-        # Set points out of bounds to fill value.
-        var_interp[minv == xp.shape[axis]] = fill_value
-        var_interp[x_array < xp[below]] = fill_value
-
-        # Check for input points in decreasing order and return output to match.
-        if x[0] > x[-1]:
-            var_interp = np.swapaxes(np.swapaxes(var_interp, 0, axis)[::-1], 0, axis)
-        # Output to list
-        ret.append(var_interp)
+    ret = InterpolationPlan(x, xp, axis=axis, fill_value=fill_value).interpolate(*args)
 
     if return_list_always or len(ret) > 1:
         return ret
@@ -217,16 +146,192 @@ def log_interpolate_1d(x, xp, *args, axis=0, fill_value=np.nan):
 
     Notes
     -----
-    xp and args must be the same shape.
+    xp and args must be the same shape. To interpolate more variables with the same xp later,
+    use `InterpolationPlan`.
+
+    """
+    ret = InterpolationPlan(x, xp, axis=axis, fill_value=fill_value,
+                            kind='log').interpolate(*args)
+    return ret if len(ret) > 1 else ret[0]
+
+
+@exporter.export
+class InterpolationPlan:
+    r"""Interpolate data with any shape over a specified axis, for repeated use.
+
+    Sorting the x-coordinates of the data and finding the points bracketing each desired
+    value is the expensive part of `interpolate_1d` and `log_interpolate_1d`. This does so
+    once for every column of the data, along with the weights needed to interpolate between
+    the bracketing points, after which any number of variables with the same x-coordinates
+    can be interpolated with a single gather each.
+
+    Parameters
+    ----------
+    x : array-like
+        1-D array of desired interpolated values.
+
+    xp : array-like
+        The x-coordinates of the data points.
+
+    axis : int, optional
+        The axis to interpolate over. Defaults to 0.
+
+    fill_value: float, optional
+        Specify handling of interpolation points out of data bounds. If None, will return
+        ValueError if points are out of bounds. Defaults to nan.
+
+    kind : str, optional
+        Specifies the kind of interpolation in the x coordinate - 'linear' or 'log'. Defaults
+        to 'linear'.
+
+    Examples
+    --------
+     >>> import metpy.interpolate
+     >>> p = np.array([1000., 850., 700., 500.])
+     >>> t = np.array([20., 12., 2., -15.])
+     >>> td = np.array([15., 5., -10., -30.])
+     >>> plan = metpy.interpolate.InterpolationPlan(np.array([925., 600.]), p, kind='log')
+     >>> plan.interpolate(t, td)
+     [array([16.16234039, -5.78834409]), array([ 10.20292549, -19.16275776])]
+
+    Notes
+    -----
+    Variables must have the same shape as xp, or be able to be broadcast to it along with
+    xp, keeping its shape along ``axis``.
+
+    See Also
+    --------
+    interpolate_1d, log_interpolate_1d
 
     """
-    # Handle units
-    x, xp = _strip_matching_units(x, xp)
 
-    # Log x and xp
-    log_x = np.log(x)
-    log_xp = np.log(xp)
-    return interpolate_1d(log_x, log_xp, *args, axis=axis, fill_value=fill_value)
+    def __init__(self, x, xp, axis=0, fill_value=np.nan, kind='linear'):
+        """Find the points bracketing each interpolated value."""
+        # Handle units
+        x, xp = _strip_matching_units(x, xp)
+        if kind == 'log':
+            x = np.log(x)
+            xp = np.log(xp)
+        elif kind != 'linear':
+            raise ValueError(f'Unknown option for kind: {kind}')
+
+        # Make x an array, and make masked values in xp missing so that they sort last
+        x = np.asanyarray(x).reshape(-1)
+        xp = np.asanyarray(xp)
+        if np.ma.isMaskedArray(xp):
+            xp = np.ma.filled(xp.astype(np.float64), np.nan)
+        axis = axis % xp.ndim
+
+        # Sort input data
+        sort_args = np.argsort(xp, axis=axis)
+        sort_x = np.argsort(x)
+        xp = np.take_along_axis(xp, sort_args, axis=axis)
+        x_sorted = x[sort_x]
+
+        # Calculate value above interpolated value
+        minv = _searchsorted(xp, x_sorted, axis)
+        minv2 = np.copy(minv)
+        size = xp.shape[axis]
+
+        # If fill_value is none and data is out of bounds, raise value error
+        if ((np.max(minv) == size) or (np.min(minv) == 0)) and fill_value is None:
+            raise ValueError('Interpolation point out of data bounds encountered')
+
+        # Warn if interpolated values are outside data bounds, will make these the values
+        # at end of data range.
+        if np.max(minv) == size:
+            _warnings.warn('Interpolation point out of data bounds encountered')
+            minv2[minv == size] = size - 1
+        if np.min(minv) == 0:
+            minv2[minv == 0] = 1
+
+        # Make x broadcast with xp
+        expand = [np.newaxis] * xp.ndim
+        expand[axis] = slice(None)
+        x_array = x_sorted[tuple(expand)]
+
+        xp_below = np.take_along_axis(xp, minv2 - 1, axis=axis)
+        xp_above = np.take_along_axis(xp, minv2, axis=axis)
+        if np.any(x_array < xp_below):
+            _warnings.warn('Interpolation point out of data bounds encountered')
+
+        # Points bracketing each value in the original (unsorted) data, along with the weights
+        # between them and the points out of bounds to set to the fill value
+        bounds = np.stack([np.take_along_axis(sort_args, minv2 - 1, axis=axis),
+                           np.take_along_axis(sort_args, minv2, axis=axis)])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = (x_array - xp_below) / (xp_above - xp_below)
+        outside = (minv == size) | (x_array < xp_below)
+
+        # Check for input points in decreasing order and return output to match.
+        if x[0] > x[-1]:
+            bounds, weight, outside = (np.flip(arr, axis=i) for i, arr in
+                                       zip((axis + 1, axis, axis), (bounds, weight, outside)))
+
+        self.fill_value = fill_value
+        self._axis = axis
+        self._shape = xp.shape
+        self._bounds = bounds
+        self._weight = weight
+        self._outside = outside
+        self._gathers = {}
+
+    def _gather_index(self, shape):
+        """Get the flat indices of the bracketing points for data with the given shape."""
+        if shape not in self._gathers:
+            self._gathers[shape] = np.ravel_multi_index(
+                broadcast_indices(self._bounds, (1,) + shape, self._axis + 1)[1:], shape)
+        return self._gathers[shape]
+
+    def interpolate(self, *args):
+        """Interpolate variables to the desired values.
+
+        Parameters
+        ----------
+        args : array-like
+            The data to be interpolated, each with the same x-coordinates as the plan.
+
+        Returns
+        -------
+        list
+            Interpolated values of each variable, for each point with coordinates sorted in
+            ascending order.
+
+        """
+        ret = []
+        for var in args:
+            shape = np.broadcast_shapes(self._shape, np.shape(var))
+            if np.shape(var) != shape:
+                var = np.broadcast_to(var, shape)
+
+            # Gather both bracketing points at once. Var needs to be on the *left* of the
+            # multiply to ensure that if it's a pint Quantity, it gets to control the
+            # operation--at least until we make sure masked arrays and pint play together
+            # better. See https://github.com/hgrecco/pint#633
+            below, above = var.reshape(-1)[self._gather_index(shape)]
+            var_interp = below + (above - below) * self._weight
+
+            # Set points out of bounds to fill value.
+            var_interp[np.broadcast_to(self._outside, var_interp.shape)] = self.fill_value
+            ret.append(var_interp)
+        return ret
+
+
+def _searchsorted(a, v, axis):
+    """Find where sorted values would be inserted into every sorted column of an array.
+
+    This is `numpy.searchsorted` (with ``side='left'``) along ``axis``, using a single sort of
+    the values merged into every column.
+    """
+    a = np.moveaxis(a, axis, -1)
+    merged = np.concatenate([np.broadcast_to(v, a.shape[:-1] + v.shape), a], axis=-1)
+
+    # With a stable sort, each value is placed before any equal points; its position in the
+    # merged column, less the number of values before it, is the number of points before it.
+    order = np.argsort(merged, axis=-1, kind='stable')
+    position = np.empty_like(order)
+    np.put_along_axis(position, order, np.arange(merged.shape[-1]), axis=-1)
+    return np.moveaxis(position[..., :v.size] - np.arange(v.size), -1, axis)
 
 
 def _strip_matching_units(*args):
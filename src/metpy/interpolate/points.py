@@ -3,12 +3,16 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Interpolate data valid at one set of points to another in multiple dimensions."""
 
+from concurrent.futures import ThreadPoolExecutor
 import functools
+from itertools import chain, combinations_with_replacement, compress
 import logging
 
 import numpy as np
-from scipy.interpolate import griddata, Rbf
+from scipy import sparse
+from scipy.interpolate import griddata, Rbf, RBFInterpolator
 from scipy.spatial import cKDTree, ConvexHull, Delaunay, QhullError
+from scipy.special import xlogy
 
 from . import geometry, tools
 from ..package_tools import Exporter
@@ -168,6 +172,100 @@ def natural_neighbor_point(xp, yp, variable, grid_loc, tri, neighbors, circumcen
     return sum(x / total_area for x in area_list)
 
 
+def _natural_neighbor_weights(tri, xi):
+    r"""Calculate the natural neighbor weights of the triangulated points for every point.
+
+    This is the same as `natural_neighbor_point` for all of the points at once. The natural
+    neighbor triangles of each point form a cavity, and the area each vertex on its boundary
+    loses to the point is that of the convex polygon formed by the circumcenters of the
+    vertex's triangles in the cavity and of the two new triangles formed with the point.
+
+    Returns
+    -------
+    weights: `scipy.sparse.csr_matrix`, (M, N)
+        Weight of each point in the triangulation for each point in `xi`
+    valid: numpy.ndarray, (M,)
+        Boolean array of the points that could be interpolated
+
+    """
+    xi = np.asarray(xi, dtype=float)
+    grid, triangles, circumcenters = geometry.find_natural_neighbor_triangles(tri, xi)
+    simplices = tri.simplices[triangles]
+    valid = np.zeros(len(xi), dtype=bool)
+    if not len(grid):
+        return sparse.csr_matrix((len(xi), tri.npoints)), valid
+
+    # Edges run counterclockwise from each vertex of the triangles to the next. Those across
+    # from another natural neighbor triangle of the same point are inside the cavity, leaving
+    # the boundary edges in counterclockwise order.
+    num_tri = len(tri.simplices)
+    keys = grid * num_tri + triangles
+    across = tri.neighbors[triangles][:, [2, 0, 1]]
+    across_keys = grid[:, None] * num_tri + across
+    found = keys[np.searchsorted(keys, across_keys).clip(max=len(keys) - 1)]
+    boundary = (across < 0) | (found != across_keys)
+    edge_grid = np.broadcast_to(grid[:, None], boundary.shape)[boundary]
+    edge_start = simplices[boundary]
+    edge_end = simplices[:, [1, 2, 0]][boundary]
+
+    # Each boundary vertex has one edge leaving and one arriving, which gives the vertices on
+    # either side of it
+    leaving = np.lexsort((edge_start, edge_grid))
+    arriving = np.lexsort((edge_end, edge_grid))
+    point = edge_grid[leaving]
+    vertex = edge_start[leaving]
+    following = edge_end[leaving]
+    preceding = edge_start[arriving]
+    bad = (edge_end[arriving] != vertex) | (edge_grid[arriving] != point)
+
+    # Gather the circumcenters making up the polygon for each boundary vertex: those of the
+    # new triangles with the vertices on either side, and of the cavity triangles containing
+    # the vertex.
+    new_triangles = np.stack([np.stack([xi[point], tri.points[preceding], tri.points[vertex]],
+                                       axis=1),
+                              np.stack([xi[point], tri.points[following], tri.points[vertex]],
+                                       axis=1)])
+    new_centers, _ = geometry.circumcircles(new_triangles.reshape(-1, 3, 2))
+
+    vertex_keys = point * tri.npoints + vertex
+    corner_keys = (grid[:, None] * tri.npoints + simplices).ravel()
+    corner = np.searchsorted(vertex_keys, corner_keys).clip(max=len(vertex_keys) - 1)
+    corner_found = vertex_keys[corner] == corner_keys
+
+    group = np.concatenate([np.tile(np.arange(len(vertex)), 2), corner[corner_found]])
+    polygon = np.concatenate([new_centers,
+                              np.repeat(circumcenters[triangles], 3, axis=0)[corner_found]])
+
+    # Find the areas by ordering the points in each (convex) polygon by angle about its mean
+    num_vertices = np.bincount(group, minlength=len(vertex))
+    polygon -= np.stack([np.bincount(group, weights=polygon[:, i], minlength=len(vertex))
+                         for i in range(2)], axis=1)[group] / num_vertices[group, None]
+    order = np.lexsort((np.arctan2(polygon[:, 1], polygon[:, 0]), group))
+    polygon = polygon[order]
+    group = group[order]
+    following_point = np.arange(1, len(group) + 1)
+    following_point[np.cumsum(num_vertices) - 1] = np.cumsum(num_vertices) - num_vertices
+    cross = (polygon[:, 0] * polygon[following_point, 1]
+             - polygon[following_point, 0] * polygon[:, 1])
+    areas = np.abs(np.bincount(group, weights=cross, minlength=len(vertex))) / 2
+
+    # Points with degenerate polygons cannot be interpolated
+    bad |= ~np.isfinite(areas) | (areas == 0)
+    failed = np.unique(point[bad])
+    if len(failed):
+        log.warning('Error during processing of a grid. Interpolation will continue but be '
+                    'mindful of errors in output. Unable to find natural neighbor weights for '
+                    '%d points.', len(failed))
+    keep = ~np.isin(point, failed)
+    point = point[keep]
+    vertex = vertex[keep]
+    areas = areas[keep]
+
+    valid[point] = True
+    weights = areas / np.bincount(point, weights=areas, minlength=len(xi))[point]
+    return sparse.csr_matrix((weights, (point, vertex)), shape=(len(xi), tri.npoints)), valid
+
+
 @exporter.export
 def natural_neighbor_to_points(points, values, xi):
     r"""Generate a natural neighbor interpolation to the given points.
@@ -194,8 +292,7 @@ def natural_neighbor_to_points(points, values, xi):
     natural_neighbor_to_grid
 
     """
-    tri = Delaunay(points)
-    members, circumcenters = geometry.find_natural_neighbors(tri, xi)
+    weights, valid = _natural_neighbor_weights(Delaunay(points), np.asarray(xi))
 
     if hasattr(values, 'units'):
         org_units = values.units
@@ -203,10 +300,8 @@ def natural_neighbor_to_points(points, values, xi):
     else:
         org_units = None
 
-    img = np.asarray([natural_neighbor_point(*np.array(points).transpose(),
-                                             values, xi[grid], tri, neighbors, circumcenters)
-                      if len(neighbors) > 0 else np.nan
-                      for grid, neighbors in members.items()])
+    img = weights @ np.asarray(values)
+    img[~valid] = np.nan
 
     if org_units:
         img = units.Quantity(img, org_units)
@@ -253,15 +348,414 @@ def inverse_distance_to_points(points, values, xi, r, gamma=None, kappa=None, mi
     inverse_distance_to_grid
 
     """
+    weights, valid = _inverse_distance_weights(points, xi, r, gamma=gamma, kappa=kappa,
+                                               min_neighbors=min_neighbors, kind=kind)
+
+    if hasattr(values, 'units'):
+        org_units = values.units
+        values = values.magnitude
+    else:
+        org_units = None
+
+    img = weights @ np.asarray(values)
+    img[~valid] = np.nan
+
+    if org_units:
+        img = units.Quantity(img, org_units)
+
+    return img
+
+
+def _inverse_distance_weights(points, xi, r, gamma=None, kappa=None, min_neighbors=3,
+                              kind='cressman'):
+    r"""Calculate the inverse distance weights of the data points for every point in `xi`.
+
+    The weights of the data points within ``r`` of each point are found from their squared
+    distances just as in `cressman_point` or `barnes_point` and normalized, giving the
+    interpolated values as a product of the weights and the data values. Points with fewer
+    than ``min_neighbors`` data points within ``r`` are returned as invalid, with no weights.
+
+    Returns
+    -------
+    weights: `scipy.sparse.csr_matrix`, (M, N)
+        Weight of each data point for each point in `xi`
+    valid: numpy.ndarray, (M,)
+        Boolean array of the points with enough data points to be interpolated
+
+    """
+    sq_dist, valid = _neighbor_distances(cKDTree(points), xi, r, min_neighbors)
+    return _normalized_weights(sq_dist, _weight_function(r, gamma, kappa, kind)), valid
+
+
+def _weight_function(r, gamma, kappa, kind):
+    """Return the function calculating the weights from squared distances for ``kind``."""
     if kind == 'cressman':
-        interp_func = functools.partial(cressman_point, radius=r)
+        return functools.partial(tools.cressman_weights, r=r)
     elif kind == 'barnes':
-        interp_func = functools.partial(barnes_point, kappa=kappa, gamma=gamma)
+        return functools.partial(tools.barnes_weights, kappa=kappa,
+                                 gamma=1 if gamma is None else gamma)
     else:
         raise ValueError(f'{kind} interpolation not supported.')
 
-    obs_tree = cKDTree(points)
+
+def _neighbor_distances(obs_tree, xi, r, min_neighbors):
+    r"""Find the squared distances to the data points within ``r`` of every point in `xi`.
+
+    Returns
+    -------
+    sq_dist: `scipy.sparse.csr_matrix`, (M, N)
+        Squared distance to each data point within ``r`` for each point in `xi`, stored even
+        where zero
+    valid: numpy.ndarray, (M,)
+        Boolean array of the points with at least ``min_neighbors`` data points within ``r``,
+        which are the only rows with any distances
+
+    """
+    xi = np.asarray(xi, dtype=float).reshape(-1, obs_tree.m)
+
+    # Gather the neighbors of all the points with enough of them into one flat array, with
+    # every point's neighbors in the same order as the tree returns them.
     indices = obs_tree.query_ball_point(xi, r=r)
+    counts = np.fromiter(map(len, indices), dtype=np.intp, count=len(indices))
+    valid = counts >= min_neighbors
+    counts[~valid] = 0
+    rows = np.repeat(np.arange(len(counts)), counts)
+    cols = np.fromiter(chain.from_iterable(compress(indices, valid)), dtype=np.intp,
+                       count=counts.sum())
+
+    sq_dist = np.sum((xi[rows] - obs_tree.data[cols]) ** 2, axis=1)
+    indptr = np.zeros(len(counts) + 1, dtype=np.intp)
+    np.cumsum(counts, out=indptr[1:])
+    return sparse.csr_matrix((sq_dist, cols, indptr), shape=(len(counts), obs_tree.n)), valid
+
+
+def _normalized_weights(sq_dist, weight_func):
+    """Calculate weights from a sparse matrix of squared distances, normalizing each row."""
+    rows = np.repeat(np.arange(sq_dist.shape[0]), np.diff(sq_dist.indptr))
+    weights = weight_func(sq_dist.data)
+    weights /= np.bincount(rows, weights=weights, minlength=sq_dist.shape[0])[rows]
+    return sparse.csr_matrix((weights, sq_dist.indices, sq_dist.indptr), shape=sq_dist.shape)
+
+
+@exporter.export
+def barnes_to_points(points, values, xi, r, kappa, gamma=0.3, passes=2, min_neighbors=3):
+    r"""Generate a multi-pass Barnes analysis at the given points.
+
+    The first pass is a Barnes interpolation of the data with response parameter ``kappa``.
+    Each subsequent pass corrects the analysis with a Barnes interpolation of the differences
+    between the data and the analysis at the data points, using the response parameter
+    ``gamma * kappa`` [Barnes1964]_. This follows [Koch1983]_.
+
+    Parameters
+    ----------
+    points: array-like, (N, 2)
+        Coordinates of the data points.
+    values: array-like, (N, ...)
+        Values of the data points. Any dimensions after the first, such as several variables
+        or times, are analyzed together.
+    xi: array-like, (M, 2)
+        Points to interpolate the data onto.
+    r: float
+        Radius from grid center, within which observations are considered and weighted.
+    kappa: float
+        Response parameter for the first pass of the analysis.
+    gamma: float
+        Adjustable smoothing parameter for the correction passes. Default 0.3.
+    passes: int
+        Total number of passes of the analysis. Default 2.
+    min_neighbors: int
+        Minimum number of neighbors needed to analyze a point. Default is 3.
+
+    Returns
+    -------
+    img: numpy.ndarray, (M, ...)
+        Array representing the analyzed values for each input point in `xi`
+
+    See Also
+    --------
+    barnes_to_grid, inverse_distance_to_points
+
+    Notes
+    -----
+    The neighbors of the points and of the data points themselves are found once and reused
+    for each pass. The analysis at the data points uses every data point within ``r``,
+    regardless of ``min_neighbors``, since each data point is its own neighbor.
+
+    """
+    if passes < 1:
+        raise ValueError(f'At least one pass is needed for Barnes analysis, not {passes}.')
+
+    obs_tree = cKDTree(points)
+    grid_dist, valid = _neighbor_distances(obs_tree, xi, r, min_neighbors)
+    obs_dist, _ = _neighbor_distances(obs_tree, obs_tree.data, r, 1)
+
+    if hasattr(values, 'units'):
+        org_units = values.units
+        values = values.magnitude
+    else:
+        org_units = None
+
+    values = np.asarray(values)
+    shape = values.shape
+    values = values.reshape(shape[0], -1)
+
+    # Interpolate the data and then the residuals at the data points on each pass
+    residual = values
+    img = np.zeros((grid_dist.shape[0], values.shape[1]))
+    obs_analysis = np.zeros(values.shape)
+    for i in range(passes):
+        weight_func = functools.partial(tools.barnes_weights, kappa=kappa,
+                                        gamma=1 if i == 0 else gamma)
+        img += _normalized_weights(grid_dist, weight_func) @ residual
+        if i < passes - 1:
+            obs_analysis += _normalized_weights(obs_dist, weight_func) @ residual
+            residual = values - obs_analysis
+    img[~valid] = np.nan
+
+    img = img.reshape(img.shape[:1] + shape[1:])
+    if org_units:
+        img = units.Quantity(img, org_units)
+
+    return img
+
+
+@exporter.export
+def inverse_distance_to_isobaric_points(points, pressure, values, xi, levels, r,
+                                        vertical_radius, gamma=None, kappa=None,
+                                        min_neighbors=3, kind='cressman', workers=1):
+    r"""Generate an inverse distance interpolation in three dimensions to isobaric levels.
+
+    Observations scattered in the horizontal and in pressure, such as from soundings or
+    aircraft, are weighted by their distances from each point on every level, based on either
+    [Cressman1959]_ or [Barnes1964]_ as in `inverse_distance_to_points`. The vertical
+    distance is the difference in the natural logarithm of pressure, scaled so that
+    ``vertical_radius`` corresponds to the horizontal radius ``r``.
+
+    Parameters
+    ----------
+    points: array-like, (N, 2)
+        Horizontal coordinates of the observations.
+    pressure: array-like, (N,)
+        Pressure of the observations.
+    values: array-like, (N, ...)
+        Values of the observations. Any dimensions after the first, such as several
+        variables, are interpolated together.
+    xi: array-like, (M, 2)
+        Horizontal coordinates of the points to interpolate to on every level.
+    levels: array-like, (L,)
+        Pressure levels to interpolate to, in the same units as ``pressure`` if not a
+        `pint.Quantity`.
+    r: float
+        Radius from each point, within which observations are considered and weighted.
+    vertical_radius: float
+        Difference in the natural logarithm of pressure equivalent to ``r``, giving the
+        vertical extent of the region within which observations are considered.
+    gamma: float
+        Adjustable smoothing parameter for the barnes interpolation. Default None.
+    kappa: float
+        Response parameter for barnes interpolation, in terms of horizontal distance.
+        Default None.
+    min_neighbors: int
+        Minimum number of neighbors needed to perform barnes or cressman interpolation
+        for a point. Default is 3.
+    kind: str
+        Specify what inverse distance weighting interpolation to use.
+        Options: 'cressman' or 'barnes'. Default 'cressman'
+    workers: int
+        Number of threads used to interpolate the levels. Default 1.
+
+    Returns
+    -------
+    img: numpy.ndarray, (L, M, ...)
+        Array representing the interpolated values for each point in `xi` on each level
+
+    See Also
+    --------
+    inverse_distance_to_points, inverse_distance_to_isobaric_grid
+
+    Notes
+    -----
+    The observations are kept in a single three-dimensional tree searched for every level.
+    Observations with missing values are left out of the weighting of each variable, though
+    they still count toward ``min_neighbors``.
+
+    """
+    weight_func = _weight_function(r, gamma, kappa, kind)
+
+    if hasattr(pressure, 'units'):
+        levels = units.Quantity(levels, pressure.units).m_as(pressure.units)
+        pressure = pressure.magnitude
+    if hasattr(values, 'units'):
+        org_units = values.units
+        values = values.magnitude
+    else:
+        org_units = None
+
+    values = np.asarray(values, dtype=float)
+    shape = values.shape
+    values = values.reshape(shape[0], -1)
+    present = ~np.isnan(values)
+    values = np.where(present, values, 0)
+
+    # Scale the log of pressure so that distances are the same in every direction
+    scale = r / vertical_radius
+    obs_tree = cKDTree(np.column_stack([np.asarray(points, dtype=float).reshape(-1, 2),
+                                        scale * np.log(np.asarray(pressure, dtype=float))]))
+    xi = np.asarray(xi, dtype=float).reshape(-1, 2)
+
+    def interpolate_level(level):
+        level_xi = np.column_stack([xi, np.full(len(xi), scale * np.log(level))])
+        sq_dist, valid = _neighbor_distances(obs_tree, level_xi, r, min_neighbors)
+        weights = _normalized_weights(sq_dist, weight_func)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            img = (weights @ values) / (weights @ present.astype(float))
+        img[~valid] = np.nan
+        return img
+
+    levels = np.atleast_1d(np.asarray(levels, dtype=float))
+    if workers == 1:
+        img = list(map(interpolate_level, levels))
+    else:
+        with ThreadPoolExecutor(workers) as executor:
+            img = list(executor.map(interpolate_level, levels))
+    img = np.stack(img).reshape((len(levels), len(xi)) + shape[1:])
+
+    if org_units:
+        img = units.Quantity(img, org_units)
+
+    return img
+
+
+#: Radial basis functions of the scaled distance, as in `scipy.interpolate.RBFInterpolator`
+_rbf_kernels = {
+    'linear': lambda r: -r,
+    'thin_plate_spline': lambda r: xlogy(r ** 2, r),
+    'cubic': lambda r: r ** 3,
+    'quintic': lambda r: -r ** 5,
+    'multiquadric': lambda r: -np.sqrt(r ** 2 + 1),
+    'inverse_multiquadric': lambda r: 1 / np.sqrt(r ** 2 + 1),
+    'inverse_quadratic': lambda r: 1 / (r ** 2 + 1),
+    'gaussian': lambda r: np.exp(-r ** 2)
+}
+
+#: Minimum degree of the polynomial added to the conditionally positive definite kernels
+_rbf_min_degree = {'linear': 0, 'thin_plate_spline': 1, 'cubic': 1, 'quintic': 2,
+                   'multiquadric': 0}
+
+#: Names of `scipy.interpolate.Rbf` functions that differ for `RBFInterpolator`
+_rbf_names = {'inverse': 'inverse_multiquadric', 'thin_plate': 'thin_plate_spline'}
+
+
+def _pairwise_distances(a, b):
+    """Calculate the distances between each of the points in ``a`` and in ``b``."""
+    return np.sqrt(sum((a[..., :, None, i] - b[..., None, :, i]) ** 2
+                       for i in range(a.shape[-1])))
+
+
+def _local_rbf(points, values, xi, neighbors, kernel, epsilon, smoothing, powers):
+    """Interpolate with the radial basis function system of each point's neighbors.
+
+    The systems for all points in ``xi`` are built and solved together, so the memory used
+    grows with the number of points times the square of the number of neighbors.
+    """
+    kernel = _rbf_kernels[kernel]
+    nbrs = points[neighbors]
+
+    # Center and scale the polynomial terms for each neighborhood to condition the system
+    center = nbrs.mean(axis=1, keepdims=True)
+    scale = np.ptp(nbrs, axis=1).max(axis=-1)[:, None, None]
+    scale[scale == 0] = 1
+    poly = np.prod(((nbrs - center) / scale)[..., None, :] ** powers, axis=-1)
+    xi_poly = np.prod(((xi[:, None] - center) / scale)[..., None, :] ** powers, axis=-1)
+
+    # Solve the interpolation system, with the polynomial terms constrained, for each point
+    num_nbrs = neighbors.shape[1]
+    lhs = np.zeros((len(xi), num_nbrs + len(powers), num_nbrs + len(powers)))
+    lhs[:, :num_nbrs, :num_nbrs] = kernel(
+        epsilon * _pairwise_distances(nbrs, nbrs))
+    lhs[:, range(num_nbrs), range(num_nbrs)] += smoothing
+    lhs[:, :num_nbrs, num_nbrs:] = poly
+    lhs[:, num_nbrs:, :num_nbrs] = poly.transpose(0, 2, 1)
+    rhs = np.zeros((len(xi), lhs.shape[1], values.shape[1]))
+    rhs[:, :num_nbrs] = values[neighbors]
+    coeffs = np.linalg.solve(lhs, rhs)
+
+    vec = np.concatenate([kernel(epsilon * _pairwise_distances(xi[:, None], nbrs))[:, 0],
+                          xi_poly[:, 0]], axis=-1)
+    return np.einsum('ij,ijk->ik', vec, coeffs)
+
+
+@exporter.export
+def rbf_to_points(points, values, xi, kernel='linear', neighbors=None, smoothing=0,
+                  epsilon=None, tile_size=4096, workers=1):
+    r"""Generate a radial basis function interpolation at the given points.
+
+    Unlike `scipy.interpolate.Rbf`, this can limit the interpolation at each point to its
+    nearest data points, which avoids solving a dense system for all of the data. The
+    interpolation is evaluated on tiles of ``xi`` to bound the memory used.
+
+    Parameters
+    ----------
+    points: array-like, (N, P)
+        Coordinates of the data points.
+    values: array-like, (N, ...)
+        Values of the data points. Any dimensions after the first, such as several variables
+        or times, are interpolated together.
+    xi: array-like, (M, P)
+        Points to interpolate the data onto.
+    kernel: str
+        Radial basis function to use. Options are 'linear', 'thin_plate_spline', 'cubic',
+        'quintic', 'multiquadric', 'inverse_multiquadric', 'inverse_quadratic', and
+        'gaussian', as well as the `scipy.interpolate.Rbf` names 'inverse' and 'thin_plate'.
+        Default 'linear'.
+    neighbors: int, optional
+        Number of nearest data points used to interpolate each point. Defaults to using all
+        of the data points.
+    smoothing: float
+        Smoothing parameter for the interpolation. Default 0, an exact interpolation.
+    epsilon: float, optional
+        Shape parameter that scales the distances given to the kernel. Defaults to the
+        inverse of the average spacing of the data points for the kernels that need one,
+        otherwise 1.
+    tile_size: int
+        Number of points in ``xi`` to interpolate at a time. Default 4096.
+    workers: int
+        Number of threads used to interpolate the tiles. Default 1.
+
+    Returns
+    -------
+    img: numpy.ndarray, (M, ...)
+        Array representing the interpolated values for each input point in `xi`
+
+    See Also
+    --------
+    interpolate_to_points
+
+    Notes
+    -----
+    The kernels and added polynomial, whose degree is the minimum one needed for the kernel,
+    follow `scipy.interpolate.RBFInterpolator`, which is used directly when interpolating
+    with all of the data points. The results therefore differ from those of
+    `scipy.interpolate.Rbf`.
+
+    With ``neighbors``, the systems for all of the points in a tile are solved together, so
+    the memory used grows with ``tile_size`` times the square of ``neighbors``.
+
+    """
+    kernel = _rbf_names.get(kernel, kernel)
+    if kernel not in _rbf_kernels:
+        raise ValueError(f'RBF kernel {kernel} not available. '
+                         f'Try: {", ".join(_rbf_kernels)}')
+
+    points = np.asarray(points, dtype=float)
+    xi = np.asarray(xi, dtype=float)
+    if epsilon is None:
+        if kernel in ('linear', 'thin_plate_spline', 'cubic', 'quintic'):
+            epsilon = 1
+        else:
+            edges = np.ptp(points, axis=0)
+            edges = edges[edges > 0]
+            epsilon = (len(points) / np.prod(edges)) ** (1 / max(len(edges), 1))
 
     if hasattr(values, 'units'):
         org_units = values.units
@@ -269,10 +763,39 @@ def inverse_distance_to_points(points, values, xi, r, gamma=None, kappa=None, mi
     else:
         org_units = None
 
-    img = np.asarray([interp_func(geometry.dist_2(*grid, *obs_tree.data[matches].T),
-                                  values[matches]) if len(matches) >= min_neighbors else np.nan
-                      for matches, grid in zip(indices, xi)])
+    values = np.asarray(values, dtype=float)
+    shape = values.shape
+    values = values.reshape(shape[0], -1)
 
+    if neighbors is None:
+        interpolate_tile = RBFInterpolator(points, values, smoothing=smoothing, kernel=kernel,
+                                           epsilon=epsilon)
+    else:
+        powers = np.array([np.bincount(mono, minlength=points.shape[1])
+                           for degree in range(max(_rbf_min_degree.get(kernel, 0), 0) + 1)
+                           for mono in combinations_with_replacement(range(points.shape[1]),
+                                                                     degree)],
+                          dtype=int).reshape(-1, points.shape[1])
+        neighbors = min(neighbors, len(points))
+        if neighbors < len(powers):
+            raise ValueError(f'At least {len(powers)} neighbors are needed for the {kernel} '
+                             'kernel.')
+        obs_tree = cKDTree(points)
+
+        def interpolate_tile(tile):
+            _, nbrs = obs_tree.query(tile, k=neighbors)
+            return _local_rbf(points, values, tile, nbrs.reshape(len(tile), neighbors),
+                              kernel, epsilon, smoothing, powers)
+
+    tiles = [xi[i:i + tile_size] for i in range(0, len(xi), tile_size)]
+    if workers == 1 or len(tiles) < 2:
+        img = [interpolate_tile(tile) for tile in tiles]
+    else:
+        with ThreadPoolExecutor(workers) as executor:
+            img = list(executor.map(interpolate_tile, tiles))
+    img = np.concatenate(img) if img else np.empty((0, values.shape[1]))
+
+    img = img.reshape(img.shape[:1] + shape[1:])
     if org_units:
         img = units.Quantity(img, org_units)
 
@@ -282,7 +805,7 @@ def inverse_distance_to_points(points, values, xi, r, gamma=None, kappa=None, mi
 @exporter.export
 def interpolate_to_points(points, values, xi, interp_type='linear', minimum_neighbors=3,
                           gamma=0.25, kappa_star=5.052, search_radius=None, rbf_func='linear',
-                          rbf_smooth=0):
+                          rbf_smooth=0, rbf_neighbors=None):
     r"""Interpolate unstructured point data to the given points.
 
     This function interpolates the given `values` valid at ``points`` to the points `xi`.
@@ -329,6 +852,10 @@ def interpolate_to_points(points, values, xi, interp_type='linear', minimum_neig
         information.
     rbf_smooth: float
         Smoothing value applied to rbf interpolation.  Higher values result in more smoothing.
+    rbf_neighbors: int, optional
+        Number of nearest observations used for each point in rbf interpolation. If given,
+        the interpolation is done with `rbf_to_points`, which scales to large numbers of
+        observations. Defaults to using `scipy.interpolate.Rbf` with all observations.
 
     Returns
     -------
@@ -383,6 +910,10 @@ def interpolate_to_points(points, values, xi, interp_type='linear', minimum_neig
 
     # If this is radial basis function, make the interpolator and apply it
     elif interp_type == 'rbf':
+        if rbf_neighbors is not None:
+            return rbf_to_points(points, values, xi, kernel=rbf_func, neighbors=rbf_neighbors,
+                                 smoothing=rbf_smooth)
+
         points_transposed = np.array(points).transpose()
         xi_transposed = np.array(xi).transpose()
 
@@ -405,3 +936,225 @@ def interpolate_to_points(points, values, xi, interp_type='linear', minimum_neig
         raise ValueError(f'Interpolation option {interp_type} not available. '
                          'Try: linear, nearest, cubic, natural_neighbor, '
                          'barnes, cressman, rbf')
+
+
+def _linear_weights(tri, xi):
+    r"""Calculate the linear (barycentric) weights of the triangulated points for every point.
+
+    Returns
+    -------
+    weights: `scipy.sparse.csr_matrix`, (M, N)
+        Weight of each point in the triangulation for each point in `xi`
+    valid: numpy.ndarray, (M,)
+        Boolean array of the points within the triangulation
+
+    """
+    simplex = tri.find_simplex(xi)
+    valid = simplex >= 0
+    simplex = simplex[valid]
+
+    transform = tri.transform[simplex]
+    bary = np.einsum('mij,mj->mi', transform[:, :tri.ndim],
+                     xi[valid] - transform[:, tri.ndim])
+    bary = np.column_stack([bary, 1 - bary.sum(axis=1)])
+
+    rows = np.repeat(np.flatnonzero(valid), tri.ndim + 1)
+    return sparse.csr_matrix((bary.ravel(), (rows, tri.simplices[simplex].ravel())),
+                             shape=(len(xi), tri.npoints)), valid
+
+
+@exporter.export
+class Interpolator:
+    r"""Interpolate data valid at one fixed set of points to another, for repeated use.
+
+    Finding the neighbors of each interpolation point and the weights to give them, whether
+    through a KD-tree, Delaunay triangulation, or radial basis function, is the expensive part
+    of `interpolate_to_points`, yet depends only on the locations of the data. This calculates
+    the weights once as a matrix, after which any number of variables or times valid at the
+    same points can be interpolated with a single matrix multiplication each.
+
+    Parameters
+    ----------
+    points: array-like, (N, P)
+        Coordinates of the data points.
+    xi: array-like, (M, P)
+        Points to interpolate the data onto.
+    interp_type: str
+        What type of interpolation to use. Available options include "linear", "nearest",
+        "natural_neighbor", "barnes", "cressman", or "rbf". Default "linear".
+    minimum_neighbors: int
+        Minimum number of neighbors needed to perform Barnes or Cressman interpolation for a
+        point. Default is 3.
+    gamma: float
+        Adjustable smoothing parameter for the barnes interpolation. Default 0.25.
+    kappa_star: float
+        Response parameter for barnes interpolation, specified non-dimensionally
+        in terms of the Nyquist. Default 5.052.
+    search_radius: float
+        A search radius to use for the Barnes and Cressman interpolation schemes.
+        If search_radius is not specified, it will default to 5 times the average spacing of
+        observations.
+    rbf_func: str
+        Specifies which function to use for Rbf interpolation.
+        Options include: 'multiquadric', 'inverse', 'gaussian', 'linear', 'cubic',
+        'quintic', and 'thin_plate'. Default 'linear'. See `scipy.interpolate.Rbf` for more
+        information.
+    rbf_smooth: float
+        Smoothing value applied to rbf interpolation.  Higher values result in more smoothing.
+
+    Attributes
+    ----------
+    weights: `scipy.sparse.csr_matrix` or numpy.ndarray, (M, N)
+        Weight of each data point for each point in `xi`. This is dense for "rbf", where
+        every data point contributes to every interpolated point.
+    valid: numpy.ndarray, (M,)
+        Boolean array of the points in `xi` that can be interpolated, such as those within
+        the convex hull of the data for "linear" and "natural_neighbor".
+
+    Examples
+    --------
+     >>> import metpy.interpolate
+     >>> points = np.array([[0., 0.], [1., 0.], [0., 1.], [1., 1.]])
+     >>> interp = metpy.interpolate.Interpolator(points, np.array([[0.5, 0.25], [2., 2.]]))
+     >>> interp.interpolate(np.array([[1., 2., 3., 4.], [0., 0., 1., 1.]]).T)
+     [array([[2.  , 0.25],
+            [ nan,  nan]])]
+
+    Notes
+    -----
+    The data for each variable are expected to have the points along ``axis``, with any
+    other dimensions (e.g. time) interpolated together. A missing value in the data makes
+    every interpolated point that depends on it missing.
+
+    Linear interpolation is the same as `scipy.interpolate.griddata`, though cubic
+    interpolation is not available since it is not a fixed weighting of the data.
+
+    The weights can be saved with `save` and later restored with `load`, to avoid
+    recalculating them for a fixed network of observations.
+
+    See Also
+    --------
+    interpolate_to_points
+
+    """
+
+    def __init__(self, points, xi, interp_type='linear', minimum_neighbors=3, gamma=0.25,
+                 kappa_star=5.052, search_radius=None, rbf_func='linear', rbf_smooth=0):
+        """Calculate the weights of the data points for every interpolated point."""
+        points = np.asarray(points, dtype=float)
+        xi = np.asarray(xi, dtype=float)
+
+        if interp_type == 'linear':
+            self.weights, self.valid = _linear_weights(Delaunay(points), xi)
+        elif interp_type == 'nearest':
+            _, nearest = cKDTree(points).query(xi)
+            self.weights = sparse.csr_matrix((np.ones(len(xi)), nearest,
+                                              np.arange(len(xi) + 1)),
+                                             shape=(len(xi), len(points)))
+            self.valid = np.ones(len(xi), dtype=bool)
+        elif interp_type == 'natural_neighbor':
+            self.weights, self.valid = _natural_neighbor_weights(Delaunay(points), xi)
+        elif interp_type in ['cressman', 'barnes']:
+            ave_spacing = tools.average_spacing(points)
+            if search_radius is None:
+                search_radius = 5 * ave_spacing
+
+            kappa = tools.calc_kappa(ave_spacing, kappa_star)
+            self.weights, self.valid = _inverse_distance_weights(
+                points, xi, search_radius, gamma, kappa, min_neighbors=minimum_neighbors,
+                kind=interp_type)
+        elif interp_type == 'rbf':
+            # Interpolating the identity matrix gives the weight of each point
+            rbfi = Rbf(*points.T, np.eye(len(points)), function=rbf_func, smooth=rbf_smooth,
+                       mode='N-D')
+            self.weights = rbfi(*xi.T)
+            self.valid = np.ones(len(xi), dtype=bool)
+        else:
+            raise ValueError(f'Interpolation option {interp_type} not available. '
+                             'Try: linear, nearest, natural_neighbor, barnes, cressman, rbf')
+
+    def interpolate(self, *args, axis=0):
+        """Interpolate variables to the points.
+
+        Parameters
+        ----------
+        args : array-like
+            The data to be interpolated, each valid at the data points along ``axis``.
+        axis : int, optional
+            The axis of the data corresponding to the data points. Defaults to 0.
+
+        Returns
+        -------
+        list
+            Interpolated values of each variable, with the interpolated points along ``axis``.
+
+        """
+        ret = []
+        for values in args:
+            if hasattr(values, 'units'):
+                org_units = values.units
+                values = values.magnitude
+            else:
+                org_units = None
+
+            values = np.moveaxis(np.ma.filled(np.ma.asarray(values, dtype=float), np.nan),
+                                 axis, 0)
+            shape = values.shape
+            values = values.reshape(shape[0], -1)
+
+            # Missing data contribute nothing, then make everything depending on them missing
+            missing = np.isnan(values)
+            img = np.asarray(self.weights @ np.where(missing, 0, values))
+            if missing.any():
+                img[abs(self.weights) @ missing > 0] = np.nan
+            img[~self.valid] = np.nan
+
+            img = np.moveaxis(img.reshape(img.shape[:1] + shape[1:]), 0, axis)
+            if org_units:
+                img = units.Quantity(img, org_units)
+            ret.append(img)
+        return ret
+
+    def save(self, file):
+        """Save the interpolation weights to a file.
+
+        Parameters
+        ----------
+        file : str or file-like object
+            File to write, in the `numpy` ``.npz`` format.
+
+        See Also
+        --------
+        load
+
+        """
+        if sparse.issparse(self.weights):
+            np.savez(file, valid=self.valid, data=self.weights.data,
+                     indices=self.weights.indices, indptr=self.weights.indptr,
+                     shape=self.weights.shape)
+        else:
+            np.savez(file, valid=self.valid, weights=self.weights)
+
+    @classmethod
+    def load(cls, file):
+        """Load interpolation weights previously saved to a file.
+
+        Parameters
+        ----------
+        file : str or file-like object
+            File to read, as written by `save`.
+
+        Returns
+        -------
+        `Interpolator`
+
+        """
+        interp = cls.__new__(cls)
+        with np.load(file) as data:
+            interp.valid = data['valid']
+            if 'weights' in data:
+                interp.weights = data['weights']
+            else:
+                interp.weights = sparse.csr_matrix(
+                    (data['data'], data['indices'], data['indptr']), shape=data['shape'])
+        return interp
@@ -0,0 +1,285 @@
+# Copyright (c) 2024 MetPy Developers.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Regrid radar data from polar coordinates."""
+
+import numpy as np
+from pyproj import Geod
+from scipy import sparse
+
+from .points import _inverse_distance_weights
+from ..cbook import lru_cache_by_value
+from ..constants import earth_avg_radius
+from ..package_tools import Exporter
+from ..units import is_quantity, units
+
+exporter = Exporter(globals())
+
+
+@exporter.export
+def beam_height(ranges, elevation, site_altitude=0, earth_radius_factor=4 / 3):
+    r"""Calculate the height of the center of a radar beam.
+
+    Parameters
+    ----------
+    ranges : array-like
+        Slant ranges along the beam. If not a `pint.Quantity`, assumed to be in meters.
+    elevation : float
+        Elevation angle of the beam. If not a `pint.Quantity`, assumed to be in degrees.
+    site_altitude : float
+        Altitude of the radar antenna. If not a `pint.Quantity`, assumed to be in meters.
+        Default 0.
+    earth_radius_factor : float
+        Ratio of the effective radius of the earth to its actual radius, accounting for the
+        refraction of the beam. Default 4/3.
+
+    Returns
+    -------
+    height : `pint.Quantity`
+        Height of the beam above the altitude of zero
+
+    Notes
+    -----
+    This uses the effective earth radius model [Doviak1993]_:
+
+    .. math:: h = \sqrt{r^2 + (k_e R_e)^2 + 2 r k_e R_e \sin\theta} - k_e R_e + h_0
+
+    """
+    ranges = _to_magnitude(ranges, 'meter')
+    elevation = np.deg2rad(_to_magnitude(elevation, 'degree'))
+    radius = earth_radius_factor * earth_avg_radius.m_as('meter')
+    height = np.sqrt(ranges ** 2 + radius ** 2 + 2 * ranges * radius * np.sin(elevation))
+    return units.Quantity(height - radius + _to_magnitude(site_altitude, 'meter'), 'meter')
+
+
+@exporter.export
+class RadarRegridder:
+    r"""Regrid radar data from a sweep in polar coordinates onto given points.
+
+    The gates of the sweep that contribute to each point, and their weights, are found once
+    and kept as a sparse matrix, so that each sweep with the same geometry, such as the same
+    elevation of every volume scanned with a given VCP, is regridded with a fast gather.
+    Points are located along the beam using the effective earth radius model.
+
+    Parameters
+    ----------
+    azimuths : array-like, (A,)
+        Azimuths of the radials in the sweep, in any order. If not a `pint.Quantity`, assumed
+        to be in degrees clockwise from north.
+    ranges : array-like, (R,)
+        Increasing slant ranges of the gates along each radial. If not a `pint.Quantity`,
+        assumed to be in meters.
+    elevation : float
+        Elevation angle of the sweep. If not a `pint.Quantity`, assumed to be in degrees.
+    x : array-like
+        Coordinates of the points to regrid onto. Distances east of the radar, assumed to be
+        in meters if not a `pint.Quantity`, or longitudes if ``center_lon`` and
+        ``center_lat`` are given.
+    y : array-like
+        Coordinates of the points to regrid onto, with the same shape as ``x``. Distances
+        north of the radar, assumed to be in meters if not a `pint.Quantity`, or latitudes if
+        ``center_lon`` and ``center_lat`` are given.
+    center_lon : float, optional
+        Longitude of the radar in decimal degrees
+    center_lat : float, optional
+        Latitude of the radar in decimal degrees
+    method : str
+        How to regrid the sweep. Options are 'nearest' for the nearest gate, 'bilinear' for
+        interpolation between the surrounding gates in range and azimuth, and 'cressman' for
+        a Cressman analysis of the gates within ``radius``. Default 'nearest'.
+    radius : float, optional
+        Search radius for Cressman analysis. If not a `pint.Quantity`, assumed to be in
+        meters. Defaults to twice the largest spacing between gates along a radial.
+    site_altitude : float
+        Altitude of the radar antenna. If not a `pint.Quantity`, assumed to be in meters.
+        Default 0.
+    earth_radius_factor : float
+        Ratio of the effective radius of the earth to its actual radius. Default 4/3.
+    geod : `pyproj.Geod` or ``None``
+        PyProj Geod to use for the azimuths and distances to points given as longitudes and
+        latitudes. If ``None``, use a default spherical ellipsoid.
+
+    Attributes
+    ----------
+    weights : `scipy.sparse.csr_matrix`, (M, A * R)
+        Weight of each gate, in the order of the flattened sweep, for each point
+    heights : `pint.Quantity`
+        Height of the beam above each point, with the same shape as ``x``
+
+    See Also
+    --------
+    beam_height, metpy.calc.azimuth_range_to_lat_lon
+
+    Notes
+    -----
+    Gates with missing values are left out of the weighting at each point, so points whose
+    gates are all missing, or that are not covered by the sweep, are NaN. Bilinear
+    interpolation does not bridge gaps between radials larger than twice their typical
+    spacing.
+
+    Use `RadarRegridder.cached` to share regridders among sweeps with the same geometry.
+
+    """
+
+    def __init__(self, azimuths, ranges, elevation, x, y, center_lon=None, center_lat=None,
+                 method='nearest', radius=None, site_altitude=0, earth_radius_factor=4 / 3,
+                 geod=None):
+        """Find the weights of the gates for each point."""
+        azimuths = _to_magnitude(azimuths, 'degree') % 360
+        ranges = _to_magnitude(ranges, 'meter')
+        elevation = np.deg2rad(_to_magnitude(elevation, 'degree'))
+        earth_radius = earth_radius_factor * earth_avg_radius.m_as('meter')
+
+        # Find the distance along the ground and azimuth from the radar to each point
+        shape = np.shape(x)
+        if center_lon is not None and center_lat is not None:
+            g = Geod(ellps='sphere') if geod is None else geod
+            lon = np.asarray(x, dtype=float).reshape(-1)
+            lat = np.asarray(y, dtype=float).reshape(-1)
+            point_az, _, dist = g.inv(np.full(lon.shape, center_lon),
+                                      np.full(lat.shape, center_lat), lon, lat)
+            point_az = np.asarray(point_az) % 360
+            dist = np.asarray(dist)
+        else:
+            x = _to_magnitude(x, 'meter').reshape(-1)
+            y = _to_magnitude(y, 'meter').reshape(-1)
+            point_az = np.rad2deg(np.arctan2(x, y)) % 360
+            dist = np.hypot(x, y)
+
+        # Find the slant range of the beam above each point; past the horizon it is infinite
+        angle = dist / earth_radius
+        with np.errstate(divide='ignore'):
+            slant_range = np.where(elevation + angle < np.pi / 2,
+                                   earth_radius * np.sin(angle) / np.cos(elevation + angle),
+                                   np.inf)
+        self.heights = beam_height(slant_range, np.rad2deg(elevation), site_altitude,
+                                   earth_radius_factor).reshape(shape)
+
+        if method == 'nearest':
+            self.weights = _nearest_weights(azimuths, ranges, point_az, slant_range)
+        elif method == 'bilinear':
+            self.weights = _bilinear_weights(azimuths, ranges, point_az, slant_range)
+        elif method == 'cressman':
+            radius = (2 * np.diff(ranges).max() if radius is None
+                      else _to_magnitude(radius, 'meter'))
+
+            # Locate each gate along the ground, using the same projection as the points
+            gate_dist = earth_radius * np.arctan(
+                ranges * np.cos(elevation) / (earth_radius + ranges * np.sin(elevation)))
+            gate_az = np.deg2rad(azimuths)[:, None]
+            gates = np.column_stack([(gate_dist * np.sin(gate_az)).reshape(-1),
+                                     (gate_dist * np.cos(gate_az)).reshape(-1)])
+            point_az = np.deg2rad(point_az)
+            points = np.column_stack([dist * np.sin(point_az), dist * np.cos(point_az)])
+            self.weights, _ = _inverse_distance_weights(gates, points, radius,
+                                                        min_neighbors=1, kind='cressman')
+        else:
+            raise ValueError(f'Regridding method {method} not available. '
+                             'Try: nearest, bilinear, cressman')
+        self._shape = shape
+
+    @classmethod
+    @lru_cache_by_value(maxsize=16)
+    def cached(cls, *args, **kwargs):
+        """Return a regridder for the geometry, reusing one made with the same arguments.
+
+        The arguments are the same as for `RadarRegridder`, and the most recently used
+        regridders are kept. Since the azimuths of the radials of each scan are compared
+        exactly, giving the nominal azimuths, such as those of the centers of the radials for
+        the azimuthal resolution of the sweep, allows the regridder to be reused from volume
+        to volume.
+        """
+        return cls(*args, **kwargs)
+
+    def regrid(self, *args):
+        r"""Regrid data from sweeps onto the points.
+
+        Parameters
+        ----------
+        args : array-like, (A, R, ...)
+            Data for each gate of sweeps with the geometry of the regridder, with dimensions
+            of azimuth and range. Masked or NaN values are treated as missing. Any later
+            dimensions are regridded together.
+
+        Returns
+        -------
+        list
+            The regridded data, with the shape of the points followed by any later dimensions
+            of the data, in the order of ``args``.
+
+        """
+        ret = []
+        for data in args:
+            data_units = data.units if is_quantity(data) else None
+            values = getattr(data, 'magnitude', data)
+            values = np.ma.filled(np.ma.asarray(values, dtype=float), np.nan)
+            shape = values.shape
+            values = values.reshape(shape[0] * shape[1], -1)
+
+            present = ~np.isnan(values)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                img = ((self.weights @ np.where(present, values, 0))
+                       / (self.weights @ present.astype(float)))
+            img = img.reshape(self._shape + shape[2:])
+            ret.append(units.Quantity(img, data_units) if data_units is not None else img)
+        return ret
+
+
+def _to_magnitude(value, default_units):
+    """Return the magnitude of a value in the given units, assumed if it has no units."""
+    return np.asarray(units.Quantity(value, default_units).m_as(default_units), dtype=float)
+
+
+def _bracket_azimuths(azimuths, point_az):
+    """Find the radials before and after each point's azimuth, going clockwise.
+
+    Returns the indices of the radials, the fraction of the way from the first radial to the
+    second for each point, and the angular gap between the radials.
+    """
+    order = np.argsort(azimuths)
+    sorted_az = azimuths[order]
+    after = np.searchsorted(sorted_az, point_az) % len(sorted_az)
+    before = (after - 1) % len(sorted_az)
+    gap = (sorted_az[after] - sorted_az[before]) % 360
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frac = ((point_az - sorted_az[before]) % 360) / gap
+    return order[before], order[after], frac, gap
+
+
+def _nearest_weights(azimuths, ranges, point_az, slant_range):
+    """Find the weights that select the nearest gate to each point."""
+    before, after, frac, gap = _bracket_azimuths(azimuths, point_az)
+    radial = np.where(frac < 0.5, before, after)
+    offset = np.where(frac < 0.5, frac, 1 - frac) * gap
+
+    # Find the nearest gate, and whether the point is within the volume of the sweep
+    edges = np.concatenate([[1.5 * ranges[0] - 0.5 * ranges[1]],
+                            (ranges[1:] + ranges[:-1]) / 2,
+                            [1.5 * ranges[-1] - 0.5 * ranges[-2]]])
+    gate = np.searchsorted(edges, slant_range) - 1
+    valid = ((gate >= 0) & (gate < len(ranges))
+             & (offset <= np.median(np.diff(np.sort(azimuths)))))
+
+    return sparse.csr_matrix((np.ones(valid.sum()),
+                              (np.flatnonzero(valid), (radial * len(ranges) + gate)[valid])),
+                             shape=(len(point_az), len(azimuths) * len(ranges)))
+
+
+def _bilinear_weights(azimuths, ranges, point_az, slant_range):
+    """Find the weights interpolating linearly in azimuth and range to each point."""
+    before, after, az_frac, gap = _bracket_azimuths(azimuths, point_az)
+    gate = np.clip(np.searchsorted(ranges, slant_range) - 1, 0, len(ranges) - 2)
+    with np.errstate(invalid='ignore'):
+        range_frac = (slant_range - ranges[gate]) / (ranges[gate + 1] - ranges[gate])
+    valid = ((range_frac >= 0) & (range_frac <= 1)
+             & (gap <= 2 * np.median(np.diff(np.sort(azimuths)))))
+
+    rows = np.flatnonzero(valid)
+    before, after, gate = before[valid], after[valid], gate[valid]
+    az_frac, range_frac = az_frac[valid], range_frac[valid]
+    cols = np.stack([before * len(ranges) + gate, before * len(ranges) + gate + 1,
+                     after * len(ranges) + gate, after * len(ranges) + gate + 1], axis=1)
+    weights = np.stack([(1 - az_frac) * (1 - range_frac), (1 - az_frac) * range_frac,
+                        az_frac * (1 - range_frac), az_frac * range_frac], axis=1)
+    return sparse.csr_matrix((weights.reshape(-1), (np.repeat(rows, 4), cols.reshape(-1))),
+                             shape=(len(point_az), len(azimuths) * len(ranges)))
@@ -3,11 +3,13 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Tools for interpolating to a vertical slice/cross section through data."""
 
+from functools import cached_property
+
 import numpy as np
 import xarray as xr
 
 from ..package_tools import Exporter
-from ..units import is_quantity
+from ..units import is_quantity, units
 from ..xarray import check_axis
 
 exporter = Exporter(globals())
@@ -15,11 +17,12 @@ exporter = Exporter(globals())
 
 @exporter.export
 def interpolate_to_slice(data, points, interp_type='linear'):
-    r"""Obtain an interpolated slice through data using xarray.
+    r"""Obtain an interpolated slice through data.
 
-    Utilizing the interpolation functionality in xarray, this function
-    takes a slice of the given data (currently only regular grids are supported), which is
-    given as an `xarray.DataArray` so that we can utilize its coordinate metadata.
+    This function takes a slice of the given data (currently only regular grids are
+    supported), which is given as an `xarray.DataArray` so that we can utilize its coordinate
+    metadata. The grid points surrounding each point of the slice are found once and
+    gathered from every variable, keeping any dask arrays lazy.
 
     Parameters
     ----------
@@ -30,8 +33,8 @@ def interpolate_to_slice(data, points, interp_type='linear'):
     points: (N, 2) array-like
         A list of x, y points in the data projection at which to interpolate the data
     interp_type: str, optional
-        The interpolation method, either 'linear' or 'nearest' (see
-        `xarray.DataArray.interp()` for details). Defaults to 'linear'.
+        The interpolation method, either 'linear' or 'nearest' (matching
+        `xarray.DataArray.interp()`). Defaults to 'linear'.
 
     Returns
     -------
@@ -40,25 +43,10 @@ def interpolate_to_slice(data, points, interp_type='linear'):
 
     See Also
     --------
-    cross_section
+    cross_section, SlicePlan
 
     """
-    try:
-        x, y = data.metpy.coordinates('x', 'y')
-    except AttributeError:
-        raise ValueError('Required coordinate information not available. Verify that '
-                         'your data has been parsed by MetPy with proper x and y '
-                         'dimension coordinates.') from None
-
-    need_quantify = is_quantity(data.data)
-    data = data.metpy.dequantify()
-    data_sliced = data.interp({
-        x.name: xr.DataArray(points[:, 0], dims='index', attrs=x.attrs),
-        y.name: xr.DataArray(points[:, 1], dims='index', attrs=y.attrs)
-    }, method=interp_type)
-    data_sliced.coords['index'] = range(len(points))
-
-    return data_sliced.metpy.quantify() if need_quantify else data_sliced
+    return SlicePlan(points, interp_type)(data)
 
 
 @exporter.export
@@ -141,7 +129,7 @@ def cross_section(data, start, end, steps=100, interp_type='linear'):
 
     See Also
     --------
-    interpolate_to_slice, geodesic
+    interpolate_to_slice, geodesic, CrossSectionPlan
 
     """
     if isinstance(data, xr.Dataset):
@@ -173,3 +161,341 @@ def cross_section(data, start, end, steps=100, interp_type='linear'):
 
         # Return the interpolated data
         return interpolate_to_slice(data, points_cross, interp_type=interp_type)
+
+
+@exporter.export
+class SlicePlan:
+    r"""Interpolation to the points of a slice, computed once for use with many variables.
+
+    `interpolate_to_slice` finds the grid points surrounding each point of the slice, along
+    with their weights, and gathers them from every variable it is given. This keeps the
+    indices and weights for each grid the plan is used with, so that repeatedly taking the
+    same slice (e.g. for every time of an animation) only needs the gathers.
+
+    Parameters
+    ----------
+    points: (N, 2) array-like
+        A list of x, y points in the data projection at which to interpolate the data
+    interp_type: str, optional
+        The interpolation method, either 'linear' or 'nearest'. Defaults to 'linear'.
+
+    Attributes
+    ----------
+    points : (N, 2) `numpy.ndarray`
+        The x, y points along the slice
+
+    Notes
+    -----
+    The data must have one-dimensional x and y coordinates. The result is NaN at points
+    outside of the grid.
+
+    See Also
+    --------
+    interpolate_to_slice, CrossSectionPlan
+
+    """
+
+    def __init__(self, points, interp_type='linear'):
+        """Store the points along the slice."""
+        if interp_type not in ('linear', 'nearest'):
+            raise ValueError(f'Unknown interpolation method {interp_type}.')
+        self.points = np.asarray(points, dtype=float)
+        self.interp_type = interp_type
+        self._indexers = {}
+
+    def __call__(self, data):
+        r"""Interpolate data to the slice.
+
+        Parameters
+        ----------
+        data: `xarray.DataArray` or `xarray.Dataset`
+            Three- (or higher) dimensional field(s) to interpolate. The DataArray (or
+            Dataset) must have been parsed by MetPy and include both an x and y coordinate
+            dimension in the projection of the points.
+
+        Returns
+        -------
+        `xarray.DataArray` or `xarray.Dataset`
+            The interpolated slice of data, with new index dimension along the slice.
+
+        """
+        if isinstance(data, xr.DataArray) and data.ndim == 0:
+            # Nothing to take the slice of (e.g. a projection variable)
+            return data
+
+        try:
+            x, y = _horizontal_variable(data).metpy.coordinates('x', 'y')
+        except AttributeError:
+            raise ValueError('Required coordinate information not available. Verify that '
+                             'your data has been parsed by MetPy with proper x and y '
+                             'dimension coordinates.') from None
+
+        need_quantify = any(is_quantity(var.data) for var in
+                            ([data] if isinstance(data, xr.DataArray) else data.values()))
+        data = data.metpy.dequantify()
+        data_sliced = _gather_slice(data, x, y, self._slice_indexers(x, y))
+        return data_sliced.metpy.quantify() if need_quantify else data_sliced
+
+    def _slice_indexers(self, x, y):
+        """Return the grid indices and weights of the points, cached for each grid."""
+        key = (x.name, y.name)
+        if key in self._indexers:
+            x_values, y_values, indexers = self._indexers[key]
+            if np.array_equal(x_values, x.values) and np.array_equal(y_values, y.values):
+                return indexers
+
+        indexers = _slice_indexers(x, y, self._grid_points(x), self.interp_type)
+        self._indexers[key] = (x.values, y.values, indexers)
+        return indexers
+
+    def _grid_points(self, x):
+        """Return the points along the slice to find on a grid with the x coordinate."""
+        return self.points
+
+
+@exporter.export
+class CrossSectionPlan(SlicePlan):
+    r"""Geometry of a cross section, computed once for use with many variables.
+
+    `cross_section` finds the geodesic path and interpolates to it separately for every
+    variable it is given, and the functions calculating distances and unit vectors along a
+    cross section find them again from its coordinates. This finds the points along the path
+    once, along with the distances and unit vectors along it and, for each grid the plan is
+    used with, the indices and weights needed to interpolate to the points. Any number of
+    variables (or whole Datasets) on those grids can then be interpolated to the cross
+    section with a single gather of the grid points surrounding the path.
+
+    Parameters
+    ----------
+    crs: `pyproj.crs.CRS`
+        PyProj Coordinate Reference System of the data
+    start: (2, ) array-like
+        A latitude-longitude pair designating the start point of the cross section (units are
+        degrees north and degrees east).
+    end: (2, ) array-like
+        A latitude-longitude pair designating the end point of the cross section (units are
+        degrees north and degrees east).
+    steps: int, optional
+        The number of points along the geodesic between the start and the end point
+        (including the end points) to use in the cross section. Defaults to 100.
+    interp_type: str, optional
+        The interpolation method, either 'linear' or 'nearest'. Defaults to 'linear'.
+
+    Attributes
+    ----------
+    points : (N, 2) `numpy.ndarray`
+        The x, y points in ``crs`` along the cross section
+
+    Examples
+    --------
+    >>> from metpy.cbook import get_test_data
+    >>> from metpy.interpolate import CrossSectionPlan
+    >>> import xarray as xr
+    >>> data = xr.open_dataset(get_test_data('GFS_test.nc', False)).metpy.parse_cf()
+    >>> plan = CrossSectionPlan.from_data(data, (37.0, -105.0), (35.5, -65.0), steps=50)
+    >>> cross = plan(data)
+    >>> tangential, normal = plan.components(cross['u-component_of_wind_isobaric'],
+    ...                                      cross['v-component_of_wind_isobaric'])
+    >>> dict(normal.sizes)
+    {'time': 1, 'isobaric3': 26, 'index': 50}
+
+    Notes
+    -----
+    The data must be on a regular grid in ``crs``, with one-dimensional x and y coordinates,
+    as required by `cross_section`. Like `cross_section`, the result is NaN at points along
+    the path outside of the grid.
+
+    See Also
+    --------
+    cross_section, geodesic, SlicePlan
+
+    """
+
+    def __init__(self, crs, start, end, steps=100, interp_type='linear'):
+        """Find the points along the cross section."""
+        super().__init__(geodesic(crs, start, end, steps), interp_type)
+        self.crs = crs
+        self.start = start
+        self.end = end
+        self.steps = steps
+
+    @classmethod
+    def from_data(cls, data, start, end, steps=100, interp_type='linear'):
+        """Create a plan for a cross section through data parsed by MetPy.
+
+        Parameters
+        ----------
+        data: `xarray.DataArray` or `xarray.Dataset`
+            Data with the added `crs` coordinate, from which to take the projection
+        start, end, steps, interp_type
+            As for `CrossSectionPlan`
+
+        """
+        try:
+            crs = _horizontal_variable(data).metpy.pyproj_crs
+        except AttributeError:
+            raise ValueError('Data missing required coordinate information. Verify that '
+                             'your data have been parsed by MetPy with proper x and y '
+                             'dimension coordinates and added crs coordinate of the '
+                             'correct projection for each variable.') from None
+        return cls(crs, start, end, steps, interp_type)
+
+    def _grid_points(self, x):
+        """Return the points along the cross section to find on a grid with x coordinate."""
+        # Patch points to match given longitude range, whether [0, 360) or (-180,  180]
+        points = self.points.copy()
+        if check_axis(x, 'longitude') and (x > 180).any():
+            points[points[:, 0] < 0, 0] += 360.
+        return points
+
+    @cached_property
+    def distances(self):
+        """The x and y distances along the cross section.
+
+        For a geographic CRS these are the distances east and north from the start of the
+        cross section; otherwise they are the coordinates of the points, as used by
+        `metpy.calc.unit_vectors_from_cross_section`.
+
+        Returns
+        -------
+        x, y : tuple of `pint.Quantity`
+
+        """
+        if self.crs.is_geographic:
+            lon, lat = self.points.T
+            forward_az, _, distance = self.crs.get_geod().inv(
+                np.full_like(lon, lon[0]), np.full_like(lat, lat[0]), lon, lat)
+            return (units.Quantity(distance * np.sin(np.deg2rad(forward_az)), 'meter'),
+                    units.Quantity(distance * np.cos(np.deg2rad(forward_az)), 'meter'))
+        else:
+            unit = units(self.crs.axis_info[0].unit_name)
+            return units.Quantity(self.points[:, 0], unit), units.Quantity(self.points[:, 1],
+                                                                           unit)
+
+    @cached_property
+    def unit_vectors(self):
+        """The unit tangent and unit normal vectors along the cross section.
+
+        These match those found by `metpy.calc.unit_vectors_from_cross_section`.
+
+        Returns
+        -------
+        unit_tangent_vector, unit_normal_vector : tuple of (2, N) `numpy.ndarray`
+
+        """
+        x, y = self.distances
+        dx_di = np.gradient(x.m, edge_order=2)
+        dy_di = np.gradient(y.m, edge_order=2)
+        tangent_vector_mag = np.hypot(dx_di, dy_di)
+        return (np.vstack([dx_di / tangent_vector_mag, dy_di / tangent_vector_mag]),
+                np.vstack([-dy_di / tangent_vector_mag, dx_di / tangent_vector_mag]))
+
+    def components(self, data_x, data_y):
+        r"""Obtain the tangential and normal components of a vector field along the section.
+
+        Parameters
+        ----------
+        data_x : `xarray.DataArray`
+            The x-component (in terms of data projection) of the vector field, interpolated
+            to the cross section by this plan
+        data_y : `xarray.DataArray`
+            The y-component (in terms of data projection) of the vector field, interpolated
+            to the cross section by this plan
+
+        Returns
+        -------
+        component_tangential, component_normal: tuple of `xarray.DataArray`
+            Components of the vector field in the tangential and normal directions,
+            respectively
+
+        See Also
+        --------
+        metpy.calc.cross_section_components
+
+        """
+        unit_tang, unit_norm = (xr.DataArray(vector, dims=('component', 'index'))
+                                for vector in self.unit_vectors)
+        component_tang = data_x * unit_tang[0] + data_y * unit_tang[1]
+        component_norm = data_x * unit_norm[0] + data_y * unit_norm[1]
+        return (component_tang.drop_vars('component', errors='ignore'),
+                component_norm.drop_vars('component', errors='ignore'))
+
+
+def _horizontal_variable(data):
+    """Return a DataArray with horizontal dimensions from a DataArray or Dataset."""
+    if isinstance(data, xr.Dataset):
+        return next((var for var in data.values() if var.ndim >= 2), data)
+    return data
+
+
+def _axis_indexers(coord, values, interp_type):
+    """Find the indices and weights interpolating along a regular coordinate to values."""
+    coord = np.asarray(coord, dtype=float)
+    flip = coord[-1] < coord[0]
+    if flip:
+        coord = coord[::-1]
+
+    # Left neighbor of each value, and the fraction of the way to the right neighbor
+    left = np.clip(np.searchsorted(coord, values, side='right') - 1, 0, len(coord) - 2)
+    frac = (values - coord[left]) / (coord[left + 1] - coord[left])
+
+    if interp_type == 'nearest':
+        # Round down halfway between points, as for `scipy.interpolate.interp1d`
+        indices = (left + (frac > 0.5))[:, None]
+        weights = np.ones_like(indices, dtype=float)
+    else:
+        indices = np.stack([left, left + 1], axis=-1)
+        weights = np.stack([1 - frac, frac], axis=-1)
+
+    # Points outside of the grid have no value
+    weights[(values < coord[0]) | (values > coord[-1])] = np.nan
+    return (len(coord) - 1 - indices if flip else indices), weights
+
+
+def _slice_indexers(x, y, points, interp_type):
+    """Find the grid indices and weights interpolating to points along a slice."""
+    x_index, x_weight = _axis_indexers(x.values, points[:, 0], interp_type)
+    y_index, y_weight = _axis_indexers(y.values, points[:, 1], interp_type)
+
+    # Every combination of the neighbors along each axis
+    dims = ('index', '_corner')
+    num = x_index.shape[-1]
+    return (points,
+            xr.DataArray(np.tile(x_index, num), dims=dims),
+            xr.DataArray(np.repeat(y_index, num, axis=-1), dims=dims),
+            xr.DataArray(np.tile(x_weight, num) * np.repeat(y_weight, num, axis=-1),
+                         dims=dims))
+
+
+def _gather_slice(data, x, y, indexers):
+    """Interpolate data to a slice by gathering the grid points around its points."""
+    points, x_index, y_index, weights = indexers
+    nearest = weights.fillna(0).argmax('_corner')
+
+    def _combine(var):
+        """Combine the values gathered for each point using their weights."""
+        if '_corner' not in var.dims:
+            return var
+        elif var.dtype.kind in 'fciu':
+            # Avoid spreading NaN from points with no weight
+            with xr.set_options(keep_attrs=True):
+                return (var * weights).where(weights != 0, 0).sum('_corner', skipna=False)
+        else:
+            return var.isel(_corner=nearest)
+
+    gathered = data.isel({x.dims[0]: x_index, y.dims[0]: y_index}).drop_vars([x.name, y.name])
+
+    # Interpolate any other horizontal coordinates (e.g. 2D latitude and longitude)
+    coords = {name: _combine(xr.DataArray(coord.variable))
+              for name, coord in gathered.coords.items() if '_corner' in coord.dims}
+    gathered = gathered.drop_vars(list(coords))
+    if isinstance(gathered, xr.Dataset):
+        sliced = gathered.map(_combine, keep_attrs=True)
+    else:
+        sliced = _combine(gathered)
+
+    # Give the points along the slice as coordinates, as `xarray.DataArray.interp` does
+    coords[x.name] = xr.DataArray(points[:, 0], dims='index', attrs=x.attrs)
+    coords[y.name] = xr.DataArray(points[:, 1], dims='index', attrs=y.attrs)
+    coords['index'] = range(len(points))
+    return sliced.assign_coords(coords)
@@ -7,6 +7,7 @@ import numpy as np
 from scipy.spatial.distance import cdist
 
 from ..package_tools import Exporter
+from ..units import units
 
 exporter = Exporter(globals())
 
@@ -72,11 +73,8 @@ def remove_observations_below_value(x, y, z, val=0):
         observation values less than val.
 
     """
-    x_ = x[z >= val]
-    y_ = y[z >= val]
-    z_ = z[z >= val]
-
-    return x_, y_, z_
+    keep = z >= val
+    return x[keep], y[keep], z[keep]
 
 
 @exporter.export
@@ -101,16 +99,13 @@ def remove_nan_observations(x, y, z):
         nan valued observations.
 
     """
-    x_ = x[~np.isnan(z)]
-    y_ = y[~np.isnan(z)]
-    z_ = z[~np.isnan(z)]
-
-    return x_, y_, z_
+    keep = ~np.isnan(z)
+    return x[keep], y[keep], z[keep]
 
 
 @exporter.export
-def remove_repeat_coordinates(x, y, z):
-    r"""Remove all x, y, and z where (x,y) is repeated and keep the first occurrence only.
+def remove_repeat_coordinates(x, y, z, aggregate='first'):
+    r"""Remove all x, y, and z where (x,y) is repeated.
 
     Will not destroy original values.
 
@@ -122,30 +117,119 @@ def remove_repeat_coordinates(x, y, z):
         y coordinate
     z: array-like
         observation value
+    aggregate: str, optional
+        How to combine the observations at repeated coordinates: 'first' keeps the first
+        occurrence only and 'mean' averages them. Defaults to 'first'.
 
     Returns
     -------
     x, y, z
         List of coordinate observation pairs without
-        repeated coordinates.
+        repeated coordinates, in the order of their first occurrence.
+
+    See Also
+    --------
+    observation_mask
 
     """
-    coords = []
-    variable = []
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if hasattr(z, 'units'):
+        z = units.Quantity(np.asarray(z.magnitude), z.units)
+    else:
+        z = np.asarray(z)
+
+    first, groups = _unique_coordinates(x, y)
+    if aggregate == 'first':
+        z_ = z[first]
+    elif aggregate == 'mean':
+        magnitude = getattr(z, 'magnitude', z)
+        z_ = (np.bincount(groups, weights=magnitude) / np.bincount(groups))[groups[first]]
+        if hasattr(z, 'units'):
+            z_ = units.Quantity(z_, z.units)
+    else:
+        raise ValueError(f'Unknown option for aggregate: {aggregate}')
+
+    return x[first], y[first], z_
 
-    for (x_, y_, t_) in zip(x, y, z):
-        if (x_, y_) not in coords:
-            coords.append((x_, y_))
-            variable.append(t_)
 
-    coords = np.array(coords)
+@exporter.export
+def observation_mask(x, y, z, val=None, remove_repeats=True):
+    r"""Find the observations to keep, for use with every variable from the same stations.
 
-    x_ = coords[:, 0]
-    y_ = coords[:, 1]
+    This combines `remove_nan_observations`, `remove_observations_below_value`, and
+    `remove_repeat_coordinates` (keeping the first occurrence) into a single mask, in that
+    order, so that the mask can be used to subset any number of variables.
+
+    Parameters
+    ----------
+    x: array-like
+        x coordinate
+    y: array-like
+        y coordinate
+    z: array-like
+        observation value
+    val: float, optional
+        Value at which to threshold z. Defaults to None, which keeps all values of z.
+    remove_repeats: bool, optional
+        Whether to remove all but the first of the remaining observations at repeated
+        coordinates. Defaults to True.
+
+    Returns
+    -------
+    (N, ) numpy.ndarray
+        Boolean mask of the observations to keep
+
+    Examples
+    --------
+    >>> from metpy.interpolate import observation_mask
+    >>> x = np.array([0., 1., 1., 2., 3.])
+    >>> y = np.array([0., 1., 1., 2., 3.])
+    >>> t = np.array([10., np.nan, 12., 14., -5.])
+    >>> keep = observation_mask(x, y, t, val=0)
+    >>> keep
+    array([ True, False,  True,  True, False])
+    >>> x[keep], y[keep], t[keep]
+    (array([0., 1., 2.]), array([0., 1., 2.]), array([10., 12., 14.]))
+
+    See Also
+    --------
+    remove_nan_observations, remove_observations_below_value, remove_repeat_coordinates
+
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if not hasattr(z, 'units'):
+        z = np.asarray(z)
+
+    keep = ~np.isnan(z)
+    if val is not None:
+        keep &= z >= val
+    if remove_repeats:
+        keep[keep] = _unique_coordinates(x[keep], y[keep])[0]
+    return np.asarray(keep)
 
-    z_ = np.array(variable)
 
-    return x_, y_, z_
+def _unique_coordinates(x, y):
+    """Find the first occurrence of every coordinate pair, and the pair of every point.
+
+    Returns a mask of the first occurrences and, for every point, the number of its
+    coordinate pair within those sorted by x and y.
+    """
+    # With a stable sort, points with the same coordinates stay in their original order
+    x = np.asarray(x)
+    y = np.asarray(y)
+    order = np.lexsort((y, x))
+    x_sorted = x[order]
+    y_sorted = y[order]
+    new = np.ones(order.size, dtype=bool)
+    new[1:] = (x_sorted[1:] != x_sorted[:-1]) | (y_sorted[1:] != y_sorted[:-1])
+
+    first = np.zeros(order.size, dtype=bool)
+    first[order[new]] = True
+    groups = np.empty(order.size, dtype=int)
+    groups[order] = np.cumsum(new) - 1
+    return first, groups
 
 
 def barnes_weights(sq_dist, kappa, gamma):
@@ -761,6 +761,86 @@ def test_smooth_circular(array_type):
     assert_array_almost_equal(smoothed, truth, 4)
 
 
+def test_smooth_circular_large_radius():
+    """Test smooth_circular with a large radius against summing every weight directly."""
+    rng = np.random.default_rng(20240524)
+    data = rng.normal(size=(2, 40, 50))
+    data[1, 20, 30] = np.nan
+    radius = 6
+
+    x, y = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+    weights = (np.hypot(x, y) <= radius) / np.count_nonzero(np.hypot(x, y) <= radius)
+    windows = np.lib.stride_tricks.sliding_window_view(data, weights.shape, axis=(-2, -1))
+    truth = data.copy()
+    truth[:, radius:-radius, radius:-radius] = np.sum(windows * weights, axis=(-2, -1))
+
+    smoothed = smooth_circular(data, radius)
+    assert_array_almost_equal(smoothed, truth, 10)
+    assert_array_equal(np.isnan(smoothed), np.isnan(truth))
+
+
+def test_smooth_circular_many_passes():
+    """Test that several passes of smooth_circular on a large grid match repeated passes."""
+    rng = np.random.default_rng(20240524)
+    data = rng.normal(size=(600, 600))
+    data[300, 200] = np.nan
+
+    truth = data
+    for _ in range(3):
+        truth = smooth_circular(truth, 5)
+
+    smoothed = smooth_circular(data, 5, passes=3)
+    assert_array_almost_equal(smoothed, truth, 10)
+    assert_array_equal(np.isnan(smoothed), np.isnan(truth))
+
+
+def test_smooth_circular_window_larger_than_grid():
+    """Test that smooth_circular leaves a grid narrower than its window unchanged."""
+    data = np.arange(200.).reshape(5, 40) * units.kelvin
+
+    assert_array_equal(smooth_circular(data, 6), data)
+
+
+@pytest.mark.parametrize('func, args', [(smooth_gaussian, (6,)),
+                                        (smooth_circular, (7, 2)),
+                                        (smooth_n_point, (9, 3)),
+                                        (smooth_rectangular, ((5, 3), 2))])
+def test_smooth_tiles(func, args):
+    """Test that smoothing a grid in tiles matches smoothing it whole."""
+    rng = np.random.default_rng(20240527)
+    data = rng.normal(size=(2, 103, 121)) * units.kelvin
+    data[1, 50, 60] = np.nan * units.kelvin
+
+    truth = func(data, *args)
+    smoothed = func(data, *args, tile_size=(40, 25), workers=2)
+    assert smoothed.units == units.kelvin
+    assert_array_almost_equal(smoothed, truth, 12)
+    assert_array_equal(np.isnan(smoothed), np.isnan(truth))
+
+
+def test_smooth_tiles_narrow_remainder():
+    """Test smoothing in tiles that leave a last tile narrower than the window."""
+    rng = np.random.default_rng(20240530)
+    data = rng.normal(size=(60, 70))
+
+    assert_array_almost_equal(smooth_circular(data, 6, tile_size=17),
+                              smooth_circular(data, 6), 12)
+
+
+@pytest.mark.parametrize('func, args', [(smooth_gaussian, (6,)),
+                                        (smooth_circular, (7, 2)),
+                                        (smooth_n_point, (5, 4))])
+def test_smooth_dask(func, args):
+    """Test that smoothing a Dask array is lazy and matches smoothing a NumPy array."""
+    da = pytest.importorskip('dask.array')
+    rng = np.random.default_rng(20240528)
+    data = rng.normal(size=(2, 103, 121))
+
+    smoothed = func(units.Quantity(da.from_array(data, chunks=(1, 10, 30)), 'kelvin'), *args)
+    assert isinstance(smoothed.magnitude, da.Array)
+    assert_array_almost_equal(smoothed.compute(), func(data * units.kelvin, *args), 12)
+
+
 def test_smooth_window_with_bad_window():
     """Test smooth_window with a bad window size."""
     temperature = [37, 32, 34, 29, 28, 24, 26, 24, 27, 30] * units.degF
@@ -14,13 +14,15 @@ import xarray as xr
 
 from metpy.calc import (angle_to_direction, find_bounding_indices, find_intersections,
                         first_derivative, geospatial_gradient, get_layer, get_layer_heights,
-                        gradient, laplacian, lat_lon_grid_deltas, nearest_intersection_idx,
-                        parse_angle, pressure_to_height_std, reduce_point_density,
-                        resample_nn_1d, second_derivative, vector_derivative)
-from metpy.calc.tools import (_delete_masked_points, _get_bound_pressure_height,
-                              _greater_or_close, _less_or_close, _next_non_masked_element,
-                              _remove_nans, azimuth_range_to_lat_lon, BASE_DEGREE_MULTIPLIER,
-                              DIR_STRS, nominal_lat_lon_grid_deltas, parse_grid_arguments, UND)
+                        gradient, laplacian, lat_lon_grid_deltas, LayerIndex,
+                        nearest_intersection_idx, parse_angle, pressure_to_height_std,
+                        reduce_point_density, resample_nn_1d, second_derivative,
+                        vector_derivative)
+from metpy.calc.tools import (_azimuth_range_to_lat_lon_cached, _delete_masked_points,
+                              _get_bound_pressure_height, _greater_or_close, _less_or_close,
+                              _next_non_masked_element, _remove_nans, azimuth_range_to_lat_lon,
+                              BASE_DEGREE_MULTIPLIER, DIR_STRS, nominal_lat_lon_grid_deltas,
+                              parse_grid_arguments, UND)
 from metpy.testing import (assert_almost_equal, assert_array_almost_equal, assert_array_equal,
                            get_test_data)
 from metpy.units import units
@@ -64,6 +66,38 @@ def test_find_intersections(direction, expected):
     assert_array_almost_equal(y_int, expected[1], 2)
 
 
+@pytest.mark.parametrize('direction', ['all', 'increasing', 'decreasing'])
+@pytest.mark.parametrize('log_x', [False, True])
+def test_find_intersections_grid(direction, log_x):
+    """Test finding intersections for many columns at once matches each column."""
+    rng = np.random.default_rng(20240521)
+    x = np.linspace(1000, 100, 14) * units.hPa
+    a = rng.normal(0, 2, (3, 4, 14)) * units.degC
+    a[0, 0] = [0, 3, 2, 1, -1, 2, 2, 0, 1, 0, 0, -2, 2, 0] * units.degC
+    a[0, 1] = 5 * units.degC
+    b = np.zeros(a.shape) * units.degC
+
+    x_int, y_int = find_intersections(x, a, b, direction=direction, log_x=log_x,
+                                      vertical_dim=-1)
+    for index in np.ndindex(a.shape[:-1]):
+        x_truth, y_truth = find_intersections(x, a[index], b[index], direction=direction,
+                                              log_x=log_x)
+        assert_array_almost_equal(x_int[index].m.compressed(), x_truth.m, 6)
+        assert_array_almost_equal(y_int[index].m.compressed(), y_truth.m, 6)
+    assert x_int.units == units.hPa
+    assert y_int.units == units.degC
+    assert np.all(x_int.m.mask[0, 1])
+
+
+def test_find_intersections_grid_missing():
+    """Test that intersections for gridded data next to missing values are ignored."""
+    x = np.arange(5.)
+    a = np.array([[-1., 1., np.nan, -1., -1.], [-1., 1., 1., 1., -1.]]).T
+    x_int, _ = find_intersections(x, a, np.zeros_like(a))
+    assert_array_equal(x_int.mask, [[False, False], [True, False]])
+    assert_array_almost_equal(x_int.compressed(), [0.5, 0.5, 3.5])
+
+
 def test_find_intersections_no_intersections():
     """Test finding the intersection of two curves with no intersections."""
     x = np.linspace(5, 30, 17)
@@ -202,6 +236,33 @@ def test_reduce_point_density_1d():
                        np.array([1, 0, 1, 1, 0, 0], dtype=bool))
 
 
+@pytest.mark.parametrize('priority', [False, True])
+@pytest.mark.parametrize('radius', [0.5, 1, 3])
+def test_reduce_point_density_many(radius, priority):
+    r"""Test reduce_point_density against checking many points one at a time."""
+    rng = np.random.default_rng(20240605)
+    points = np.concatenate([rng.uniform(0, 20, size=(1500, 2)),
+                             np.stack(np.meshgrid(np.arange(10.), np.arange(10.)), axis=-1)
+                             .reshape(-1, 2)])
+    points[::97, 1] = np.nan
+    key = rng.integers(0, 10, len(points)) if priority else None
+
+    truth = np.zeros(len(points), dtype=bool)
+    for ind in range(len(points)) if key is None else np.argsort(key)[::-1]:
+        dist = np.hypot(*(points[truth] - points[ind]).T)
+        truth[ind] = np.isfinite(points[ind]).all() and not np.any(dist <= radius)
+
+    assert_array_equal(reduce_point_density(points, radius, key), truth)
+
+
+def test_reduce_point_density_cache(thin_point_data):
+    r"""Test that cached results from reduce_point_density match and are not shared."""
+    first = reduce_point_density(thin_point_data * units.dam, 0.3 * units.dam, cache=True)
+    first[:] = False
+    second = reduce_point_density(thin_point_data * units.dam, 3 * units.m, cache=True)
+    assert_array_equal(second, reduce_point_density(thin_point_data, 0.3))
+
+
 def test_delete_masked_points():
     """Test deleting masked points."""
     a = ma.masked_array(np.arange(5), mask=[False, True, False, False, False])
@@ -479,6 +540,121 @@ def test_get_layer_heights_agl_bottom_no_interp():
     assert_array_almost_equal(data_true, data, 6)
 
 
+@pytest.fixture()
+def layer_grid():
+    """Create a small grid of soundings for testing gridded layers."""
+    rng = np.random.default_rng(20240517)
+    pressure = (np.linspace(1000, 200, 20)[:, None, None]
+                - rng.uniform(0, 40, (1, 3, 4))) * units.hPa
+    height = np.cumsum(rng.uniform(300, 700, (20, 3, 4)), axis=0) * units.m
+    temperature = (np.linspace(300, 220, 20)[:, None, None]
+                   + rng.normal(0, 1, (20, 3, 4))) * units.kelvin
+    return pressure, height, temperature
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'depth': 250 * units.hPa},
+    {'bottom': 900. * units.hPa, 'depth': 3. * units.km},
+    {'bottom': 1. * units.km, 'depth': 150. * units.hPa, 'height': True}
+])
+def test_get_layer_grid(layer_grid, kwargs):
+    """Test that get_layer on a grid matches each of its profiles."""
+    pressure, height, temperature = layer_grid
+    grid_kwargs = {key: height[::-1] if key == 'height' else value
+                   for key, value in kwargs.items()}
+    p_layer, t_layer = get_layer(pressure[::-1], temperature[::-1], **grid_kwargs)
+    for index in np.ndindex(pressure.shape[1:]):
+        column = (slice(None), *index)
+        column_kwargs = {key: height[column] if key == 'height' else value
+                         for key, value in kwargs.items()}
+        p_truth, t_truth = get_layer(pressure[column], temperature[column], **column_kwargs)
+        assert_array_almost_equal(p_layer[column].m.compressed()[::-1], p_truth.m, 6)
+        assert_array_almost_equal(t_layer[column].m.compressed()[::-1], t_truth.m, 6)
+
+
+def test_get_layer_grid_vertical_dim(layer_grid):
+    """Test get_layer on a grid with a shared pressure profile and per-column bottom."""
+    _, _, temperature = layer_grid
+    pressure = np.linspace(1000, 200, 20) * units.hPa
+    bottom = np.linspace(990, 880, 12).reshape(3, 4) * units.hPa
+    p_layer, t_layer = get_layer(pressure, np.moveaxis(temperature, 0, -1), bottom=bottom,
+                                 vertical_dim=-1)
+    assert t_layer.shape == (3, 4, 20)
+    for index in np.ndindex(bottom.shape):
+        p_truth, t_truth = get_layer(pressure, temperature[(slice(None), *index)],
+                                     bottom=bottom[index])
+        assert_array_almost_equal(p_layer[index].m.compressed(), p_truth.m, 6)
+        assert_array_almost_equal(t_layer[index].m.compressed(), t_truth.m, 6)
+
+
+def test_get_layer_grid_no_interpolation(layer_grid):
+    """Test get_layer on a grid without interpolation keeps only levels in the layer."""
+    pressure, _, temperature = layer_grid
+    p_layer, t_layer = get_layer(pressure, temperature, bottom=950 * units.hPa,
+                                 depth=300 * units.hPa, interpolate=False)
+    inside = (pressure <= 950 * units.hPa) & (pressure >= 650 * units.hPa)
+    assert_array_equal(p_layer.m.mask, ~inside)
+    assert_array_equal(t_layer[inside], temperature[inside])
+
+
+def test_get_layer_grid_outside_data(layer_grid):
+    """Test that columns of get_layer on a grid outside of the data are masked."""
+    pressure, _, temperature = layer_grid
+    _, t_layer = get_layer(pressure, temperature, bottom=980 * units.hPa)
+    below = pressure[0] < 980 * units.hPa
+    assert np.any(below)
+    assert np.all(t_layer.m.mask[:, below])
+    assert not np.any(np.all(t_layer.m.mask[:, ~below], axis=0))
+
+
+def test_get_layer_heights_grid(layer_grid):
+    """Test that get_layer_heights on a grid matches each of its profiles."""
+    _, height, temperature = layer_grid
+    h_layer, t_layer = get_layer_heights(height, 2. * units.km, temperature,
+                                         bottom=500. * units.m, with_agl=True)
+    for index in np.ndindex(height.shape[1:]):
+        column = (slice(None), *index)
+        h_truth, t_truth = get_layer_heights(height[column], 2. * units.km,
+                                             temperature[column], bottom=500. * units.m,
+                                             with_agl=True)
+        assert_array_almost_equal(h_layer[column].m.compressed(), h_truth.m, 6)
+        assert_array_almost_equal(t_layer[column].m.compressed(), t_truth.m, 6)
+
+
+def test_layer_index_reductions(layer_grid):
+    """Test that the reductions of LayerIndex match integrals over the layer."""
+    pressure, height, temperature = layer_grid
+    layer = LayerIndex(pressure, height=height, bottom=2 * units.km, depth=300 * units.hPa)
+    p_layer, t_layer = layer.clip(temperature)
+    assert p_layer.shape == t_layer.shape == (3, 4, 20)
+
+    integral, = layer.integrate(temperature)
+    assert_array_almost_equal(integral, np.trapz(t_layer, p_layer, axis=-1), 6)
+
+    average, = layer.average(temperature)
+    assert_array_almost_equal(average, integral / (p_layer[..., -1] - p_layer[..., 0]), 6)
+
+    # Applying the same layer again reuses the weights
+    doubled, = layer.average(2 * temperature)
+    assert_array_almost_equal(doubled, 2 * average, 6)
+
+    mean, = layer.mean_pressure_weighted(temperature)
+    assert_array_almost_equal(
+        mean, np.trapz(t_layer * p_layer, p_layer, axis=-1)
+        / np.trapz(p_layer, p_layer, axis=-1), 6)
+
+
+def test_layer_index_heights_mean_pressure_weighted(layer_grid):
+    """Test that a layer found by height does not support pressure-weighted means."""
+    _, height, temperature = layer_grid
+    layer = LayerIndex.from_heights(height, 1 * units.km)
+    average, = layer.average(temperature)
+    _, t_layer = get_layer_heights(height[:, 0, 0], 1 * units.km, temperature[:, 0, 0])
+    assert average[0, 0] > t_layer.min()
+    with pytest.raises(ValueError):
+        layer.mean_pressure_weighted(temperature)
+
+
 def test_lat_lon_grid_deltas_1d():
     """Test for lat_lon_grid_deltas for variable grid."""
     lat = np.arange(40, 50, 2.5)
@@ -778,6 +954,19 @@ def test_parse_angles_series():
     assert_array_almost_equal(calculated_angles, expected_angles)
 
 
+def test_parse_angles_2d():
+    """Test a 2D array of repeated directions to parse."""
+    angles = np.array([['N', 'south'], ['N', None], ['bad', 'south']], dtype=object)
+    expected_angles = np.array([[0, 180], [0, np.nan], [np.nan, 180]]) * units.degree
+    calculated_angles = parse_angle(angles)
+    assert_array_almost_equal(calculated_angles, expected_angles)
+
+
+def test_parse_angles_single_element():
+    """Test a list with one direction to parse."""
+    assert_array_almost_equal(parse_angle(['NE']), [45] * units.degree)
+
+
 def test_parse_angles_single():
     """Test single input into `parse_angles`."""
     calculated_angle = parse_angle('SOUTH SOUTH EAST')
@@ -844,6 +1033,16 @@ def test_bounding_indices_above():
     assert_array_equal(good, np.array([[True, False], [False, True]]))
 
 
+def test_bounding_indices_masked_1d():
+    """Test finding bounding indices in a single masked column."""
+    data = np.ma.array([1, 2, 3, 4, 3, 2], mask=[False, False, True, False, False, False])
+    above, below, good = find_bounding_indices(data, [1.5, 2.5, 5], axis=0)
+
+    assert_array_equal(above[0], np.array([1, 5, 0]))
+    assert_array_equal(below[0], np.array([0, 4, -1]))
+    assert_array_equal(good, np.array([True, True, False]))
+
+
 def test_angle_to_direction():
     """Test single angle in degree."""
     expected_dirs = DIR_STRS[:-1]  # UND at -1
@@ -941,6 +1140,15 @@ def test_angle_to_direction_ndarray():
     assert_array_equal(output_dirs, expected_dirs)
 
 
+def test_angle_to_direction_roundtrip():
+    """Test that directions from angles parse back to the rounded angles."""
+    angles = np.array([[0, 11, 12, 190], [355, 404, -5, np.nan]]) * units.degree
+    output_dirs = angle_to_direction(angles, full=True)
+    assert output_dirs.shape == (2, 4)
+    expected_angles = np.array([[0, 0, 22.5, 180], [0, 45, np.nan, np.nan]]) * units.degree
+    assert_array_almost_equal(parse_angle(output_dirs), expected_angles)
+
+
 def test_azimuth_range_to_lat_lon():
     """Test conversion of azimuth and range to lat/lon grid."""
     az = [332.2403, 334.6765, 337.2528, 339.73846, 342.26257]
@@ -1004,6 +1212,35 @@ def test_azimuth_range_to_lat_lon_diff_ellps():
     assert_array_almost_equal(output_lat, true_lat, 6)
 
 
+def test_azimuth_range_to_lat_lon_approximate():
+    """Test the analytic approximation of locations on an ellipsoid."""
+    az = np.linspace(0, 359, 360) * units.degrees
+    rng = np.linspace(2125, 460000, 50) * units.meters
+    clon = -89.98416666666667
+    clat = 32.27972222222222
+    geod = Geod(ellps='WGS84')
+    exact = azimuth_range_to_lat_lon(az, rng, clon, clat, geod)
+    approx = azimuth_range_to_lat_lon(az, rng, clon, clat, geod, approximate=True)
+    _, _, error = geod.inv(*exact, *approx)
+    assert np.all(error <= 0.0035 * rng.m)
+
+
+def test_azimuth_range_to_lat_lon_cache():
+    """Test that cached locations match and are not changed through returned arrays."""
+    az = [332.2403, 334.6765, 337.2528, 339.73846, 342.26257] * units.degrees
+    rng = [2125., 64625., 127125., 189625., 252125., 314625.] * units.meters
+    clon = -89.98416666666667
+    clat = 32.27972222222222
+    truth = azimuth_range_to_lat_lon(az, rng, clon, clat, Geod(ellps='WGS84'))
+    lon, lat = azimuth_range_to_lat_lon(az, rng, clon, clat, Geod(ellps='WGS84'), cache=True)
+    lon[:] = 0
+    cached = azimuth_range_to_lat_lon(az, rng, clon, clat, Geod(ellps='WGS84'), cache=True)
+    assert_array_equal(cached[0], truth[0])
+    assert_array_equal(cached[1], truth[1])
+    assert_array_equal(lat, truth[1])
+    assert _azimuth_range_to_lat_lon_cached.cache_info().hits >= 1
+
+
 def test_3d_gradient_3d_data_no_axes(deriv_4d_data):
     """Test 3D gradient with 3D data and no axes parameter."""
     test = deriv_4d_data[0]
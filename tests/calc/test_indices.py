@@ -11,12 +11,24 @@ import xarray as xr
 
 from metpy.calc import (bulk_shear, bunkers_storm_motion, corfidi_storm_motion, critical_angle,
                         mean_pressure_weighted, precipitable_water, significant_tornado,
-                        supercell_composite, weighted_continuous_average)
+                        supercell_composite, weighted_continuous_average, wind_components)
 from metpy.testing import (assert_almost_equal, assert_array_almost_equal, get_upper_air_data,
                            version_check)
 from metpy.units import concatenate, units
 
 
+@pytest.fixture
+def grid_sounding():
+    """Create a small grid of random soundings for testing gridded calculations."""
+    rng = np.random.default_rng(20240503)
+    pressure = (np.linspace(1000, 150, 25)[:, None, None]
+                - rng.uniform(0, 80, (1, 3, 4))) * units.hPa
+    height = np.cumsum(rng.uniform(300, 700, (25, 3, 4)), axis=0) * units.m
+    u = rng.normal(10, 8, (25, 3, 4)) * units('m/s')
+    v = rng.normal(5, 8, (25, 3, 4)) * units('m/s')
+    return pressure, height, u, v
+
+
 def test_precipitable_water():
     """Test precipitable water with observed sounding."""
     data = get_upper_air_data(datetime(2016, 5, 22, 0), 'DDC')
@@ -285,6 +297,117 @@ def test_bulk_shear_elevated():
     assert_almost_equal(v, truth[1], 8)
 
 
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'depth': 3000 * units.m},
+    {'with_height': True, 'depth': 6000 * units.m},
+    {'with_height': True, 'bottom': 900 * units.hPa, 'depth': 200 * units.hPa},
+    {'with_height': True, 'bottom': 2000. * units.m, 'depth': 3000 * units.m}
+])
+def test_bulk_shear_grid(grid_sounding, kwargs):
+    """Test bulk shear calculated for every column of a grid matches that of each profile."""
+    pressure, height, u, v = grid_sounding
+    kwargs = kwargs.copy()
+    with_height = kwargs.pop('with_height', False)
+
+    u_shr, v_shr = bulk_shear(pressure, u, v, height=height if with_height else None,
+                              **kwargs)
+
+    for j, i in np.ndindex(3, 4):
+        truth = bulk_shear(pressure[:, j, i], u[:, j, i], v[:, j, i],
+                           height=height[:, j, i] if with_height else None, **kwargs)
+        assert_almost_equal(u_shr[j, i], truth[0], 8)
+        assert_almost_equal(v_shr[j, i], truth[1], 8)
+
+
+@pytest.mark.parametrize('func', [mean_pressure_weighted, weighted_continuous_average])
+def test_layer_averages_grid(grid_sounding, func):
+    """Test layer averages of gridded data with per-column bottoms match those of profiles."""
+    pressure, height, u, v = grid_sounding
+    bottom = height[0] + np.linspace(0, 2000, 4) * units.m
+
+    u_mean, v_mean = func(pressure, u, v, height=height, bottom=bottom,
+                          depth=3000 * units.m)
+
+    for j, i in np.ndindex(3, 4):
+        truth = func(pressure[:, j, i], u[:, j, i], v[:, j, i], height=height[:, j, i],
+                     bottom=bottom[j, i], depth=3000 * units.m)
+        assert_almost_equal(u_mean[j, i], truth[0], 8)
+        assert_almost_equal(v_mean[j, i], truth[1], 8)
+
+
+def test_precipitable_water_grid():
+    """Test precipitable water for gridded data against each of its profiles."""
+    data = get_upper_air_data(datetime(2016, 5, 22, 0), 'DDC')
+    inds = data['pressure'] >= 400 * units.hPa
+    pressure = data['pressure'][inds]
+    dewpoint = data['dewpoint'][inds][:, None] + np.array([0, -5, 3]) * units.delta_degC
+    top = np.array([400, 500, 700]) * units.hPa
+
+    pw = precipitable_water(pressure, dewpoint, top=top)
+
+    for i in range(3):
+        truth = precipitable_water(pressure, dewpoint[:, i], top=top[i])
+        assert_almost_equal(pw[i], truth, 6)
+
+
+def test_bunkers_motion_grid(grid_sounding):
+    """Test Bunkers storm motion for gridded data with the vertical axis last and top-down."""
+    pressure, height, u, v = grid_sounding
+
+    motions = bunkers_storm_motion(*(np.moveaxis(arr[::-1], 0, -1)
+                                     for arr in (pressure, u, v, height)), vertical_dim=-1)
+
+    for j, i in np.ndindex(3, 4):
+        truth = bunkers_storm_motion(pressure[:, j, i], u[:, j, i], v[:, j, i],
+                                     height[:, j, i])
+        for motion, motion_truth in zip(motions, truth):
+            assert_array_almost_equal(motion[:, j, i], motion_truth, 8)
+
+
+def test_bunkers_motion_grid_too_shallow(grid_sounding):
+    """Test that gridded Bunkers storm motion is NaN for columns not reaching 6 km."""
+    pressure, height, u, v = grid_sounding
+
+    right_mover, _, _ = bunkers_storm_motion(pressure[:13], u[:13], v[:13], height[:13])
+
+    too_shallow = height[12] - height[0] < 6 * units.km
+    assert np.all(np.isnan(right_mover[:, too_shallow]))
+    assert not np.any(np.isnan(right_mover[:, ~too_shallow]))
+
+
+@pytest.mark.parametrize('llj', [False, True])
+def test_corfidi_motion_grid(grid_sounding, llj):
+    """Test Corfidi storm motion for gridded data matches that of each profile."""
+    pressure, _, u, v = grid_sounding
+    u_llj, v_llj = ([5, 10, 15, 20] * units('m/s'), -10 * units('m/s')) if llj else (None,
+                                                                                       None)
+
+    upwind, downwind = corfidi_storm_motion(pressure[:20], u[:20], v[:20], u_llj=u_llj,
+                                            v_llj=v_llj)
+
+    for j, i in np.ndindex(3, 4):
+        truth = corfidi_storm_motion(pressure[:20, j, i], u[:20, j, i], v[:20, j, i],
+                                     u_llj=u_llj[i] if llj else None, v_llj=v_llj)
+        assert_array_almost_equal(upwind[:, j, i], truth[0], 8)
+        assert_array_almost_equal(downwind[:, j, i], truth[1], 8)
+
+
+def test_bulk_shear_grid_1d_pressure():
+    """Test gridded bulk shear with a shared, top-down pressure coordinate."""
+    pressure = np.array([1000, 925, 850, 700, 500]) * units.hPa
+    wdir = np.array([165, 180, 190, 210, 220]) * units.degree
+    speed = np.array([5, 15, 20, 30, 50]) * units.knots
+    u, v = wind_components(speed, wdir)
+    u = np.stack([u, 2 * u])[:, ::-1]
+    v = np.stack([v, 2 * v])[:, ::-1]
+
+    u_shr, v_shr = bulk_shear(pressure[::-1], u, v, vertical_dim=1)
+
+    assert_array_almost_equal(u_shr, [2.41943319, 4.83886638] * units.knots, 6)
+    assert_array_almost_equal(v_shr, [11.6920573, 23.3841146] * units.knots, 6)
+
+
 def test_supercell_composite():
     """Test supercell composite function."""
     mucape = [2000., 1000., 500., 2000.] * units('J/kg')
@@ -652,6 +652,56 @@ def test_storm_relative_helicity_masked():
     assert not np.ma.is_masked(com)
 
 
+def test_storm_relative_helicity_grid():
+    """Test storm relative helicity calculated for every column of a grid."""
+    rng = np.random.default_rng(20240502)
+    heights = (np.cumsum(rng.uniform(100, 500, (20, 3, 4)), axis=0)
+               + rng.uniform(0, 300, (1, 3, 4))) * units.m
+    u = rng.normal(10, 8, (20, 3, 4)) * units('m/s')
+    v = rng.normal(5, 8, (20, 3, 4)) * units('m/s')
+    storm_u = rng.normal(5, 3, (3, 4)) * units('m/s')
+    storm_v = rng.normal(5, 3, (3, 4)) * units('m/s')
+
+    pos_srh, neg_srh, total_srh = storm_relative_helicity(
+        heights, u, v, depth=3 * units.km, bottom=250 * units.m, storm_u=storm_u,
+        storm_v=storm_v)
+
+    for j, i in np.ndindex(3, 4):
+        truth = storm_relative_helicity(heights[:, j, i], u[:, j, i], v[:, j, i],
+                                        depth=3 * units.km, bottom=250 * units.m,
+                                        storm_u=storm_u[j, i], storm_v=storm_v[j, i])
+        assert_almost_equal(pos_srh[j, i], truth[0], 8)
+        assert_almost_equal(neg_srh[j, i], truth[1], 8)
+        assert_almost_equal(total_srh[j, i], truth[2], 8)
+
+
+def test_storm_relative_helicity_grid_vertical_dim():
+    """Test gridded storm relative helicity with a descending, non-leading vertical axis."""
+    heights = np.array([0, 250, 500, 750])[::-1] * units.m
+    u = np.array([[5, 25, 15, 5], [0, 20, 10, 0]])[:, ::-1] * units('m/s')
+    v = np.array([[30, 10, 10, 20], [20, 0, 0, 10]])[:, ::-1] * units('m/s')
+
+    pos_srh, neg_srh, total_srh = storm_relative_helicity(
+        np.broadcast_to(heights, u.shape), u, v, depth=750 * units.m,
+        storm_u=[5, 0] * units('m/s'), storm_v=[10, 0] * units('m/s'), vertical_dim=1)
+
+    assert_array_almost_equal(pos_srh, [400., 400.] * units('m^2/s^2'), 6)
+    assert_array_almost_equal(neg_srh, [-100., -100.] * units('m^2/s^2'), 6)
+    assert_array_almost_equal(total_srh, [300., 300.] * units('m^2/s^2'), 6)
+
+
+def test_storm_relative_helicity_grid_outside_data():
+    """Test that gridded storm relative helicity is NaN where the layer exceeds the data."""
+    heights = np.array([[0, 250, 500, 750], [0, 500, 1000, 1500]]).T * units.m
+    u = np.array([[0, 20, 10, 0], [0, 20, 10, 0]]).T * units('m/s')
+    v = np.array([[20, 0, 0, 10], [20, 0, 0, 10]]).T * units('m/s')
+
+    _, _, total_srh = storm_relative_helicity(heights, u, v, depth=1 * units.km)
+
+    assert np.isnan(total_srh[0])
+    assert_almost_equal(total_srh[1], 400. * units('m^2/s^2'), 6)
+
+
 def test_absolute_vorticity_asym():
     """Test absolute vorticity calculation with a complicated field."""
     u = np.array([[2, 4, 8], [0, 2, 2], [4, 6, 8]]) * units('m/s')
@@ -1015,6 +1065,40 @@ def test_potential_vorticity_baroclinic_4d(data_4d):
     assert_array_almost_equal(pvor, truth, 10)
 
 
+@pytest.mark.parametrize('slab_size', [1, 2, 5])
+def test_potential_vorticity_baroclinic_slab_size(slab_size):
+    """Test that computing PV in slabs along time matches the full calculation."""
+    rng = np.random.default_rng(20240501)
+    shape = (3, 4, 5, 6)
+    theta = (300 + 5 * np.arange(4)[:, None, None] + rng.random(shape)) * units.kelvin
+    pressure = np.linspace(1000, 700, 4)[None, :, None, None] * units.hPa
+    u = rng.normal(10, 5, shape) * units('m/s')
+    v = rng.normal(0, 5, shape) * units('m/s')
+    lats = np.linspace(30, 35, 5)[:, None] * np.ones((5, 6)) * units.degrees
+    dx = np.linspace(9e3, 11e3, 5)[None, None, :, None] * np.ones((5, 5)) * units.m
+    dy = 10 * units.km
+
+    truth = potential_vorticity_baroclinic(theta, pressure, u, v, dx, dy, lats)
+    pvor = potential_vorticity_baroclinic(theta, pressure, u, v, dx, dy, lats,
+                                          slab_size=slab_size)
+
+    assert pvor.units == truth.units
+    assert_array_almost_equal(pvor, truth, 10)
+
+
+@pytest.mark.parametrize('slab_size', [0, -1, 1.5])
+def test_potential_vorticity_baroclinic_bad_slab_size(slab_size):
+    """Test that a slab size that is not a positive integer raises an error."""
+    theta = np.full((2, 3, 4, 4), 300.) * units.kelvin
+    pressure = np.linspace(1000, 800, 3)[None, :, None, None] * units.hPa
+    wind = np.zeros((2, 3, 4, 4)) * units('m/s')
+
+    with pytest.raises(ValueError, match='slab_size'):
+        potential_vorticity_baroclinic(theta, pressure, wind, wind, 10 * units.km,
+                                       10 * units.km, 30 * units.degrees,
+                                       slab_size=slab_size)
+
+
 def test_potential_vorticity_barotropic(pv_data):
     """Test the barotopic (Rossby) potential vorticity."""
     u, v, lats, _, dx, dy = pv_data
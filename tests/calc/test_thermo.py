@@ -17,9 +17,10 @@ from metpy.calc import (brunt_vaisala_frequency, brunt_vaisala_frequency_squared
                         downdraft_cape, dry_lapse, dry_static_energy, el,
                         equivalent_potential_temperature, exner_function,
                         gradient_richardson_number, InvalidSoundingError,
-                        isentropic_interpolation, isentropic_interpolation_as_dataset, k_index,
-                        lcl, lfc, lifted_index, mixed_layer, mixed_layer_cape_cin,
-                        mixed_parcel, mixing_ratio, mixing_ratio_from_relative_humidity,
+                        isentropic_interpolation, isentropic_interpolation_as_dataset,
+                        IsentropicPlan, k_index, lcl, lfc, lifted_index, mixed_layer,
+                        mixed_layer_cape_cin, mixed_parcel, mixing_ratio,
+                        mixing_ratio_from_relative_humidity,
                         mixing_ratio_from_specific_humidity, moist_lapse, moist_static_energy,
                         most_unstable_cape_cin, most_unstable_parcel, parcel_profile,
                         parcel_profile_with_lcl, parcel_profile_with_lcl_as_dataset,
@@ -38,8 +39,8 @@ from metpy.calc import (brunt_vaisala_frequency, brunt_vaisala_frequency_squared
                         virtual_temperature, virtual_temperature_from_dewpoint,
                         wet_bulb_potential_temperature, wet_bulb_temperature)
 from metpy.calc.thermo import _find_append_zero_crossings, galvez_davison_index
-from metpy.testing import (assert_almost_equal, assert_array_almost_equal, assert_nan,
-                           version_check)
+from metpy.testing import (assert_almost_equal, assert_array_almost_equal,
+                           assert_array_equal, assert_nan, version_check)
 from metpy.units import is_quantity, masked_array, units
 
 
@@ -1390,6 +1391,104 @@ def test_isentropic_pressure_4d():
     assert_almost_equal(isentprs[1][:, 1, ], truerh, 3)
 
 
+@pytest.fixture
+def isentropic_grid():
+    """Generate gridded temperature and humidity on pressure levels."""
+    rng = np.random.default_rng(20240226)
+    pressure = np.linspace(1000., 300., 12) * units.hPa
+    temperature = units.Quantity(300 - 0.06 * (1000 - pressure.m[:, None, None])
+                                 + rng.normal(0, 0.3, (12, 6, 7)), 'kelvin')
+    rh = units.Quantity(rng.uniform(0, 100, (12, 6, 7)), 'percent')
+    return pressure, temperature, rh
+
+
+def test_isentropic_plan(isentropic_grid):
+    """Test that the isentropic plan gives the results of isentropic interpolation."""
+    pressure, temperature, rh = isentropic_grid
+    isentlev = [310., 302., 320., 305.5] * units.kelvin
+    truth = isentropic_interpolation(isentlev, pressure, temperature, rh, rh.m,
+                                     temperature_out=True)
+
+    plan = IsentropicPlan(isentlev, pressure, temperature)
+    assert_array_equal(plan.levels, [302., 305.5, 310., 320.] * units.kelvin)
+    assert_array_equal(plan.pressure, truth[0])
+    assert_array_equal(plan.pressure, IsentropicPlan(plan.levels, pressure,
+                                                     temperature).pressure)
+    assert_array_equal(plan.temperature, truth[1])
+
+    rh_interp, rh_mag_interp = plan.interpolate(rh, rh.m)
+    assert_array_equal(rh_interp, truth[2])
+    assert not hasattr(rh_mag_interp, 'units')
+    assert_array_equal(rh_mag_interp, truth[3])
+
+
+@pytest.mark.filterwarnings('ignore:Interpolation point out of data bounds')
+def test_isentropic_plan_p_increase_vertical_dim(isentropic_grid):
+    """Test the isentropic plan with increasing pressure along another dimension."""
+    pressure, temperature, rh = isentropic_grid
+    pressure = np.broadcast_to(pressure[::-1, None, None], (12, 6, 7)).transpose(1, 0, 2)
+    temperature = temperature[::-1].transpose(1, 0, 2)
+    rh = rh[::-1].transpose(1, 0, 2)
+    isentlev = [290., 305., 350.] * units.kelvin
+    truth = isentropic_interpolation(isentlev, pressure, temperature, rh, vertical_dim=1)
+
+    plan = IsentropicPlan(isentlev, pressure, temperature, vertical_dim=1)
+    assert_array_equal(plan.pressure, truth[0])
+    assert_array_equal(plan.interpolate(rh)[0], truth[1])
+    assert np.isnan(truth[1][:, 0]).all()
+
+
+@pytest.mark.filterwarnings('ignore:Interpolation point out of data bounds')
+def test_isentropic_interpolation_dask(isentropic_grid):
+    """Test isentropic interpolation of Dask arrays a chunk at a time."""
+    da = pytest.importorskip('dask.array')
+    pressure, temperature, rh = isentropic_grid
+    isentlev = [290., 305., 310.] * units.kelvin
+    truth = isentropic_interpolation(isentlev, pressure, temperature, rh,
+                                     temperature_out=True)
+
+    temperature = units.Quantity(da.from_array(temperature.m, chunks=(4, 3, 7)), 'kelvin')
+    rh = units.Quantity(da.from_array(rh.m, chunks=(12, 2, 7)), 'percent')
+    result = isentropic_interpolation(isentlev, pressure, temperature, rh,
+                                      temperature_out=True)
+    for value, truth_value in zip(result, truth):
+        assert isinstance(value.magnitude, da.Array)
+        assert value.units == truth_value.units
+        assert_almost_equal(value.m.compute(), truth_value.m, 10)
+
+
+@pytest.mark.filterwarnings('ignore:Interpolation point out of data bounds')
+def test_isentropic_interpolation_dask_3d_pressure(isentropic_grid):
+    """Test Dask arrays chunked horizontally with pressure that varies between columns."""
+    da = pytest.importorskip('dask.array')
+    _, temperature, rh = isentropic_grid
+    surface = np.linspace(950., 1050., 7) + np.linspace(0., 30., 6)[:, None]
+    pressure = units.Quantity(np.linspace(1., 0.3, 12)[:, None, None] * surface, 'hPa')
+
+    # Make the top level lie above the data in some chunks but not others
+    temperature = temperature + units.Quantity(np.arange(7) * 2., 'delta_degC')
+    theta = potential_temperature(pressure, temperature)
+    isentlev = units.Quantity([296., 300., np.max(theta[..., -1].m) - 0.5], 'kelvin')
+    truth = isentropic_interpolation(isentlev, pressure, temperature, rh)
+
+    result = isentropic_interpolation(
+        isentlev, units.Quantity(da.from_array(pressure.m, chunks=(12, 3, 2)), 'hPa'),
+        units.Quantity(da.from_array(temperature.m, chunks=(12, 3, 2)), 'kelvin'), rh)
+    for value, truth_value in zip(result, truth):
+        assert_array_equal(np.isnan(value.m.compute()), np.isnan(truth_value.m))
+        assert_almost_equal(value.m.compute(), truth_value.m, 10)
+
+
+def test_isentropic_interpolation_dask_out_of_bounds(isentropic_grid):
+    """Test that levels above all of the data raise an error before computing."""
+    da = pytest.importorskip('dask.array')
+    pressure, temperature, _ = isentropic_grid
+    temperature = units.Quantity(da.from_array(temperature.m, chunks=(4, 3, 7)), 'kelvin')
+
+    with pytest.raises(ValueError, match='out of data bounds'):
+        isentropic_interpolation([1000.] * units.kelvin, pressure, temperature)
+
+
 @pytest.fixture
 def xarray_isentropic_data():
     """Generate test xarray dataset for interpolation functions."""
@@ -1685,6 +1784,18 @@ def test_mixed_layer():
     assert_almost_equal(mixed_layer_temperature, 16.4024930 * units.degC, 6)
 
 
+def test_mixed_layer_grid():
+    """Test the mixed layer calculation for gridded data with a shared pressure profile."""
+    pressure = np.array([959., 779.2, 751.3, 724.3, 700., 269.]) * units.hPa
+    temperature = np.array([22.2, 14.6, 12., 9.4, 7., -38.]) * units.degC
+    offsets = np.array([[0., -2.], [1., 3.]]) * units.delta_degC
+    grid = temperature[None, None, :] + offsets[..., None]
+    mixed_layer_temperature = mixed_layer(pressure, grid, depth=250 * units.hPa,
+                                          vertical_dim=-1)[0]
+    assert_array_almost_equal(mixed_layer_temperature,
+                              16.4024930 * units.degC + offsets, 6)
+
+
 def test_dry_static_energy():
     """Test the dry static energy calculation."""
     dse = dry_static_energy(1000 * units.m, 25 * units.degC)
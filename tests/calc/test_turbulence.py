@@ -7,7 +7,9 @@ import numpy as np
 from numpy.testing import assert_almost_equal, assert_array_equal
 import pytest
 
-from metpy.calc.turbulence import friction_velocity, get_perturbation, kinematic_flux, tke
+from metpy.calc.turbulence import (friction_velocity, get_perturbation, kinematic_flux, tke,
+                                   TurbulenceWindows)
+from metpy.units import units
 
 
 #
@@ -400,3 +402,52 @@ def test_u_star_2d_axis_first_nonzero_mean(uvw_and_known_u_star_nonzero_mean):
                         axis=0), u_star_true['uw'])
     assert_almost_equal(friction_velocity(u, w, v=v, perturbation=False,
                         axis=0), u_star_true['uwvw'])
+
+
+#
+# Windowed statistics tests
+#
+@pytest.mark.parametrize('step', [None, 250])
+def test_turbulence_windows(step):
+    """Test that windowed statistics from chunks match those of each window."""
+    rng = np.random.default_rng(20240601)
+    u, v, w = rng.normal(loc=[[[5]], [[2]], [[0]]], size=(3, 2, 5000))
+    temp = rng.normal(loc=290, size=(2, 5000))
+
+    windows = TurbulenceWindows(1000, step)
+    chunks = np.cumsum(rng.integers(1, 1500, size=10))
+    stats = [windows.update(*(units.Quantity(var[:, start:stop], unit)
+                              for var, unit in [(u, 'm/s'), (v, 'm/s'), (w, 'm/s'),
+                                                (temp, 'K')]))
+             for start, stop in zip([0, *chunks], [*chunks, 5000])]
+    assert windows.count == 5000
+
+    starts = np.concatenate([s['start'] for s in stats])
+    assert_array_equal(starts, np.arange(0, 4001, step or 1000))
+    for key, func, args, unit in [('tke', tke, (u, v, w), 'm/s'),
+                                  ('friction_velocity', friction_velocity, (u, w, v), 'm/s'),
+                                  ('u_w_flux', kinematic_flux, (u, w), 'm^2/s^2'),
+                                  ('w_scalar_flux', kinematic_flux, (w, temp), 'K m/s')]:
+        truth = np.stack([func(*(var[:, start:start + 1000] for var in args))
+                          for start in starts], axis=-1)
+        assert all(s[key].units == units(unit) for s in stats)
+        assert_almost_equal(np.concatenate([s[key].m for s in stats], axis=-1), truth, 12)
+
+
+def test_turbulence_windows_axis():
+    """Test windowed statistics with time along the first axis and no scalar."""
+    rng = np.random.default_rng(20240602)
+    u, v, w = rng.normal(size=(3, 600, 2))
+
+    windows = TurbulenceWindows(200, axis=0)
+    assert windows.update(u[:150], v[:150], w[:150])['tke'].shape == (2, 0)
+    stats = windows.update(u[150:], v[150:], w[150:])
+    assert 'w_scalar_flux' not in stats
+    assert_almost_equal(stats['tke'].m, tke(u.reshape(3, 200, 2), v.reshape(3, 200, 2),
+                                            w.reshape(3, 200, 2), axis=1).T, 12)
+
+
+def test_turbulence_windows_bad_step():
+    """Test that windows must be a multiple of the step."""
+    with pytest.raises(ValueError):
+        TurbulenceWindows(1000, 300)
@@ -10,10 +10,12 @@ import numpy as np
 from numpy.testing import assert_almost_equal, assert_array_almost_equal, assert_array_equal
 from scipy.spatial import Delaunay
 
-from metpy.interpolate.geometry import (area, circumcenter, circumcircle_radius, dist_2,
-                                        distance, find_local_boundary, find_natural_neighbors,
-                                        find_nn_triangles_point, get_point_count_within_r,
-                                        get_points_within_r, order_edges, triangle_area)
+from metpy.interpolate.geometry import (area, circumcenter, circumcircle_radius, circumcircles,
+                                        dist_2, distance, find_local_boundary,
+                                        find_natural_neighbor_triangles,
+                                        find_natural_neighbors, find_nn_triangles_point,
+                                        get_point_count_within_r, get_points_within_r,
+                                        order_edges, triangle_area)
 
 logging.getLogger('metpy.interpolate.geometry').setLevel(logging.ERROR)
 
@@ -137,6 +139,20 @@ def test_circumcenter():
     assert_array_almost_equal(truth, cc)
 
 
+def test_circumcircles():
+    r"""Test finding the circumcircles of many triangles at once."""
+    triangles = np.array([[[0, 0], [10, 10], [10, 0]],
+                          [[1, 2], [4, -3], [-2, 5]],
+                          [[0, 0], [10, 10], [0, 0]]], dtype=float)
+
+    cc, r = circumcircles(triangles)
+
+    assert_array_almost_equal(cc[:2], [circumcenter(*tri) for tri in triangles[:2]])
+    assert_array_almost_equal(r[:2], [circumcircle_radius(*tri) for tri in triangles[:2]])
+    assert np.isnan(cc[2]).all()
+    assert np.isnan(r[2])
+
+
 def test_find_natural_neighbors():
     r"""Test find natural neighbors function."""
     x = list(range(0, 20, 4))
@@ -169,6 +185,25 @@ def test_find_natural_neighbors():
         assert set(centers_truth[i]) == {tuple(c) for c in tri_info[neighbors[i]]}
 
 
+def test_find_natural_neighbor_triangles():
+    r"""Test finding the natural neighbor triangles of every point as flat arrays."""
+    x = list(range(0, 20, 4))
+    y = list(range(0, 20, 4))
+    gx, gy = np.meshgrid(x, y)
+    pts = np.vstack([gx.ravel(), gy.ravel()]).T
+    tri = Delaunay(pts)
+
+    test_points = np.array([[12, 8], [2, 2], [20, 20], [5, 10]])
+
+    grid, triangles, _ = find_natural_neighbor_triangles(tri, test_points)
+
+    assert_array_equal(grid, [0] * 8 + [1] * 2 + [3] * 2)
+    assert_array_equal(np.diff(triangles[grid == 0]) > 0, True)
+    assert {tuple(v) for v in tri.simplices[triangles[grid == 1]]} == {(1, 5, 0), (5, 1, 6)}
+    assert {tuple(v) for v in tri.simplices[triangles[grid == 3]]} == {(11, 17, 16),
+                                                                        (17, 11, 12)}
+
+
 def test_find_nn_triangles_point():
     r"""Test find natural neighbors for a point function."""
     x = list(range(10))
@@ -10,9 +10,11 @@ import numpy as np
 import pytest
 
 from metpy.cbook import get_test_data
-from metpy.interpolate.grid import (generate_grid, generate_grid_coords, get_boundary_coords,
-                                    get_xy_range, get_xy_steps, interpolate_to_grid,
+from metpy.interpolate.grid import (barnes_to_grid, generate_grid, generate_grid_coords,
+                                    get_boundary_coords, get_xy_range, get_xy_steps,
+                                    interpolate_to_grid, interpolate_to_grid_as_dataset,
                                     interpolate_to_isosurface, inverse_distance_to_grid,
+                                    inverse_distance_to_isobaric_grid,
                                     natural_neighbor_to_grid)
 from metpy.testing import assert_array_almost_equal
 from metpy.units import units
@@ -192,6 +194,38 @@ def test_inverse_distance_to_grid(method, test_data, test_grid):
     assert_array_almost_equal(truth, img)
 
 
+def test_barnes_to_grid(test_data, test_grid):
+    r"""Test multi-pass Barnes analysis to grid function with several variables."""
+    xp, yp, z = test_data
+    xg, yg = test_grid
+
+    truth = inverse_distance_to_grid(xp, yp, z, xg, yg, r=40, kappa=100, kind='barnes')
+    img = barnes_to_grid(xp, yp, np.stack([z, -z], axis=1), xg, yg, r=40, kappa=100,
+                         passes=1)
+
+    assert img.shape == xg.shape + (2,)
+    assert_array_almost_equal(truth, img[..., 0])
+    assert_array_almost_equal(-truth, img[..., 1])
+
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_inverse_distance_to_isobaric_grid(workers, test_data, test_grid):
+    r"""Test 3D inverse distance interpolation matches 2D on the level of the data."""
+    xp, yp, z = test_data
+    xg, yg = test_grid
+    pressure = units.Quantity(np.full(len(xp), 500), 'hPa')
+
+    truth = inverse_distance_to_grid(xp, yp, z, xg, yg, r=40, kappa=100, kind='barnes')
+    img = inverse_distance_to_isobaric_grid(xp, yp, pressure, z, xg, yg,
+                                            units.Quantity([50000, 20000], 'Pa'), r=40,
+                                            vertical_radius=0.1, kappa=100, kind='barnes',
+                                            workers=workers)
+
+    assert img.shape == (2,) + xg.shape
+    assert_array_almost_equal(truth, img[0])
+    assert np.isnan(img[1]).all()
+
 interp_methods = ['natural_neighbor', 'cressman', 'barnes', 'linear', 'nearest', 'rbf',
                   'cubic']
 boundary_types = [{'west': 80.0, 'south': 140.0, 'east': 980.0, 'north': 980.0},
@@ -243,6 +277,45 @@ def test_interpolate_to_isosurface():
     assert_array_almost_equal(truth, dt_theta)
 
 
+@pytest.fixture
+def isosurface_data():
+    """Generate a field increasing upwards and another to interpolate to its isosurfaces."""
+    rng = np.random.default_rng(20240226)
+    level_var = np.cumsum(rng.uniform(0, 1, (10, 6, 7)), axis=0)
+    interp_var = rng.normal(300, 10, (10, 6, 7))
+    return level_var, interp_var
+
+
+@pytest.mark.parametrize('bottom_up_search', [True, False])
+def test_interpolate_to_isosurface_levels(isosurface_data, bottom_up_search):
+    r"""Test interpolation to several levels at once."""
+    level_var, interp_var = isosurface_data
+    levels = np.array([2., -1., 4.5, 20.])
+    result = interpolate_to_isosurface(level_var, interp_var, levels,
+                                       bottom_up_search=bottom_up_search)
+
+    assert result.shape == (4, 6, 7)
+    for level, level_result in zip(levels, result):
+        assert_array_almost_equal(level_result,
+                                  interpolate_to_isosurface(level_var, interp_var, level,
+                                                            bottom_up_search=bottom_up_search))
+    assert_array_almost_equal(result[1], interp_var[-1])
+    assert_array_almost_equal(result[3], interp_var[0])
+
+
+def test_interpolate_to_isosurface_dask(isosurface_data):
+    r"""Test interpolation of Dask arrays to several levels."""
+    da = pytest.importorskip('dask.array')
+    level_var, interp_var = isosurface_data
+    levels = np.array([2., 4.5])
+    result = interpolate_to_isosurface(da.from_array(level_var, chunks=(5, 3, 7)),
+                                       da.from_array(interp_var, chunks=(10, 6, 4)), levels)
+
+    assert isinstance(result, da.Array)
+    assert_array_almost_equal(result.compute(),
+                              interpolate_to_isosurface(level_var, interp_var, levels))
+
+
 @pytest.mark.parametrize('assume_units', [None, 'mbar'])
 @pytest.mark.parametrize('method', interp_methods)
 @pytest.mark.parametrize('boundary_coords', boundary_types)
@@ -285,6 +358,68 @@ def test_interpolate_to_grid(method, assume_units, test_coords, boundary_coords)
     assert_array_almost_equal(truth, img)
 
 
+@pytest.mark.parametrize('method', interp_methods)
+def test_interpolate_to_grid_as_dataset(method, test_coords):
+    r"""Test grid interpolation of many fields, with different missing observations."""
+    xp, yp = test_coords
+    xp = np.append(xp * 10, xp[0] * 10)
+    yp = np.append(yp * 10, yp[0] * 10)
+    z = np.array([0.064, 4.489, 6.241, 0.1, 2.704, 2.809, 9.604, 1.156, 0.225, 3.364, 5.])
+    fields = np.stack([z, z ** 2, -z, z + 1])
+    fields[1, 3] = np.nan
+    fields[3, 3] = np.nan
+    fields[2, 0] = np.nan
+
+    extra_kw = {'hres': 10.121, 'boundary_coords': get_boundary_coords(xp, yp)}
+    if method == 'cressman':
+        extra_kw['search_radius'] = 200
+        extra_kw['minimum_neighbors'] = 1
+    elif method == 'barnes':
+        extra_kw['search_radius'] = 400
+        extra_kw['minimum_neighbors'] = 1
+        extra_kw['gamma'] = 1
+
+    ds = interpolate_to_grid_as_dataset(xp, yp, {'a': units.Quantity(fields, 'degC'),
+                                                 'b': z}, interp_type=method, axis=1,
+                                        dim='time', workers=2, **extra_kw)
+
+    assert ds['a'].dims == ('time', 'y', 'x')
+    assert ds['b'].dims == ('y', 'x')
+    for i, field in enumerate(fields):
+        # The repeated observation is only used when the first is missing
+        keep = ~np.isnan(field)
+        keep[-1] = not keep[0]
+        xg, yg, truth = interpolate_to_grid(xp[keep], yp[keep], field[keep],
+                                            interp_type=method, **extra_kw)
+        assert_array_almost_equal(xg[0], ds['x'])
+        assert_array_almost_equal(yg[:, 0], ds['y'])
+        assert_array_almost_equal(units.Quantity(truth, 'degC'), ds['a'].data[i])
+        if i == 0:
+            assert_array_almost_equal(truth, ds['b'].values)
+
+
+def test_interpolate_to_grid_as_dataset_array(test_coords):
+    r"""Test grid interpolation of an array of fields with observations first."""
+    xp, yp = test_coords
+    z = np.array([0.064, 4.489, 6.241, 0.1, 2.704, 2.809, 9.604, 1.156, 0.225, 3.364])
+
+    ds = interpolate_to_grid_as_dataset(xp, yp, np.stack([z, 2 * z], axis=1), hres=10)
+    _, _, truth = interpolate_to_grid(xp, yp, z, hres=10)
+
+    assert ds['z'].dims == ('field', 'y', 'x')
+    assert_array_almost_equal(truth, ds['z'][0].values)
+    assert_array_almost_equal(2 * truth, ds['z'][1].values)
+
+
+@pytest.mark.parametrize('shape, axis', [((10, 3), 1), ((3, 10), 0)])
+def test_interpolate_to_grid_as_dataset_wrong_axis(test_coords, shape, axis):
+    r"""Test grid interpolation of fields whose observations are not along the axis."""
+    xp, yp = test_coords
+
+    with pytest.raises(ValueError, match='z has 3 observations'):
+        interpolate_to_grid_as_dataset(xp, yp, np.ones(shape), hres=10, axis=axis)
+
+
 def test_interpolate_to_isosurface_from_below():
     r"""Test interpolation to level function."""
     pv = np.array([[[1.75, 1.875, 2., 2.125, 2.25],
@@ -9,9 +9,10 @@ from numpy.testing import assert_almost_equal, assert_array_almost_equal
 import pandas as pd
 import pytest
 
-from metpy.interpolate import (interpolate_to_grid, remove_nan_observations,
+from metpy.interpolate import (interpolate_to_grid, observation_mask, remove_nan_observations,
                                remove_observations_below_value, remove_repeat_coordinates)
 from metpy.interpolate.tools import barnes_weights, calc_kappa, cressman_weights
+from metpy.units import units
 
 
 @pytest.fixture()
@@ -84,6 +85,88 @@ def test_remove_repeat_coordinates(test_coords):
     assert_array_almost_equal(truthz, z_)
 
 
+def test_remove_repeat_coordinates_mean(test_coords):
+    r"""Test remove repeat coordinates function averaging the repeated observations."""
+    x, y = test_coords
+    x[[3, 7]] = x[0]
+    y[[3, 7]] = y[0]
+    x[-1] = x[1]
+    y[-1] = y[1]
+
+    z = np.array(list(range(-10, 10, 2)), dtype=float)
+
+    x_, y_, z_ = remove_repeat_coordinates(x, y, z, aggregate='mean')
+
+    truthx = np.array([8, 67, 79, 52, 53, 98, 15])
+    truthy = np.array([24, 87, 48, 98, 66, 14, 60])
+    truthz = np.array([-10 / 3, 0, -6, -2, 0, 2, 6])
+
+    assert_array_almost_equal(truthx, x_)
+    assert_array_almost_equal(truthy, y_)
+    assert_array_almost_equal(truthz, z_)
+
+
+@pytest.mark.parametrize('aggregate', ['first', 'mean'])
+def test_remove_repeat_coordinates_list(aggregate):
+    r"""Test remove repeat coordinates function with lists as input."""
+    x_, y_, z_ = remove_repeat_coordinates([1, 2, 1], [1, 2, 1], [5, 6, 7],
+                                           aggregate=aggregate)
+
+    assert_array_almost_equal(x_, [1, 2])
+    assert_array_almost_equal(y_, [1, 2])
+    assert_array_almost_equal(z_, [5, 6] if aggregate == 'first' else [6, 6])
+
+
+def test_observation_mask_list():
+    r"""Test finding observations to keep with lists as input."""
+    keep = observation_mask([1, 2, 1, 3], [1, 2, 1, 3], [5, 6, 7, float('nan')])
+
+    assert_array_almost_equal(keep, [True, True, False, False])
+
+
+def test_remove_repeat_coordinates_units():
+    r"""Test remove repeat coordinates function keeps the units of the observations."""
+    _, _, z_ = remove_repeat_coordinates([1, 2, 1], [1, 2, 1], [5, 6, 7] * units.degC)
+
+    assert z_.units == units.degC
+    assert_array_almost_equal(z_.magnitude, [5, 6])
+
+
+def test_remove_repeat_coordinates_bad_aggregate(test_coords):
+    r"""Test remove repeat coordinates function with an unknown aggregation."""
+    x, y = test_coords
+    with pytest.raises(ValueError, match='Unknown option for aggregate'):
+        remove_repeat_coordinates(x, y, np.ones_like(x), aggregate='median')
+
+
+def test_observation_mask(test_coords):
+    r"""Test finding observations to keep matches removing them in turn."""
+    x, y = test_coords
+    x[[3, 9]] = x[0]
+    y[[3, 9]] = y[0]
+
+    z = np.array([np.nan, 1, -1, 2, 3, np.nan, 4, 5, 6, 7])
+
+    keep = observation_mask(x, y, z, val=0)
+    assert_array_almost_equal(keep, [False, True, False, True, True, False, True, True, True,
+                                     False])
+
+    truth = remove_repeat_coordinates(*remove_observations_below_value(
+        *remove_nan_observations(x, y, z), val=0))
+    for truth_value, value in zip(truth, (x, y, z)):
+        assert_array_almost_equal(truth_value, value[keep])
+
+
+def test_observation_mask_keep_repeats(test_coords):
+    r"""Test finding observations to keep without removing repeated coordinates."""
+    x, y = test_coords
+    x[1] = x[0]
+    y[1] = y[0]
+    keep = observation_mask(x, y, np.arange(10.))
+    assert keep.sum() == 9
+    assert observation_mask(x, y, np.arange(10.), remove_repeats=False).all()
+
+
 def test_barnes_weights():
     r"""Test Barnes weights function."""
     kappa = 1000000
@@ -7,8 +7,9 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from metpy.interpolate import interpolate_1d, interpolate_nans_1d, log_interpolate_1d
-from metpy.testing import assert_array_almost_equal
+from metpy.interpolate import (interpolate_1d, interpolate_nans_1d, InterpolationPlan,
+                               log_interpolate_1d)
+from metpy.testing import assert_array_almost_equal, assert_array_equal
 from metpy.units import units
 
 
@@ -203,3 +204,45 @@ def test_interpolate_broadcast():
     t_level = interpolate_1d(units.Quantity(700, 'hPa'), p[:, None, None], t)
     assert_array_almost_equal(t_level,
                               units.Quantity(np.arange(20., 40.).reshape(1, 4, 5), 'degC'), 7)
+
+
+@pytest.mark.filterwarnings('ignore:Interpolation point out of data bounds')
+@pytest.mark.parametrize('kind, func', [('linear', interpolate_1d),
+                                        ('log', log_interpolate_1d)])
+def test_interpolation_plan(kind, func):
+    """Test that an interpolation plan matches interpolating each time."""
+    rng = np.random.default_rng(20240226)
+    p = units.Quantity(np.sort(rng.uniform(100, 1000, (3, 10, 4)), axis=1)[:, ::-1], 'hPa')
+    t = units.Quantity(rng.normal(0, 10, (3, 10, 4)), 'degC')
+    rh = rng.uniform(0, 100, (3, 10, 4))
+    levels = units.Quantity([85000., 50000., 120000., 30000.], 'Pa')
+
+    plan = InterpolationPlan(levels, p, axis=1, kind=kind)
+    for interp, truth in zip(plan.interpolate(t, rh), func(levels, p, t, rh, axis=1)):
+        assert_array_equal(interp, truth)
+
+
+def test_interpolation_plan_broadcast():
+    """Test an interpolation plan for variables with more dimensions than the coordinate."""
+    p = units.Quantity([850, 700, 500], 'hPa')
+    t = units.Quantity(np.arange(60).reshape(3, 4, 5), 'degC')
+    plan = InterpolationPlan(units.Quantity([700, 600], 'hPa'), p[:, None, None])
+    t_levels, = plan.interpolate(t)
+    assert_array_almost_equal(t_levels[0], units.Quantity(np.arange(20., 40.).reshape(4, 5),
+                                                          'degC'), 7)
+    assert_array_almost_equal(t_levels[1], units.Quantity(np.arange(30., 50.).reshape(4, 5),
+                                                          'degC'), 7)
+
+
+def test_interpolation_plan_last_axis():
+    """Test an interpolation plan along the last axis, given with a negative number."""
+    x = np.array([[1., 2., 3., 4.], [4., 3., 2., 1.]])
+    plan = InterpolationPlan(np.array([3.5, 1.5]), x, axis=-1)
+    interp, = plan.interpolate(2 * x)
+    assert_array_almost_equal(interp, np.array([[7., 3.], [7., 3.]]), 7)
+
+
+def test_interpolation_plan_invalid_kind():
+    """Test that an unknown kind of interpolation raises an error."""
+    with pytest.raises(ValueError, match='Unknown option for kind'):
+        InterpolationPlan(np.array([1.5]), np.array([1., 2.]), kind='cubic')
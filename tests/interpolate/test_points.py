@@ -4,15 +4,19 @@
 """Test the `points` module."""
 
 
+import contextlib
 import logging
 
 import numpy as np
 import pytest
+from scipy.interpolate import RBFInterpolator
 from scipy.spatial import cKDTree, Delaunay
 
 from metpy.cbook import get_test_data
-from metpy.interpolate import (interpolate_to_points, inverse_distance_to_points,
-                               natural_neighbor_to_points)
+from metpy.interpolate import (barnes_to_points, interpolate_to_points, Interpolator,
+                               inverse_distance_to_isobaric_points,
+                               inverse_distance_to_points, natural_neighbor_to_points,
+                               rbf_to_points)
 from metpy.interpolate.geometry import dist_2, find_natural_neighbors
 from metpy.interpolate.points import barnes_point, cressman_point, natural_neighbor_point
 from metpy.testing import assert_almost_equal, assert_array_almost_equal
@@ -109,6 +113,27 @@ def test_natural_neighbor_to_points(test_data, test_points):
     assert_array_almost_equal(truth, img)
 
 
+def test_natural_neighbor_to_points_per_point():
+    r"""Test natural neighbor interpolation to points matches interpolating point by point."""
+    rng = np.random.default_rng(43)
+    xp, yp = rng.uniform(0, 100, (2, 100))
+    z = rng.normal(size=100)
+    test_points = np.concatenate([rng.uniform(-10, 110, (300, 2)),
+                                  np.stack([xp[:5], yp[:5]], axis=1)])
+
+    tri = Delaunay(np.stack([xp, yp], axis=1))
+    members, circumcenters = find_natural_neighbors(tri, test_points)
+    truth = np.full(len(test_points), np.nan)
+    for i, neighbors in members.items():
+        if len(neighbors) > 0:
+            with contextlib.suppress(ZeroDivisionError):
+                truth[i] = natural_neighbor_point(xp, yp, z, test_points[i], tri, neighbors,
+                                                  circumcenters)
+
+    img = natural_neighbor_to_points(np.stack([xp, yp], axis=1), z, test_points)
+    assert_array_almost_equal(truth, img)
+
+
 def test_inverse_distance_to_points_invalid(test_data, test_points):
     """Test that inverse_distance_to_points raises when given an invalid method."""
     xp, yp, z = test_data
@@ -138,6 +163,138 @@ def test_inverse_distance_to_points(method, assume_units, test_data, test_points
     assert_array_almost_equal(truth, img)
 
 
+@pytest.mark.parametrize('min_neighbors', [0, 3, 6])
+@pytest.mark.parametrize('method', ['cressman', 'barnes'])
+def test_inverse_distance_to_points_per_point(method, min_neighbors):
+    r"""Test inverse distance interpolation to points matches interpolating point by point."""
+    rng = np.random.default_rng(20)
+    obs_points = rng.uniform(0, 100, (200, 2))
+    z = rng.normal(size=200)
+    test_points = rng.uniform(-10, 110, (300, 2))
+    r = 12
+
+    interp_func = {'cressman': lambda d, v: cressman_point(d, v, r),
+                   'barnes': lambda d, v: barnes_point(d, v, 30)}[method]
+    truth = np.full(len(test_points), np.nan)
+    for i, (x, y) in enumerate(test_points):
+        matches = cKDTree(obs_points).query_ball_point((x, y), r=r)
+        if len(matches) >= min_neighbors:
+            truth[i] = interp_func(dist_2(x, y, *obs_points[matches].T), z[matches])
+
+    img = inverse_distance_to_points(obs_points, z, test_points, r=r, kappa=30, kind=method,
+                                     min_neighbors=min_neighbors)
+    assert_array_almost_equal(truth, img)
+
+
+@pytest.mark.parametrize('passes', [1, 2, 3])
+def test_barnes_to_points(passes, test_data, test_points):
+    r"""Test multi-pass Barnes analysis against correcting residuals point by point."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    r, kappa, gamma = 40, 100, 0.3
+
+    def analyze(points, values, kappa, min_neighbors):
+        ret = np.full(len(points), np.nan)
+        for i, (x, y) in enumerate(points):
+            matches = cKDTree(obs_points).query_ball_point((x, y), r=r)
+            if len(matches) >= min_neighbors:
+                ret[i] = barnes_point(dist_2(x, y, xp[matches], yp[matches]),
+                                      values[matches], kappa)
+        return ret
+
+    truth = analyze(test_points, z, kappa, 3)
+    obs_analysis = analyze(obs_points, z, kappa, 1)
+    for _ in range(passes - 1):
+        truth += analyze(test_points, z - obs_analysis, gamma * kappa, 3)
+        obs_analysis += analyze(obs_points, z - obs_analysis, gamma * kappa, 1)
+
+    img = barnes_to_points(obs_points, units.Quantity(z, 'degC'), test_points, r, kappa,
+                           gamma=gamma, passes=passes)
+    assert_array_almost_equal(units.Quantity(truth, 'degC'), img)
+
+
+@pytest.mark.parametrize('passes', [0, -1])
+def test_barnes_to_points_no_passes(passes, test_data, test_points):
+    r"""Test that Barnes analysis without any passes raises an error."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+
+    with pytest.raises(ValueError, match='At least one pass'):
+        barnes_to_points(obs_points, z, test_points, 40, 100, passes=passes)
+
+
+@pytest.mark.parametrize('method', ['cressman', 'barnes'])
+def test_inverse_distance_to_isobaric_points(method, test_data, test_points):
+    r"""Test 3D inverse distance interpolation against scaling the log of pressure."""
+    xp, yp, z = test_data
+    pressure = np.array([900, 850, 300, 500, 480, 700, 250, 520, 850, 500])
+    levels = np.array([850, 500, 300])
+    r, vertical_radius, kappa = 40, 0.5, 100
+
+    obs = np.column_stack([xp, yp, r / vertical_radius * np.log(pressure)])
+    truth = np.full((len(levels), len(test_points)), np.nan)
+    for i, level in enumerate(levels):
+        for j, (x, y) in enumerate(test_points):
+            point = [x, y, r / vertical_radius * np.log(level)]
+            sq_dist = np.sum((obs - point) ** 2, axis=1)
+            near = sq_dist <= r ** 2
+            if near.sum() >= 3 and method == 'cressman':
+                truth[i, j] = cressman_point(sq_dist[near], z[near], r)
+            elif near.sum() >= 3:
+                truth[i, j] = barnes_point(sq_dist[near], z[near], kappa)
+
+    values = np.column_stack([z, np.where(np.arange(len(z)) % 4, z, np.nan)])
+    img = inverse_distance_to_isobaric_points(np.column_stack([xp, yp]), pressure,
+                                              units.Quantity(values, 'degC'), test_points,
+                                              levels, r, vertical_radius, kappa=kappa,
+                                              kind=method, workers=2)
+    assert_array_almost_equal(units.Quantity(truth, 'degC'), img[..., 0])
+
+    # Missing values are left out of the weights
+    assert np.all(np.isnan(img[..., 0]) <= np.isnan(img[..., 1]))
+    assert np.any(~np.isnan(img[..., 1]) & (img[..., 0] != img[..., 1]))
+
+
+@pytest.mark.parametrize('neighbors', [None, 6])
+@pytest.mark.parametrize('kernel', ['linear', 'thin_plate', 'quintic', 'gaussian'])
+def test_rbf_to_points(kernel, neighbors, test_data, test_points):
+    r"""Test radial basis function interpolation in tiles against RBFInterpolator."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    values = np.column_stack([z, -z])
+
+    rbfi = RBFInterpolator(obs_points, values, neighbors=neighbors, epsilon=0.05,
+                           kernel={'thin_plate': 'thin_plate_spline'}.get(kernel, kernel))
+    img = rbf_to_points(obs_points, units.Quantity(values, 'degC'), test_points,
+                        kernel=kernel, neighbors=neighbors, epsilon=0.05, tile_size=2,
+                        workers=2)
+    assert_array_almost_equal(units.Quantity(rbfi(test_points), 'degC'), img)
+
+
+def test_rbf_to_points_invalid(test_data, test_points):
+    """Test that rbf_to_points raises for bad kernels or too few neighbors."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+
+    with pytest.raises(ValueError):
+        rbf_to_points(obs_points, z, test_points, kernel='shouldraise')
+
+    with pytest.raises(ValueError):
+        rbf_to_points(obs_points, z, test_points, kernel='quintic', neighbors=5)
+
+
+def test_interpolate_to_points_rbf_neighbors(test_data, test_points):
+    """Test that interpolate_to_points uses local rbf interpolation with rbf_neighbors."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    z = units.Quantity(z, 'mbar')
+
+    img = interpolate_to_points(obs_points, z, test_points, interp_type='rbf',
+                                rbf_func='thin_plate', rbf_neighbors=8)
+    truth = rbf_to_points(obs_points, z, test_points, kernel='thin_plate', neighbors=8)
+    assert_array_almost_equal(truth, img)
+
+
 def test_interpolate_to_points_invalid(test_data):
     """Test that interpolate_to_points raises when given an invalid method."""
     xp, yp, z = test_data
@@ -177,3 +334,70 @@ def test_interpolate_to_points(method, assume_units, test_data):
 
     img = interpolate_to_points(obs_points, z, test_points, interp_type=method, **extra_kw)
     assert_array_almost_equal(truth, img)
+
+
+@pytest.mark.parametrize('method', ['natural_neighbor', 'cressman', 'barnes', 'linear',
+                                    'nearest', 'rbf'])
+def test_interpolator(method, test_data):
+    r"""Test that the reusable interpolator matches interpolate_to_points for many fields."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose() * 10
+    values = units.Quantity(np.stack([z, -2 * z, z ** 2], axis=1), 'degC')
+
+    with get_test_data('interpolation_test_points.npz') as fobj:
+        test_points = np.load(fobj)['points']
+
+    if method == 'cressman':
+        extra_kw = {'search_radius': 200, 'minimum_neighbors': 1}
+    elif method == 'barnes':
+        extra_kw = {'search_radius': 400, 'minimum_neighbors': 1, 'gamma': 1}
+    else:
+        extra_kw = {}
+
+    truth = np.stack([interpolate_to_points(obs_points, values[:, i], test_points,
+                                            interp_type=method, **extra_kw).m
+                      for i in range(3)], axis=1)
+
+    interp = Interpolator(obs_points, test_points, interp_type=method, **extra_kw)
+    img = interp.interpolate(values)[0]
+    assert_array_almost_equal(units.Quantity(truth, 'degC'), img)
+    assert_array_almost_equal(truth.T, interp.interpolate(values.m.T, axis=-1)[0])
+
+
+def test_interpolator_missing(test_data):
+    r"""Test that the reusable interpolator masks only points depending on missing data."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    test_points = np.array([[10., 30.], [60., 20.], [55., 80.]])
+    interp = Interpolator(obs_points, test_points, interp_type='cressman', search_radius=20,
+                          minimum_neighbors=1)
+
+    z_missing = np.ma.array(z, mask=np.arange(10) == 0)
+    assert_array_almost_equal(interp.interpolate(z_missing)[0],
+                              np.array([np.nan, 3.364, 3.5545]), 4)
+
+    z_missing = z.copy()
+    z_missing[4] = np.nan
+    assert_array_almost_equal(interp.interpolate(z_missing)[0],
+                              np.array([0.064, 3.364, np.nan]), 4)
+
+
+@pytest.mark.parametrize('method', ['linear', 'rbf'])
+def test_interpolator_save(method, test_data, tmp_path):
+    r"""Test saving and loading the weights of the reusable interpolator."""
+    xp, yp, z = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    test_points = np.array([[30., 40.], [60., 50.], [0., 0.]])
+    interp = Interpolator(obs_points, test_points, interp_type=method)
+
+    interp.save(tmp_path / 'weights.npz')
+    loaded = Interpolator.load(tmp_path / 'weights.npz')
+    assert_array_almost_equal(loaded.interpolate(z)[0], interp.interpolate(z)[0])
+
+
+def test_interpolator_invalid(test_data):
+    """Test that the reusable interpolator raises when given an invalid method."""
+    xp, yp, _ = test_data
+    obs_points = np.vstack([xp, yp]).transpose()
+    with pytest.raises(ValueError):
+        Interpolator(obs_points, obs_points, interp_type='cubic')
@@ -0,0 +1,105 @@
+# Copyright (c) 2024 MetPy Developers.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test the `radar` module."""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from metpy.calc import azimuth_range_to_lat_lon
+from metpy.interpolate import beam_height, RadarRegridder
+from metpy.testing import assert_array_almost_equal
+from metpy.units import units
+
+
+@pytest.fixture()
+def sweep():
+    """Return the geometry and a smooth field on the gates of a sweep."""
+    azimuths = (np.arange(360) + 90.5) % 360
+    ranges = 1000 + 500 * np.arange(200)
+
+    # Ground distance of each gate at an elevation of 0.5 degrees with a 4/3 earth
+    radius = 4 / 3 * 6371008.7714
+    elevation = np.deg2rad(0.5)
+    dist = radius * np.arctan(ranges * np.cos(elevation)
+                              / (radius + ranges * np.sin(elevation)))
+    x = dist * np.sin(np.deg2rad(azimuths))[:, None]
+    y = dist * np.cos(np.deg2rad(azimuths))[:, None]
+    return azimuths, ranges, dist, _field(x, y)
+
+
+def _field(x, y):
+    """Calculate a smooth field to sample."""
+    return np.sin(x / 20e3) + np.cos(y / 30e3)
+
+
+def test_beam_height():
+    """Test the height of the beam with a 4/3 earth radius."""
+    height = beam_height(units.Quantity([0, 100, 230], 'km'), 0.5, site_altitude=100)
+    assert_array_almost_equal(height, units.Quantity([100, 1561.13, 5219.27], 'm'), 2)
+
+
+@pytest.mark.parametrize('method, tolerance', [('nearest', 0.1), ('bilinear', 0.01),
+                                               ('cressman', 0.1)])
+def test_radar_regridder(method, tolerance, sweep):
+    """Test regridding a sweep onto a Cartesian grid."""
+    azimuths, ranges, _, data = sweep
+    x, y = np.meshgrid(np.linspace(-120e3, 120e3, 49), np.linspace(-120e3, 120e3, 41))
+
+    regridder = RadarRegridder(azimuths, ranges, 0.5, units.Quantity(x, 'm'),
+                               units.Quantity(y, 'm'), method=method, radius=2000)
+    img, = regridder.regrid(units.Quantity(data, 'dBZ'))
+
+    covered = (np.hypot(x, y) > 1000) & (np.hypot(x, y) < 99000)
+    assert img.units == units.dBZ
+    assert np.abs(img.m - _field(x, y))[covered].max() < tolerance
+    assert np.isnan(img.m[np.hypot(x, y) > 103000]).all()
+    assert regridder.heights.shape == x.shape
+
+
+def test_radar_regridder_missing(sweep):
+    """Test that missing gates are left out of regridding."""
+    azimuths, ranges, _, data = sweep
+    x, y = np.meshgrid(np.linspace(-50e3, 50e3, 21), np.linspace(-50e3, 50e3, 21))
+    data = np.ma.array(data, mask=np.zeros_like(data, dtype=bool))
+    data[:, 60:] = np.ma.masked
+    data[:, :20] = np.nan
+
+    img, = RadarRegridder(azimuths, ranges, 0.5, x, y, method='bilinear').regrid(data)
+
+    dist = np.hypot(x, y)
+    assert np.isnan(img[(dist > 31000) | (dist < 10000)]).all()
+    assert not np.isnan(img[(dist > 11000) & (dist < 29000)]).any()
+
+
+def test_radar_regridder_lat_lon(sweep):
+    """Test regridding onto longitudes and latitudes, with the gates as the points."""
+    azimuths, ranges, dist, data = sweep
+    lon, lat = azimuth_range_to_lat_lon(units.Quantity(azimuths, 'degrees'),
+                                        units.Quantity(dist, 'm'), -97.5, 35.2)
+
+    img, = RadarRegridder(azimuths, ranges, 0.5, lon, lat, center_lon=-97.5,
+                          center_lat=35.2).regrid(data)
+    assert_array_almost_equal(img, data)
+
+
+def test_radar_regridder_cached(sweep):
+    """Test that regridders are shared for the same geometry."""
+    azimuths, ranges, _, _ = sweep
+    x, y = np.meshgrid(np.linspace(-50e3, 50e3, 5), np.linspace(-50e3, 50e3, 5))
+
+    regridder = RadarRegridder.cached(azimuths, ranges, 0.5, x, y, method='bilinear')
+    assert RadarRegridder.cached(azimuths.copy(), ranges, 0.5, x, y,
+                                 method='bilinear') is regridder
+    assert RadarRegridder.cached(azimuths, ranges, 1.5, x, y,
+                                 method='bilinear') is not regridder
+    assert RadarRegridder.cached(xr.DataArray(azimuths), ranges, 0.5, x, y,
+                                 method='bilinear') is regridder
+
+
+def test_radar_regridder_invalid(sweep):
+    """Test that an unknown method raises an error."""
+    azimuths, ranges, _, _ = sweep
+    with pytest.raises(ValueError):
+        RadarRegridder(azimuths, ranges, 0.5, [0], [0], method='shouldraise')
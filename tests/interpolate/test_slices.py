@@ -7,7 +7,9 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from metpy.interpolate import cross_section, geodesic, interpolate_to_slice
+from metpy.calc import cross_section_components
+from metpy.interpolate import (cross_section, CrossSectionPlan, geodesic,
+                               interpolate_to_slice, SlicePlan)
 from metpy.testing import assert_array_almost_equal, needs_cartopy
 from metpy.units import units
 
@@ -115,6 +117,42 @@ def test_interpolate_to_slice_against_selection(test_ds_lonlat, bad_units):
     assert_array_almost_equal(true_slice.data, test_slice.data, 5)
 
 
+@pytest.mark.parametrize('interp_type', ['linear', 'nearest'])
+def test_interpolate_to_slice_against_interp(test_ds_lonlat, interp_type):
+    """Test interpolate_to_slice against xarray's interpolation, including outside the grid."""
+    data = test_ds_lonlat['temperature']
+    path = np.array([[256.1, 29.],
+                     [259.0, 33.2],
+                     [265.0, 36.],
+                     [274.3, 44.9],
+                     [276.0, 40.]])
+
+    truth = data.metpy.dequantify().interp(
+        lon=xr.DataArray(path[:, 0], dims='index'), lat=xr.DataArray(path[:, 1], dims='index'),
+        method=interp_type)
+    test_slice = interpolate_to_slice(data, path, interp_type=interp_type)
+
+    assert_array_almost_equal(truth.values, test_slice.data.m)
+    assert_array_almost_equal(test_slice['lon'].values, path[:, 0])
+    assert_array_almost_equal(test_slice['index'], np.arange(5))
+
+
+def test_slice_plan_dataset_dask(test_ds_lonlat):
+    """Test that a slice plan interpolates a Dataset with dask arrays lazily."""
+    path = np.array([[256.1, 31.],
+                     [265.0, 36.],
+                     [274.3, 44.9]])
+    plan = SlicePlan(path)
+    truth = plan(test_ds_lonlat)
+
+    lazy = plan(test_ds_lonlat.metpy.dequantify().chunk({'isobaric': 2}))
+    assert lazy['temperature'].chunks is not None
+    assert_array_almost_equal(truth['temperature'].data, lazy['temperature'].metpy.unit_array)
+    assert_array_almost_equal(truth['relative_humidity'].data.m,
+                              lazy['relative_humidity'].values)
+    assert truth['temperature'].data.units == units.kelvin
+
+
 @needs_cartopy
 def test_geodesic(test_ds_xy):
     """Test the geodesic construction."""
@@ -255,3 +293,66 @@ def test_cross_section_error_on_missing_coordinate(test_ds_lonlat):
 
     with pytest.raises(ValueError):
         cross_section(data_bad, start, end)
+
+
+@needs_cartopy
+@pytest.mark.parametrize('interp_type', ['linear', 'nearest'])
+def test_cross_section_plan_dataarray(test_ds_xy, interp_type):
+    """Test that a cross section plan matches cross_section for a DataArray."""
+    data = test_ds_xy['temperature']
+    start, end = ((36.46, -112.45), (42.95, -68.74))
+    plan = CrossSectionPlan.from_data(data, start, end, steps=7, interp_type=interp_type)
+    truth = cross_section(data, start, end, steps=7, interp_type=interp_type)
+
+    xr.testing.assert_allclose(plan(data), truth)
+    xr.testing.assert_allclose(plan(data * 2), truth * 2)
+    xr.testing.assert_identical(plan(test_ds_xy['lambert_conformal']),
+                                test_ds_xy['lambert_conformal'])
+
+
+@needs_cartopy
+@pytest.mark.parametrize('interp_type', ['linear', 'nearest'])
+def test_cross_section_plan_dataset(test_ds_lonlat, interp_type):
+    """Test that a cross section plan matches cross_section for a Dataset."""
+    start, end = (30.5, 255.5), (44.5, 274.5)
+    plan = CrossSectionPlan.from_data(test_ds_lonlat, start, end, steps=7,
+                                      interp_type=interp_type)
+    truth = cross_section(test_ds_lonlat, start, end, steps=7, interp_type=interp_type)
+    xr.testing.assert_allclose(plan(test_ds_lonlat), truth)
+
+    # Reversed latitude and longitude from -180 to 180
+    flipped = test_ds_lonlat.isel(lat=slice(None, None, -1))
+    flipped = flipped.assign_coords(lon=flipped['lon'] - 360)
+    xr.testing.assert_allclose(plan(flipped).drop_vars('lon'), truth.drop_vars('lon'))
+
+
+@needs_cartopy
+def test_cross_section_plan_outside_grid(test_ds_lonlat):
+    """Test that points of a cross section plan outside of the grid are NaN."""
+    plan = CrossSectionPlan.from_data(test_ds_lonlat, (25, 255.5), (40, 255.5), steps=4)
+    cross = plan(test_ds_lonlat['temperature']).data.m
+    assert np.isnan(cross[:, 0]).all()
+    assert not np.isnan(cross[:, 1:]).any()
+
+
+@needs_cartopy
+def test_cross_section_plan_geometry(test_ds_lonlat):
+    """Test the components from a cross section plan against cross_section_components."""
+    start, end = (30.5, 255.5), (44.5, 274.5)
+    plan = CrossSectionPlan.from_data(test_ds_lonlat, start, end, steps=7)
+    cross = plan(test_ds_lonlat)['temperature']
+    truth_tang, truth_norm = cross_section_components(cross, 2 * cross)
+    tang, norm = plan.components(cross, 2 * cross)
+    xr.testing.assert_allclose(tang, truth_tang)
+    xr.testing.assert_allclose(norm, truth_norm)
+
+    x, y = plan.distances
+    length = plan.crs.get_geod().inv(start[1], start[0], end[1], end[0])[-1]
+    assert_array_almost_equal(np.hypot(x, y)[[0, -1]], [0, length] * units.m, 3)
+
+
+def test_cross_section_plan_bad_interp_type(test_ds_lonlat):
+    """Test that an unknown interpolation method raises an error."""
+    with pytest.raises(ValueError, match='Unknown interpolation'):
+        CrossSectionPlan.from_data(test_ds_lonlat['temperature'], (30.5, 255.5),
+                                   (44.5, 274.5), interp_type='cubic')
@@ -3,7 +3,11 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Test functionality of MetPy's utility code."""
 
-from metpy.cbook import example_data, Registry
+import numpy as np
+import xarray as xr
+
+from metpy.cbook import example_data, lru_cache_by_value, Registry
+from metpy.units import units
 
 
 def test_registry():
@@ -22,3 +26,36 @@ def test_example_data():
     var_names = list(ds.variables)
 
     assert 'temperature' in var_names
+
+
+def test_lru_cache_by_value():
+    """Test that cached results are found by the values of array arguments."""
+    calls = []
+
+    @lru_cache_by_value(maxsize=2)
+    def func(a, b=1):
+        calls.append(a)
+        return np.sum(a) * b
+
+    assert func(np.arange(3)) == 3
+    assert func(np.arange(3)) == 3
+    assert func(np.arange(3) * units.m) == 3 * units.m
+    assert func(np.arange(3) * units.km, b=2) == 6 * units.km
+    assert len(calls) == 3
+
+
+def test_lru_cache_by_value_dataarray():
+    """Test that DataArray arguments are cached by their data and units."""
+    calls = []
+
+    @lru_cache_by_value()
+    def func(a):
+        calls.append(a)
+        return np.sum(a)
+
+    assert func(xr.DataArray(np.arange(3), attrs={'units': 'm'})) == 3 * units.m
+    assert func(xr.DataArray(np.arange(3), attrs={'units': 'm'}, dims=['x'],
+                             coords={'x': [4, 5, 6]})) == 3 * units.m
+    assert func(xr.DataArray(np.arange(3) * units.m)) == 3 * units.m
+    assert func(xr.DataArray(np.arange(3))) == 3
+    assert len(calls) == 2